@@ -0,0 +1,150 @@
+""" Opt-in on-disk store of puzzle answers, keyed by input and solver hashes
+
+Storing answers is enabled by setting the AOC_ANSWER_CACHE environment
+variable to a store directory. Each answer is a small JSON file keyed by the
+day, the part, a SHA-256 hash of the input bytes, and a hash of the source
+of the solution module and of every module in this repo that it imports (see
+common/parse_cache.py), so editing the solver invalidates its answers
+automatically. Reading an answer marks it as recently used, and whenever the
+store grows beyond AOC_ANSWER_CACHE_MAX_BYTES (16 MiB by default), the least
+recently used answers are evicted.
+"""
+
+# import modules used below.
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+
+# import local modules used below.
+from common.inputs import read_input
+from common.parse_cache import local_source_files, parser_version
+
+
+CACHE_DIR_ENV = 'AOC_ANSWER_CACHE'
+MAX_BYTES_ENV = 'AOC_ANSWER_CACHE_MAX_BYTES'
+DEFAULT_MAX_BYTES = 16 * 2**20
+
+
+def input_hash(text_or_path):
+    """ Return hash of input given as text or as a file path """
+    if isinstance(text_or_path, os.PathLike):
+        data = Path(text_or_path).read_bytes()
+    else:
+        data = read_input(text_or_path).encode()
+    return hashlib.sha256(data).hexdigest()
+
+def solver_version(module_name):
+    """ Return hash of the source of a solution module and of the modules
+    in this repo that it imports """
+    version_hash = hashlib.sha256()
+    for source_file in local_source_files(module_name):
+        version_hash.update(parser_version(source_file).encode())
+    return version_hash.hexdigest()
+
+def normalize_answer(answer):
+    """ Return answer as it would be read back from the store, e.g., with
+    tuples as lists, raising TypeError if it cannot be stored """
+    return json.loads(json.dumps(answer))
+
+# Create data model for on-disk answer store.
+class AnswerCache:
+    """ Data Model for directory of answer files with LRU eviction """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = dict.fromkeys(
+            ('hits', 'misses', 'stores', 'evictions', 'verified',
+             'mismatches'),
+            0,
+        )
+
+    @classmethod
+    def from_environment(cls):
+        """ Return answer store configured by environment variables, or None
+        if storing answers is disabled """
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+        if not cache_dir:
+            return None
+        return cls(
+            cache_dir, int(os.environ.get(MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+        )
+
+    def entry_path(self, day, part, input_digest, version):
+        """ Return path of answer file for specified key """
+        key_hash = hashlib.sha256(
+            f'{day}:{part}:{input_digest}:{version}'.encode()
+        ).hexdigest()
+        return self.cache_dir / f'day{int(day):02d}-{part}-{key_hash}.json'
+
+    def get(self, day, part, input_digest, version):
+        """ Return (True, answer) for stored answer, marking it as recently
+        used, or (False, None) if none is stored """
+        entry_path = self.entry_path(day, part, input_digest, version)
+        try:
+            with open(entry_path) as fp:
+                answer = json.load(fp)['answer']
+            os.utime(entry_path)
+        except (OSError, ValueError, KeyError):
+            self.stats['misses'] += 1
+            return False, None
+        self.stats['hits'] += 1
+        return True, answer
+
+    def put(self, day, part, input_digest, version, answer):
+        """ Store answer, evicting least recently used answers if the store
+        then exceeds its size cap; answers that are not JSON-serializable
+        are skipped """
+        try:
+            entry = json.dumps({
+                'day': day,
+                'part': part,
+                'input_hash': input_digest,
+                'version': version,
+                'answer': answer,
+            })
+        except TypeError:
+            return
+        entry_path = self.entry_path(day, part, input_digest, version)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', dir=self.cache_dir, suffix='.tmp', delete=False
+        ) as fp:
+            fp.write(entry)
+        os.replace(fp.name, entry_path)
+        self.stats['stores'] += 1
+        self.evict()
+
+    def verify(self, day, part, input_digest, version, answer, expected):
+        """ Return whether recomputed answer matches stored answer expected,
+        storing the recomputed answer either way """
+        try:
+            matches = normalize_answer(answer) == expected
+        except TypeError:
+            matches = False
+        self.stats['verified' if matches else 'mismatches'] += 1
+        self.put(day, part, input_digest, version, answer)
+        return matches
+
+    def evict(self):
+        """ Remove least recently used answers until the store's total size
+        is within its cap """
+        entries = []
+        total_bytes = 0
+        for entry_path in self.cache_dir.glob('*.json'):
+            try:
+                entry_stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append(
+                (entry_stat.st_mtime, entry_stat.st_size, entry_path)
+            )
+            total_bytes += entry_stat.st_size
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= size
+            self.stats['evictions'] += 1
@@ -0,0 +1,178 @@
+""" Cellular automata with pluggable neighborhoods and birth/survival rules
+
+A generation counts the live neighbors of every relevant cell in a single
+pass, and then applies a birth/survival rule to the counts. Live cells are
+either a set of coordinate tuples (SparseAutomaton, for unbounded spaces such
+as the Day 17 pocket dimension or the Day 24 hexagonal floor), or a boolean
+array (DenseAutomaton, for bounded grids such as the Day 11 seat map).
+"""
+
+# import modules used below.
+from collections import Counter
+from dataclasses import dataclass
+from hashlib import blake2b
+from itertools import product
+
+# import third-party modules used below.
+import numpy as np
+
+
+# Offsets of the six neighbors of a hexagonal tile in axial coordinates.
+HEX_AXIAL_OFFSETS = ((0, 1), (1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1))
+
+
+def moore_offsets(dimensions):
+    """ Return offsets of all cells adjacent to a cell, including diagonally,
+    in specified number of dimensions """
+    return tuple(
+        offset
+        for offset in product((-1, 0, 1), repeat=dimensions)
+        if any(offset)
+    )
+
+def moore_neighbor_counts(live):
+    """ Return counts of adjacent live cells (including diagonally) for each
+    cell in N-dimensional boolean array, as a convolution computed by
+    summing shifted slices of the zero-padded array """
+    padded = np.pad(live, 1).astype(np.uint8)
+    counts = np.zeros(live.shape, dtype=np.uint8)
+    for offset in moore_offsets(live.ndim):
+        counts += padded[
+            tuple(
+                slice(1 + step, 1 + step + length)
+                for step, length in zip(offset, live.shape)
+            )
+        ]
+    return counts
+
+def listed_neighbor_counts(neighbor_index):
+    """ Return function counting live neighbors of each cell, given array
+    whose first axis lists flat indices of each cell's neighbors, with -1
+    marking no neighbor (e.g., as returned by Grid.visible_cells) """
+    has_neighbor = neighbor_index >= 0
+    neighbor_index = np.where(has_neighbor, neighbor_index, 0)
+
+    def count_neighbors(live):
+        return (live.ravel()[neighbor_index] & has_neighbor).sum(axis=0)
+
+    return count_neighbors
+
+# Create data model for birth/survival rules.
+@dataclass(frozen=True)
+class LifeRule:
+    """ Data Model for rule making a dead cell live when its number of live
+    neighbors is in birth, and keeping a live cell live when its number of
+    live neighbors is in survival """
+    birth: frozenset
+    survival: frozenset
+
+    def __post_init__(self):
+        object.__setattr__(self, 'birth', frozenset(self.birth))
+        object.__setattr__(self, 'survival', frozenset(self.survival))
+
+# Create data model for automata on sets of live cells.
+class SparseAutomaton:
+    """ Data Model for automaton whose live cells are coordinate tuples, with
+    neighbors given by offsets """
+
+    def __init__(self, offsets, rule):
+        if 0 in rule.birth:
+            raise ValueError(
+                'Sparse automata cannot give birth to cells without live '
+                'neighbors'
+            )
+        self.offsets = tuple(offsets)
+        self.rule = rule
+
+    def neighbor_counts(self, live):
+        """ Return counts of live neighbors of cells with any """
+        return Counter(
+            tuple(
+                coordinate + step for coordinate, step in zip(cell, offset)
+            )
+            for cell in live
+            for offset in self.offsets
+        )
+
+    def step(self, live):
+        """ Return live cells after one generation """
+        counts = self.neighbor_counts(live)
+        next_live = {
+            cell
+            for cell, count in counts.items()
+            if count in (
+                self.rule.survival if cell in live else self.rule.birth
+            )
+        }
+        if 0 in self.rule.survival:
+            next_live.update(cell for cell in live if cell not in counts)
+        return next_live
+
+    @staticmethod
+    def state_key(live):
+        """ Return hashable key identifying live cells """
+        return frozenset(live)
+
+    @staticmethod
+    def is_same(live, other_live):
+        """ Return whether two sets of live cells are equal """
+        return live == other_live
+
+# Create data model for automata on boolean arrays.
+class DenseAutomaton:
+    """ Data Model for automaton whose live cells are True in a boolean
+    array, with neighbors counted by a function of that array, and with
+    cells optionally restricted to those True in a mask """
+
+    def __init__(
+        self, rule, count_neighbors=moore_neighbor_counts, mask=None
+    ):
+        self.rule = rule
+        self.count_neighbors = count_neighbors
+        self.mask = mask
+        self.birth = np.array(sorted(rule.birth))
+        self.survival = np.array(sorted(rule.survival))
+
+    def step(self, live):
+        """ Return live cells after one generation """
+        counts = self.count_neighbors(live)
+        next_live = np.where(
+            live,
+            np.isin(counts, self.survival),
+            np.isin(counts, self.birth),
+        )
+        if self.mask is not None:
+            next_live &= self.mask
+        return next_live
+
+    @staticmethod
+    def state_key(live):
+        """ Return hashable key identifying live cells """
+        return blake2b(live.tobytes(), digest_size=16).digest()
+
+    @staticmethod
+    def is_same(live, other_live):
+        """ Return whether two sets of live cells are equal """
+        return np.array_equal(live, other_live)
+
+def evolve(automaton, live, generations=None):
+    """ Return live cells after specified number of generations (or, by
+    default, once they stop changing) and the number of generations run,
+    which for a fixed point includes the final, unchanging generation;
+    raises ValueError if the live cells oscillate without settling """
+    seen_states = set()
+    generation_count = 0
+    while generations is None or generation_count < generations:
+        next_live = automaton.step(live)
+        generation_count += 1
+        if generations is None:
+            if automaton.is_same(next_live, live):
+                break
+            seen_states.add(automaton.state_key(live))
+            if automaton.state_key(next_live) in seen_states:
+                raise ValueError(
+                    f'Automaton oscillates without reaching a fixed point '
+                    f'after {generation_count} generations'
+                )
+        live = next_live
+    return live, generation_count
@@ -0,0 +1,71 @@
+""" Fixed-width bitsets stored as plain Python ints
+
+Bit i of a bitset is set when the bitset contains i. Storing sets of small
+integers (or of characters, via their positions in an alphabet) as ints
+makes unions, intersections, and comparisons single arithmetic operations,
+without allocating an object per member. Strings such as '10X1' or '#..#'
+convert to and from bitsets in one call, reading the first character as the
+most significant bit, as in binary literals.
+"""
+
+# import modules used below.
+from functools import lru_cache, reduce
+from operator import or_
+from string import ascii_lowercase
+
+
+# Return number of set bits, natively where int.bit_count is available
+# (Python 3.10+).
+popcount = getattr(int, 'bit_count', lambda bits: bin(bits).count('1'))
+
+
+def iter_bits(bits):
+    """ Yield positions of set bits, from least to most significant """
+    while bits:
+        lowest_bit = bits & -bits
+        yield lowest_bit.bit_length() - 1
+        bits ^= lowest_bit
+
+def iter_subsets(bits):
+    """ Yield every subset of set bits (including bits itself and 0), in
+    decreasing order """
+    subset = bits
+    while True:
+        yield subset
+        if not subset:
+            return
+        subset = (subset - 1) & bits
+
+@lru_cache(maxsize=None)
+def binary_translation(ones, zeros):
+    """ Return str/bytes translation table mapping characters in ones to '1'
+    and characters in zeros to '0' """
+    if isinstance(ones, bytes):
+        return bytes.maketrans(
+            ones + zeros, b'1' * len(ones) + b'0' * len(zeros)
+        )
+    return str.maketrans(ones + zeros, '1' * len(ones) + '0' * len(zeros))
+
+def from_string(text, ones='1', zeros='0'):
+    """ Return bitset with bits set where str or bytes text has characters
+    in ones (first character most significant), given that every other
+    character is in zeros; raises ValueError otherwise """
+    return int(text.translate(binary_translation(ones, zeros)) or '0', 2)
+
+def to_string(bits, width, one='1', zero='0'):
+    """ Return bitset as string of width characters, with one for set bits
+    and zero for unset bits (first character most significant) """
+    return f'{bits:0{width}b}'.translate(str.maketrans('10', one + zero))
+
+@lru_cache(maxsize=None)
+def alphabet_bits(alphabet):
+    """ Return mapping of each character in alphabet to its bit """
+    return {char: 1 << position for position, char in enumerate(alphabet)}
+
+def from_chars(chars, alphabet=ascii_lowercase):
+    """ Return bitset of positions in alphabet of characters in chars """
+    return reduce(or_, map(alphabet_bits(alphabet).__getitem__, chars), 0)
+
+def to_chars(bits, alphabet=ascii_lowercase):
+    """ Return characters in alphabet at positions of set bits """
+    return ''.join(alphabet[position] for position in iter_bits(bits))
@@ -0,0 +1,99 @@
+""" Binary columnar storage for puzzle inputs of one integer per line
+
+A column file consists of a 16-byte header (an 8-byte magic string, which
+includes a format version, followed by the number of values as a
+little-endian unsigned 64-bit integer), and then the values themselves as
+little-endian signed 64-bit integers. Column files are memory-mapped when
+read, so loading them costs no parsing and no copying.
+"""
+
+# import modules used below.
+from itertools import islice
+import os
+from pathlib import Path
+import struct
+
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from common.inputs import read_input
+
+
+COLUMN_MAGIC = b'AOCI64\x00\x01'
+COLUMN_HEADER = struct.Struct('<8sQ')
+COLUMN_DTYPE = np.dtype('<i8')
+
+
+def is_int_column(file_path):
+    """ Return whether specified file is a column file """
+    with open(file_path, 'rb') as fp:
+        return fp.read(len(COLUMN_MAGIC)) == COLUMN_MAGIC
+
+def load_int_column(file_path):
+    """ Return values in specified column file as a read-only int64 array
+    backed by a memory map of the file """
+    with open(file_path, 'rb') as fp:
+        magic, length = COLUMN_HEADER.unpack(fp.read(COLUMN_HEADER.size))
+    if magic != COLUMN_MAGIC:
+        raise ValueError(f'{file_path} is not an int64 column file')
+    if length == 0:
+        return np.zeros(0, dtype=COLUMN_DTYPE)
+    return np.memmap(
+        file_path,
+        dtype=COLUMN_DTYPE,
+        mode='r',
+        offset=COLUMN_HEADER.size,
+        shape=(length,),
+    ).view(np.ndarray)
+
+def write_int_column(values, file_path):
+    """ Write integer values to specified column file """
+    values = np.asarray(values, dtype=COLUMN_DTYPE)
+    with open(file_path, 'wb') as fp:
+        fp.write(COLUMN_HEADER.pack(COLUMN_MAGIC, len(values)))
+        fp.write(values.tobytes())
+
+def parse_int_lines(text):
+    """ Return int64 array of values given as text of one integer per line
+    (ignoring blank lines); raises ValueError on any other token, on values
+    out of int64 range, or on lines with more than one token """
+    tokens = text.split()
+    try:
+        values = np.array(tokens, dtype=COLUMN_DTYPE)
+    except OverflowError as error:
+        raise ValueError(f'Integer out of int64 range: {error}') from None
+    number_of_lines = sum(map(bool, map(str.strip, text.splitlines())))
+    if len(values) != number_of_lines:
+        raise ValueError(
+            f'Expected one integer per line, but found {len(values)} values '
+            f'on {number_of_lines} lines'
+        )
+    return values
+
+def convert_text_to_column(text_path, column_path, chunk_lines=2**20):
+    """ Convert text file of one integer per line to column file, reading
+    and writing the values in chunks of lines """
+    length = 0
+    with open(text_path) as text_fp, open(column_path, 'wb') as column_fp:
+        column_fp.write(COLUMN_HEADER.pack(COLUMN_MAGIC, 0))
+        while chunk := ''.join(islice(text_fp, chunk_lines)):
+            values = parse_int_lines(chunk)
+            column_fp.write(values.tobytes())
+            length += len(values)
+        column_fp.seek(0)
+        column_fp.write(COLUMN_HEADER.pack(COLUMN_MAGIC, length))
+    return length
+
+def read_int_values(text_or_path):
+    """ Return int64 array of values given as text of one integer per line,
+    as a path to such a text file, or as a path to a column file """
+    if isinstance(text_or_path, os.PathLike) and is_int_column(text_or_path):
+        return load_int_column(text_or_path)
+    return parse_int_lines(read_input(text_or_path))
+
+def column_path_for(text_path, output_dir=None):
+    """ Return path of column file converted from specified text file """
+    text_path = Path(text_path)
+    output_dir = text_path.parent if output_dir is None else Path(output_dir)
+    return output_dir / text_path.with_suffix('.i64').name
@@ -0,0 +1,231 @@
+""" Directed graphs with memoized traversals, and bipartite matching
+
+Digraph keeps both successor and predecessor indexes, so reachability in
+either direction is a single linear-time search, and reductions over a DAG
+(e.g., summing weighted paths) visit each node once, after its successors,
+instead of re-traversing shared subgraphs. Reductions for a single node
+visit only the nodes reachable from it. Elimination puzzles, in which
+each item must be assigned one of its candidates, are solved as maximum
+bipartite matchings with the Hopcroft-Karp algorithm.
+"""
+
+# import modules used below.
+from collections import deque
+
+
+# Create data model for weighted directed graphs.
+class Digraph:
+    """ Data Model for directed graph with weighted edges, indexed both by
+    source (successors) and by target (predecessors) """
+
+    def __init__(self):
+        self.successors = {}
+        self.predecessors = {}
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """ Return graph from mapping of each node to its successors, given
+        either as a mapping of successor to edge weight, or as an iterable
+        of successors (each with weight 1) """
+        graph = cls()
+        for node, successors in adjacency.items():
+            graph.add_node(node)
+            if not hasattr(successors, 'items'):
+                successors = dict.fromkeys(successors, 1)
+            for successor, weight in successors.items():
+                graph.add_edge(node, successor, weight)
+        return graph
+
+    def __len__(self):
+        return len(self.successors)
+
+    def __iter__(self):
+        return iter(self.successors)
+
+    def __contains__(self, node):
+        return node in self.successors
+
+    def add_node(self, node):
+        """ Add node without edges, if not already in graph """
+        self.successors.setdefault(node, {})
+        self.predecessors.setdefault(node, {})
+
+    def add_edge(self, source, target, weight=1):
+        """ Add edge from source to target, adding either if needed """
+        self.add_node(source)
+        self.add_node(target)
+        self.successors[source][target] = weight
+        self.predecessors[target][source] = weight
+
+    def reachable(self, node, reverse=False):
+        """ Return nodes reachable from node by following edges forward (or,
+        if reverse, backward), excluding node unless on a cycle """
+        index = self.predecessors if reverse else self.successors
+        reached = set()
+        pending = deque(index[node])
+        while pending:
+            current = pending.popleft()
+            if current not in reached:
+                reached.add(current)
+                pending.extend(index[current])
+        return reached
+
+    def topological_order(self):
+        """ Return nodes ordered so that every edge's source precedes its
+        target; raises ValueError if the graph has a cycle """
+        in_degrees = {
+            node: len(predecessors)
+            for node, predecessors in self.predecessors.items()
+        }
+        order = [
+            node for node, in_degree in in_degrees.items() if not in_degree
+        ]
+        for node in order:
+            for successor in self.successors[node]:
+                in_degrees[successor] -= 1
+                if not in_degrees[successor]:
+                    order.append(successor)
+        if len(order) < len(self):
+            raise ValueError(
+                'Graph has a cycle, so it has no topological order'
+            )
+        return order
+
+    def reduce(self, combine):
+        """ Return mapping of each node to combine(node, successor_values),
+        where successor_values maps each successor to its edge weight and
+        its own combined value, evaluating each node once, after all its
+        successors; raises ValueError if the graph has a cycle """
+        values = {}
+        for node in reversed(self.topological_order()):
+            values[node] = combine(
+                node,
+                {
+                    successor: (weight, values[successor])
+                    for successor, weight in self.successors[node].items()
+                },
+            )
+        return values
+
+    def reduce_from(self, node, combine):
+        """ Return combined value of node, as for reduce, but evaluating only
+        the nodes reachable from node, each once, with a depth-first search;
+        raises ValueError if a cycle is reachable from node """
+        values = {}
+        active = {node}
+        pending = [(node, iter(self.successors[node]))]
+        while pending:
+            current, successors = pending[-1]
+            for successor in successors:
+                if successor in active:
+                    raise ValueError(
+                        f'Graph has a cycle reachable from {node!r}'
+                    )
+                if successor not in values:
+                    active.add(successor)
+                    pending.append(
+                        (successor, iter(self.successors[successor]))
+                    )
+                    break
+            else:
+                pending.pop()
+                active.remove(current)
+                values[current] = combine(
+                    current,
+                    {
+                        successor: (weight, values[successor])
+                        for successor, weight
+                        in self.successors[current].items()
+                    },
+                )
+        return values[node]
+
+    def weighted_path_sums(self):
+        """ Return mapping of each node to the sum, over all paths starting
+        from it, of the product of edge weights along each path (e.g., the
+        total number of bags nested within a bag) """
+        return self.reduce(sum_weighted_paths)
+
+    def weighted_path_sum(self, node):
+        """ Return the sum, over all paths starting from node, of the product
+        of edge weights along each path, evaluating only the nodes reachable
+        from node """
+        return self.reduce_from(node, sum_weighted_paths)
+
+def sum_weighted_paths(node, successor_values):
+    """ Return sum of weighted paths from node, given the edge weight and
+    sum of weighted paths of each successor """
+    return sum(
+        weight * (1 + value) for weight, value in successor_values.values()
+    )
+
+def hopcroft_karp(candidates):
+    """ Return maximum matching between keys of candidates and the values in
+    their iterables of candidates, as a mapping of matched keys to values,
+    found with the Hopcroft-Karp algorithm """
+    candidates = {left: list(rights) for left, rights in candidates.items()}
+    left_match = dict.fromkeys(candidates)
+    right_match = {}
+    unmatched_distance = float('inf')
+
+    def find_layers():
+        """ Return whether an augmenting path exists, setting distances of
+        left nodes along shortest alternating paths from unmatched ones """
+        nonlocal unmatched_distance
+        pending = deque()
+        for left, right in left_match.items():
+            distances[left] = 0 if right is None else float('inf')
+            if right is None:
+                pending.append(left)
+        unmatched_distance = float('inf')
+        while pending:
+            left = pending.popleft()
+            if distances[left] >= unmatched_distance:
+                continue
+            for right in candidates[left]:
+                matched_left = right_match.get(right)
+                if matched_left is None:
+                    unmatched_distance = min(
+                        unmatched_distance, distances[left] + 1
+                    )
+                elif distances[matched_left] == float('inf'):
+                    distances[matched_left] = distances[left] + 1
+                    pending.append(matched_left)
+        return unmatched_distance != float('inf')
+
+    def augment(left):
+        """ Return whether an augmenting path from left was applied """
+        for right in candidates[left]:
+            matched_left = right_match.get(right)
+            if matched_left is None:
+                augmented = distances[left] + 1 == unmatched_distance
+            else:
+                augmented = (
+                    distances[matched_left] == distances[left] + 1 and
+                    augment(matched_left)
+                )
+            if augmented:
+                left_match[left] = right
+                right_match[right] = left
+                return True
+        distances[left] = float('inf')
+        return False
+
+    distances = {}
+    while find_layers():
+        for left, right in left_match.items():
+            if right is None:
+                augment(left)
+    return {
+        left: right for left, right in left_match.items() if right is not None
+    }
+
+def perfect_matching(candidates):
+    """ Return matching assigning every key of candidates one of its
+    candidates, with no candidate assigned twice; raises ValueError if no
+    such matching exists """
+    matching = hopcroft_karp(candidates)
+    if len(matching) < len(candidates):
+        unmatched = [left for left in candidates if left not in matching]
+        raise ValueError(f'No perfect matching exists; unmatched: {unmatched}')
+    return matching
@@ -0,0 +1,176 @@
+""" Compact 2D character grids backed by NumPy arrays """
+
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from common.automaton import moore_neighbor_counts
+
+
+# Offsets of the eight neighbors of a grid cell, as (row, column) steps.
+NEIGHBOR_DIRECTIONS = tuple(
+    (row_step, column_step)
+    for row_step in (-1, 0, 1)
+    for column_step in (-1, 0, 1)
+    if (row_step, column_step) != (0, 0)
+)
+
+
+# Find first visible cells along one direction, in O(cells) time, by carrying
+# each line's answers over to the line before it.
+def fill_first_visible(
+    first_visible, visible_mask, flat_index, line_step, cross_step
+):
+    """ Fill first_visible with flat index of first cell in visible_mask
+    stepping line_step lines (along the first axis) and cross_step cells
+    across from each cell, or -1 if none, sweeping lines from the far edge so
+    that each line reuses the answers of the line after it """
+    lines = visible_mask.shape[0]
+    if line_step > 0:
+        order = range(lines - 1 - line_step, -1, -1)
+    else:
+        order = range(-line_step, lines)
+    for line in order:
+        ahead_line = line + line_step
+        ahead = np.where(
+            visible_mask[ahead_line],
+            flat_index[ahead_line],
+            first_visible[ahead_line],
+        )
+        if cross_step > 0:
+            first_visible[line, :-cross_step] = ahead[cross_step:]
+        elif cross_step < 0:
+            first_visible[line, -cross_step:] = ahead[:cross_step]
+        else:
+            first_visible[line] = ahead
+
+# Create data model for grids of single-byte characters.
+class Grid:
+    """ Data Model for 2D grids of characters stored as a uint8 array """
+
+    def __init__(self, rows=None):
+        """ rows may be a 2D array, or an iterable of equal-length strings or
+        character lists """
+        if isinstance(rows, np.ndarray):
+            self.cells = rows.astype(np.uint8, copy=False)
+            return
+        rows = [''.join(row) for row in rows or []]
+        width = len(rows[0]) if rows else 0
+        for row_number, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(
+                    f'Grid rows must have equal lengths, but row '
+                    f'{row_number} has length {len(row)} instead of {width}'
+                )
+        self.cells = np.frombuffer(
+            ''.join(rows).encode('ascii'), dtype=np.uint8
+        ).reshape(len(rows), width).copy()
+
+    @classmethod
+    def from_text(cls, text):
+        """ Read grid from text with one row per line """
+        lines = text.splitlines()
+        while lines and not lines[-1].strip():
+            lines.pop()
+        return cls(line.rstrip() for line in lines)
+
+    @classmethod
+    def from_file(cls, file_path):
+        """ Read grid from specified file """
+        with open(file_path) as fp:
+            return cls.from_text(fp.read())
+
+    def __len__(self):
+        return self.cells.shape[0]
+
+    def __iter__(self):
+        return iter(self.lines())
+
+    def __getitem__(self, index):
+        """ Return row as string for integer index, or cells otherwise """
+        if isinstance(index, (int, np.integer)):
+            return self.cells[index].tobytes().decode('ascii')
+        return self.cells[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return np.array_equal(self.cells, other.cells)
+        return NotImplemented
+
+    def __str__(self):
+        return '\n'.join(self.lines())
+
+    @property
+    def shape(self):
+        """ Return (number of rows, number of columns) """
+        return self.cells.shape
+
+    def lines(self, cells=None):
+        """ Return rows of cells (by default, self.cells) as strings """
+        cells = self.cells if cells is None else cells
+        return [row.tobytes().decode('ascii') for row in cells]
+
+    def mask(self, char):
+        """ Return boolean array indicating cells equal to char """
+        return self.cells == ord(char)
+
+    def count(self, char):
+        """ Return number of cells equal to char """
+        return int(np.count_nonzero(self.mask(char)))
+
+    def get(self, row, column, toroidal=False):
+        """ Return character at position, optionally wrapping around edges """
+        if toroidal:
+            row %= self.cells.shape[0]
+            column %= self.cells.shape[1]
+        return chr(self.cells[row, column])
+
+    def slope_path(self, right, down):
+        """ Return characters along steps right/down from the top-left cell,
+        excluding it, with columns wrapping around toroidally """
+        rows = np.arange(down, self.cells.shape[0], down)
+        columns = (rows // down * right) % self.cells.shape[1]
+        return self.cells[rows, columns].tobytes().decode('ascii')
+
+    def rotate(self, quarter_turns=1):
+        """ Return view rotated counterclockwise by 90-degree quarter turns """
+        return np.rot90(self.cells, quarter_turns)
+
+    def flip(self, axis):
+        """ Return view flipped across horizontal (0) or vertical (1) axis """
+        return np.flip(self.cells, axis)
+
+    def crop(self, margin=1):
+        """ Return view without margin rows/columns on every side """
+        return self.cells[margin:-margin, margin:-margin]
+
+    def count_neighbors(self, mask):
+        """ Return counts of adjacent True cells (including diagonally) for
+        each cell in boolean array mask, vectorized via shifted slices """
+        return moore_neighbor_counts(mask)
+
+    def visible_cells(self, visible_mask, radius=None):
+        """ Return flat index of first cell in visible_mask along each of the
+        eight directions from each cell, within radius, or -1 if none """
+        rows, columns = self.cells.shape
+        flat_index = np.arange(rows * columns).reshape(rows, columns)
+        visible = np.full((len(NEIGHBOR_DIRECTIONS), rows, columns), -1)
+        for n, (row_step, column_step) in enumerate(NEIGHBOR_DIRECTIONS):
+            if row_step:
+                fill_first_visible(
+                    visible[n], visible_mask, flat_index, row_step,
+                    column_step,
+                )
+            else:
+                fill_first_visible(
+                    visible[n].T, visible_mask.T, flat_index.T, column_step,
+                    0,
+                )
+        if radius is not None:
+            row_index, column_index = np.indices((rows, columns))
+            distances = np.maximum(
+                abs(visible // max(columns, 1) - row_index),
+                abs(visible % max(columns, 1) - column_index),
+            )
+            visible[distances > radius] = -1
+        return visible
@@ -0,0 +1,58 @@
+""" Helpers for reading puzzle inputs shared by the daily solutions """
+
+# import modules used below.
+import os
+from pathlib import Path
+import sys
+
+
+def read_input(source):
+    """ Return puzzle input, given either as raw text (a str), as a file path
+    (an os.PathLike object such as pathlib.Path), or as an open file or other
+    iterable of lines (str or bytes, e.g., sys.stdin) """
+    if isinstance(source, os.PathLike):
+        with open(source) as fp:
+            return fp.read()
+    if not isinstance(source, str):
+        return ''.join(line + '\n' for line in iter_lines(source))
+
+    # Strings are never opened as files, but a single-line string that looks
+    # like a file path is almost certainly a mistake rather than puzzle text.
+    text = source.strip()
+    if '\n' not in text and (
+        os.sep in text or os.path.splitext(text)[1] == '.txt'
+    ):
+        if not os.path.exists(text):
+            raise FileNotFoundError(
+                f'Puzzle input looks like a path to a missing file: {text!r}'
+            )
+        raise TypeError(
+            f'Puzzle input looks like a file path: {text!r}; pass it as a '
+            f'pathlib.Path to read the file'
+        )
+    return source
+
+def iter_lines(source):
+    """ Yield lines of puzzle input lazily, without line endings, given raw
+    text, a file path (read one line at a time), or an open file or other
+    iterable of lines (str or bytes, e.g., sys.stdin) """
+    if isinstance(source, os.PathLike):
+        with open(source) as fp:
+            yield from iter_lines(fp)
+    elif isinstance(source, str):
+        yield from read_input(source).splitlines()
+    else:
+        for line in source:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            yield line.rstrip('\r\n')
+
+def input_source(default_path, argv=None):
+    """ Return source of puzzle input named on the command line, i.e., a
+    file path, or sys.stdin for '-', or default_path if none is named """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return Path(default_path)
+    if argv[0] == '-':
+        return sys.stdin
+    return Path(argv[0])
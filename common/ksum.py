@@ -0,0 +1,295 @@
+""" Search for k entries of a list of integers summing to a target
+
+Values are sorted once into a NumPy int64 array. Pairs summing to a target
+are found for all smaller entries at once, by binary searching the sorted
+values for their complements (the vectorized equivalent of walking two
+pointers towards each other).
+
+Larger k meet in the middle: the distinct sums of pairs of entries are
+indexed once (when there are at most DEFAULT_MAX_PAIR_SUMS pairs), along
+with the largest position of the smaller entry of a pair with each sum.
+Triples are then found by looking up the sums completing every candidate
+smallest entry at once, and quadruples by looking up the sums completing
+blocks of pairs of smallest entries, each block at most about block_cells
+pairs, so that memory stays bounded. Beyond four entries, or when there are
+too many pairs to index, the smallest entry is fixed in turn, skipping
+entries whose smallest or largest possible sums cannot reach the target,
+with memory linear in the number of values.
+
+When many targets are queried against the same values, KSumIndex sorts the
+values and indexes their pair sums once for all queries.
+"""
+
+# import third-party modules used below.
+import numpy as np
+
+
+DEFAULT_MAX_PAIR_SUMS = 2**21
+DEFAULT_BLOCK_CELLS = 2**20
+
+
+# Create data model for index of the distinct sums of pairs of entries.
+class PairSums:
+    """ Data Model for the distinct sums of pairs of entries of a sorted
+    int64 array, each with the smallest and largest positions of the smaller
+    entry of pairs with that sum """
+
+    def __init__(self, sorted_values):
+        first_positions, second_positions = np.triu_indices(
+            len(sorted_values), 1
+        )
+        sums = sorted_values[first_positions] + sorted_values[second_positions]
+        del second_positions
+        order = np.lexsort((first_positions, sums))
+        sums = sums[order]
+        first_positions = first_positions[order]
+        del order
+        group_starts = np.flatnonzero(np.diff(sums, prepend=sums[:1] - 1))
+        group_ends = np.flatnonzero(np.diff(sums, append=sums[-1:] + 1))
+        self.sums = sums[group_starts]
+        self.first_positions = first_positions[group_starts]
+        self.last_first_positions = first_positions[group_ends]
+
+    def __len__(self):
+        return len(self.sums)
+
+    def lookup(self, sums):
+        """ Return index locations of sums, and whether each is indexed """
+        if not len(self):
+            return (
+                np.zeros(np.shape(sums), dtype=np.int64),
+                np.zeros(np.shape(sums), dtype=bool),
+            )
+        locations = np.minimum(np.searchsorted(self.sums, sums), len(self) - 1)
+        return locations, self.sums[locations] == sums
+
+    def completes(self, sums, positions):
+        """ Return whether each sum is the sum of a pair of entries both after
+        the corresponding position """
+        locations, found = self.lookup(sums)
+        return found & (self.last_first_positions[locations] > positions)
+
+def index_pair_sums(sorted_values, max_pair_sums=DEFAULT_MAX_PAIR_SUMS):
+    """ Return PairSums of sorted values, or None if they have more than
+    max_pair_sums pairs """
+    number_of_values = len(sorted_values)
+    if number_of_values * (number_of_values - 1) // 2 > max_pair_sums:
+        return None
+    return PairSums(sorted_values)
+
+def iter_pair_sums(sorted_values, target):
+    """ Yield each pair of entries of a sorted int64 array (at distinct
+    positions) summing to target, once per distinct pair of values, as
+    ascending tuples in increasing order """
+    if not len(sorted_values):
+        return
+    # Only smaller entries whose complements lie within the sorted values
+    # can match.
+    positions = np.arange(
+        np.searchsorted(sorted_values, target - sorted_values[-1]),
+        np.searchsorted(sorted_values, target // 2, side='right'),
+    )
+    smaller_values = sorted_values[positions]
+    complements = target - smaller_values
+    first_matches = np.maximum(
+        np.searchsorted(sorted_values, complements, side='left'),
+        positions + 1,
+    )
+    after_matches = np.searchsorted(sorted_values, complements, side='right')
+    first_occurrences = np.ones(len(positions), dtype=bool)
+    first_occurrences[1:] = smaller_values[1:] != smaller_values[:-1]
+    for value in smaller_values[
+        first_occurrences & (first_matches < after_matches)
+    ].tolist():
+        yield value, target - value
+
+def smallest_entry_range(sorted_values, k, target, start):
+    """ Return range of positions, from start, of entries that could be the
+    smallest of k entries summing to target: each must reach the target
+    together with the largest entries, and be at most a kth of it """
+    return (
+        max(
+            np.searchsorted(
+                sorted_values, target - int(sorted_values[1 - k:].sum())
+            ),
+            start,
+        ),
+        min(
+            np.searchsorted(sorted_values, target // k, side='right'),
+            len(sorted_values) - k + 1,
+        ),
+    )
+
+def iter_triple_sums(sorted_values, target, pair_sums, start=0):
+    """ Yield triples of entries of a sorted int64 array from position start
+    summing to target (as iter_sorted_k_sums would), by looking up the sums
+    completing every candidate smallest entry in pair_sums at once """
+    first, stop = smallest_entry_range(sorted_values, 3, target, start)
+    positions = np.arange(first, max(stop, first))
+    candidates = positions[pair_sums.completes(
+        target - sorted_values[positions], positions
+    )]
+    previous_value = None
+    for position in candidates.tolist():
+        value = int(sorted_values[position])
+        if value == previous_value:
+            continue
+        previous_value = value
+        for pair in iter_pair_sums(
+            sorted_values[position + 1:], target - value
+        ):
+            yield (value, *pair)
+
+def iter_quadruple_sums(
+    sorted_values, target, pair_sums, start=0, block_cells=DEFAULT_BLOCK_CELLS
+):
+    """ Yield quadruples of entries of a sorted int64 array from position
+    start summing to target (as iter_sorted_k_sums would), by looking up the
+    sums completing blocks of pairs of smallest entries in pair_sums """
+    number_of_values = len(sorted_values)
+    first, stop = smallest_entry_range(sorted_values, 4, target, start)
+    rows_per_block = max(block_cells // number_of_values, 1)
+    second_positions = np.arange(number_of_values)
+    for block_start in range(first, stop, rows_per_block):
+        first_positions = np.arange(
+            block_start, min(block_start + rows_per_block, stop)
+        )[:, np.newaxis]
+        # Skip later occurrences of repeated values, whose combinations are
+        # all found from the first occurrence.
+        first_positions = first_positions[
+            (first_positions == first) |
+            (sorted_values[first_positions] !=
+             sorted_values[first_positions - 1])
+        ][:, np.newaxis]
+        hits = (second_positions > first_positions) & pair_sums.completes(
+            target - sorted_values[first_positions] -
+            sorted_values[second_positions],
+            second_positions,
+        )
+        hits[:, 1:] &= (
+            (second_positions[1:] - 1 == first_positions) |
+            (sorted_values[1:] != sorted_values[:-1])
+        )
+        for row, second_position in zip(*np.nonzero(hits)):
+            first_value = int(sorted_values[first_positions[row, 0]])
+            second_value = int(sorted_values[second_position])
+            for pair in iter_pair_sums(
+                sorted_values[second_position + 1:],
+                target - first_value - second_value,
+            ):
+                yield (first_value, second_value, *pair)
+
+def iter_sorted_k_sums(sorted_values, k, target, start=0, pair_sums=None):
+    """ Yield each combination of k entries of a sorted int64 array from
+    position start (at distinct positions) summing to target, once per
+    distinct combination of values, as ascending tuples in lexicographic
+    order, using pair_sums (if given) to meet in the middle """
+    if len(sorted_values) - start < k:
+        return
+    if k == 1:
+        position = np.searchsorted(sorted_values, target)
+        if (
+            start <= position < len(sorted_values) and
+            sorted_values[position] == target
+        ):
+            yield (target,)
+        return
+    if k == 2:
+        yield from iter_pair_sums(sorted_values[start:], target)
+        return
+    if pair_sums is not None and k == 3:
+        yield from iter_triple_sums(sorted_values, target, pair_sums, start)
+        return
+    if pair_sums is not None and k == 4:
+        yield from iter_quadruple_sums(
+            sorted_values, target, pair_sums, start
+        )
+        return
+
+    first, stop = smallest_entry_range(sorted_values, k, target, start)
+    previous_value = None
+    for position, value in enumerate(
+        sorted_values[first:stop].tolist(), first
+    ):
+        if value == previous_value:
+            continue
+        previous_value = value
+        if value + int(sorted_values[position + 1:position + k].sum()) > (
+            target
+        ):
+            break
+        for combination in iter_sorted_k_sums(
+            sorted_values, k - 1, target - value, position + 1, pair_sums
+        ):
+            yield (value, *combination)
+
+def iter_k_sums(values, k, target, max_pair_sums=DEFAULT_MAX_PAIR_SUMS):
+    """ Yield each combination of k entries of values (at distinct
+    positions) summing to target, once per distinct combination of values,
+    as ascending tuples in lexicographic order """
+    if k < 1:
+        raise ValueError(f'Number of entries must be positive, not {k}')
+    sorted_values = np.sort(np.asarray(values, dtype=np.int64))
+    pair_sums = None
+    if k >= 3:
+        pair_sums = index_pair_sums(sorted_values, max_pair_sums)
+    return iter_sorted_k_sums(sorted_values, k, target, pair_sums=pair_sums)
+
+def find_k_sum(values, k, target, max_pair_sums=DEFAULT_MAX_PAIR_SUMS):
+    """ Return first combination of k entries of values summing to target
+    (see iter_k_sums); raises ValueError if there is none """
+    combination = next(iter_k_sums(values, k, target, max_pair_sums), None)
+    if combination is None:
+        raise ValueError(f'No {k} entries sum to {target}')
+    return combination
+
+# Create data model for index answering k-sum queries for many targets.
+class KSumIndex:
+    """ Data Model for values sorted once, plus the distinct sums of pairs of
+    entries when there are at most max_pair_sums pairs, answering queries
+    for the first combination of k entries summing to each of many targets
+    (as find_k_sum would, but with None for targets without one) """
+
+    def __init__(self, values, max_pair_sums=DEFAULT_MAX_PAIR_SUMS):
+        self.sorted_values = np.sort(np.asarray(values, dtype=np.int64))
+        self.pair_sums = index_pair_sums(self.sorted_values, max_pair_sums)
+
+    def find_pairs(self, targets):
+        """ Return first pair of entries summing to each target, or None,
+        looking all targets up in the pair-sum index at once """
+        locations, found = self.pair_sums.lookup(targets)
+        pairs = []
+        for target, location, present in zip(
+            targets.tolist(), locations.tolist(), found.tolist()
+        ):
+            if not present:
+                pairs.append(None)
+                continue
+            smaller_value = int(
+                self.sorted_values[self.pair_sums.first_positions[location]]
+            )
+            pairs.append((smaller_value, target - smaller_value))
+        return pairs
+
+    def find_many(self, k, targets):
+        """ Return first combination of k entries summing to each target, or
+        None for targets that no combination sums to """
+        if k < 1:
+            raise ValueError(f'Number of entries must be positive, not {k}')
+        targets = np.asarray(targets, dtype=np.int64)
+        if self.pair_sums is not None and k == 2:
+            return self.find_pairs(targets)
+        return [
+            next(
+                iter_sorted_k_sums(
+                    self.sorted_values, k, target, pair_sums=self.pair_sums
+                ),
+                None,
+            )
+            for target in targets.tolist()
+        ]
+
+    def find(self, k, target):
+        """ Return first combination of k entries summing to target, or None
+        if there is none """
+        return self.find_many(k, [target])[0]
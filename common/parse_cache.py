@@ -0,0 +1,117 @@
+""" Opt-in on-disk cache of parsed puzzle inputs, keyed by content hash
+
+Caching is enabled by setting the AOC_PARSE_CACHE environment variable to a
+cache directory. Entries are pickles keyed by a SHA-256 hash of the input
+(the raw bytes of an input file, which may be binary, or the input text),
+the extra parse arguments, the name and source of the solution module
+defining the parser, and the source of every module in this repo that it
+imports (directly or indirectly, e.g., common/inputs.py or common/grid.py),
+so editing either the input or the parsing code invalidates them
+automatically. Since every solution module imports this one, the modules
+needed only for caching are imported when caching is first used, keeping
+cold imports of solution modules fast when it is disabled.
+"""
+
+# import modules used below.
+from functools import lru_cache, wraps
+import os
+from pathlib import Path
+import sys
+from types import ModuleType
+
+# import local modules used below.
+from common.inputs import read_input
+
+
+CACHE_DIR_ENV = 'AOC_PARSE_CACHE'
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=None)
+def parser_version(source_file):
+    """ Return hash of the source file defining a parser """
+    import hashlib
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+
+@lru_cache(maxsize=None)
+def local_source_files(module_name):
+    """ Return sorted source files of a module and of the modules in this
+    repo that it imports, directly or indirectly """
+    source_files = set()
+    pending_modules = [sys.modules[module_name]]
+    seen_modules = set()
+    while pending_modules:
+        module = pending_modules.pop()
+        if module.__name__ in seen_modules:
+            continue
+        seen_modules.add(module.__name__)
+        module_file = getattr(module, '__file__', None)
+        if module_file is None:
+            continue
+        module_file = Path(module_file).resolve()
+        if REPO_ROOT not in module_file.parents:
+            continue
+        source_files.add(str(module_file))
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                pending_modules.append(value)
+            elif isinstance(getattr(value, '__module__', None), str):
+                if (dependency := sys.modules.get(value.__module__)):
+                    pending_modules.append(dependency)
+    return sorted(source_files)
+
+def cache_key(parse, data, args, kwargs):
+    """ Return cache key for parsing input bytes with specified parser and
+    arguments """
+    import hashlib
+    source_file = sys.modules[parse.__module__].__file__
+    key_hash = hashlib.sha256()
+    for local_source_file in local_source_files(parse.__module__):
+        key_hash.update(parser_version(local_source_file).encode())
+    key_hash.update(
+        f'{parse.__module__}{sys.version_info[:2]}{args!r}{kwargs!r}'.encode()
+    )
+    key_hash.update(data)
+    return f'{Path(source_file).stem}-{key_hash.hexdigest()}'
+
+def cached_parse(parse):
+    """ Decorate parser to reuse pickled results when caching is enabled """
+
+    @wraps(parse)
+    def wrapper(text_or_path, *args, **kwargs):
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+        if not cache_dir:
+            return parse(text_or_path, *args, **kwargs)
+        import pickle
+        import tempfile
+        # Key files on their raw bytes, since inputs may be binary (e.g.,
+        # int64 column files), and leave reading them to the parser. Other
+        # iterables of lines (e.g., sys.stdin) can only be read once, so
+        # they are read here and passed on to the parser as text.
+        if isinstance(text_or_path, os.PathLike):
+            data = Path(text_or_path).read_bytes()
+        else:
+            text_or_path = read_input(text_or_path)
+            data = text_or_path.encode()
+        cache_path = (
+            Path(cache_dir) / f'{cache_key(parse, data, args, kwargs)}.pickle'
+        )
+        try:
+            with open(cache_path, 'rb') as fp:
+                return pickle.load(fp)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        parsed = parse(text_or_path, *args, **kwargs)
+        try:
+            pickled = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return parsed
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, delete=False
+        ) as fp:
+            fp.write(pickled)
+        os.replace(fp.name, cache_path)
+        return parsed
+
+    return wrapper
@@ -0,0 +1,85 @@
+""" Lazy readers for puzzle inputs made of blank-line-separated records
+
+Files are memory-mapped and split into records by scanning the mapping in
+place, so each record is read from the page cache only when it is requested
+and memory use stays constant regardless of file size. Text and iterables of
+lines (such as open files or sys.stdin, for streaming input from a pipe)
+are split lazily as well.
+"""
+
+# import modules used below.
+from contextlib import contextmanager
+import mmap
+import os
+import re
+
+# import local modules used below.
+from common.inputs import iter_lines, read_input
+
+
+# Records are separated by one or more lines with at most whitespace.
+RECORD_SEPARATOR = r'\r?\n(?:[ \t]*\r?\n)+'
+RECORD_SEPARATOR_REGEXES = {
+    str: re.compile(RECORD_SEPARATOR),
+    bytes: re.compile(RECORD_SEPARATOR.encode()),
+}
+
+
+def record_spans(buffer):
+    """ Yield (start, end) offsets of records in str or bytes-like buffer
+    (e.g., an mmap object), excluding separators and trailing newlines """
+    separator_regex = RECORD_SEPARATOR_REGEXES[
+        str if isinstance(buffer, str) else bytes
+    ]
+    start = 0
+    for separator in separator_regex.finditer(buffer):
+        if separator.start() > start:
+            yield start, separator.start()
+        start = separator.end()
+    end = len(buffer)
+    while end > start and buffer[end - 1:end] in ('\n', '\r', b'\n', b'\r'):
+        end -= 1
+    if end > start:
+        yield start, end
+
+@contextmanager
+def mapped_file(file_path):
+    """ Return read-only memory map of specified file, or empty bytes for an
+    empty file (which cannot be memory-mapped) """
+    with open(file_path, 'rb') as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            yield mapping
+
+def iter_record_views(file_path):
+    """ Yield records of specified file as zero-copy memoryview slices of a
+    memory map, each valid only until the next record is requested """
+    with mapped_file(file_path) as mapping:
+        with memoryview(mapping) as view:
+            for start, end in record_spans(mapping):
+                with view[start:end] as record_view:
+                    yield record_view
+
+def iter_records(source):
+    """ Yield records lazily as text without trailing newlines, given a file
+    path (an os.PathLike object, which is memory-mapped), raw text (a str),
+    or any other iterable of lines (e.g., an open file or sys.stdin) """
+    if isinstance(source, os.PathLike):
+        for record_view in iter_record_views(source):
+            yield str(record_view, 'utf-8')
+    elif isinstance(source, str):
+        text = read_input(source)
+        for start, end in record_spans(text):
+            yield text[start:end]
+    else:
+        record_lines = []
+        for line in iter_lines(source):
+            if line.strip():
+                record_lines.append(line)
+            elif record_lines:
+                yield '\n'.join(record_lines)
+                record_lines = []
+        if record_lines:
+            yield '\n'.join(record_lines)
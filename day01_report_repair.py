@@ -1,49 +1,74 @@
 """ Solutions for https://adventofcode.com/2020/day/1 """
 
+# import modules used below.
+from math import prod
+
+# import local modules used below.
+from common.columns import read_int_values
+from common.inputs import input_source
+from common.ksum import find_k_sum, KSumIndex
+from common.parse_cache import cached_parse
+
 
 # Part 1: Find the two entries that sum to 2020 in the provided data file
 # and then multiply those two numbers together.
 
 
-# Read positive integer values from data file.
-with open('data/day01_report_repair-data.txt') as fp:
-    data_values = [int(line.rstrip()) for line in fp]
+# Read positive integer values from text, data file, or int64 column file.
+@cached_parse
+def parse(text_or_path):
+    """ Read positive integer values from text or specified file """
+    return read_int_values(text_or_path)
 
 # In order to minimize the number of comparisons needed, calculate 2020 - v
-# for each value v in the data file. If 2020 - v is also in the data file,
-# then (2020 - v) + v = 2020. Consequently, the desired solution will be
-# (2020-v)*v.
-differences_from_2020 = {
-    2020 - v
-    for v in data_values
-}
-
-# Search the collection of difference for value in the data file, and stop
-# once a solution has been found for Part 1.
-for v in data_values:
-    if v in differences_from_2020:
-        print(f'Values from data file for Part 1: {(2020-v, v)}')
-        print(f'Solution for Part 1: {2020-v}*{v} = {(2020-v)*v}')
-        break
+# for each value v in the data file, and binary search the sorted values for
+# it. If 2020 - v is also in the data file, then (2020 - v) + v = 2020.
+# Consequently, the desired solution will be (2020-v)*v.
+def find_two_entries(data_values, target=2020):
+    """ Find two entries summing to target; raises ValueError if no two
+    entries sum to it """
+    return find_k_sum(data_values, 2, target)
+
+# To find entries summing to each of many targets, sort the values (and,
+# when there are few enough values, sum each pair of them) once, and then
+# answer all queries against the resulting index, e.g.,
+# build_index(data_values).find_many(3, targets).
+def build_index(data_values):
+    """ Build index of entries answering queries for many targets """
+    return KSumIndex(data_values)
+
+def part1(data_values):
+    """ Find product of the two entries summing to 2020 for Part 1 """
+    return prod(find_two_entries(data_values))
 
 
 # Part 2: What is the product of the three entries that sum to 2020?
 
 
-# Generalizing, calculate 2020 - (v1 + v2) for each pair of values (v1, v2)
-# in the data file. If v = 2020 - (v1 + v2) is also in the data file, then
-# v + v1 + v2 = 2020. Consequently, the desired solution will be v*v1*v2.
-pairwise_differences_from_2020 = {
-    2020 - (v1 + v2): (v1, v2)
-    for v1 in data_values
-    for v2 in data_values
-}
-
-# Search the collection of difference for value in the data file, and stop
-# once a solution has been found for Part 2.
-for v in data_values:
-    if v in pairwise_differences_from_2020.keys():
-        v1, v2 = pairwise_differences_from_2020[v]
-        print(f'Values from data file for Part 2: {(v, v1, v2)}')
-        print(f'Solution for Part 2: {v}*{v1}*{v2} = {v*v1*v2}')
-        break
+# Generalizing, fix the smallest value v in turn, and search the larger
+# values for two entries (v1, v2) summing to 2020 - v as in Part 1, so that
+# v + v1 + v2 = 2020 without building a table of all pairwise sums.
+# Consequently, the desired solution will be v*v1*v2.
+def find_three_entries(data_values, target=2020):
+    """ Find three entries summing to target; raises ValueError if no three
+    entries sum to it """
+    return find_k_sum(data_values, 3, target)
+
+def part2(data_values):
+    """ Find product of the three entries summing to 2020 for Part 2 """
+    return prod(find_three_entries(data_values))
+
+
+if __name__ == '__main__':
+    # Read positive integer values from data file.
+    data_values = parse(input_source('data/day01_report_repair-data.txt'))
+
+    # Find solution for Part 1.
+    v1, v2 = find_two_entries(data_values)
+    print(f'Values from data file for Part 1: {(v1, v2)}')
+    print(f'Solution for Part 1: {v1}*{v2} = {v1*v2}')
+
+    # Find solution for Part 2.
+    v, v1, v2 = find_three_entries(data_values)
+    print(f'Values from data file for Part 2: {(v, v1, v2)}')
+    print(f'Solution for Part 2: {v}*{v1}*{v2} = {v*v1*v2}')
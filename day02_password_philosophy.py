@@ -1,9 +1,21 @@
 """ Solutions for https://adventofcode.com/2020/day/2 """
 
 # import modules used below.
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
+import os
+from pathlib import Path
 import re
 
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from common.inputs import input_source, iter_lines, read_input
+from common.parse_cache import cached_parse
+from common.records import mapped_file
+
 
 # Part 1: How many passwords in the provided data file are valid according to
 # their corresponding "policies"?
@@ -39,22 +51,265 @@ class RuleComponentsAndPassword:
         letter_at_max_position = self.pswd[self.max_times-1] == self.char
         return letter_at_min_position != letter_at_max_position
 
-# Read "policy" rule components and passwords from data file.
-with open('data/day02_password_philosophy-data.txt') as fp:
-    data_values = [
+# Bytes matching the regex's \w in ASCII text: letters, digits, and underscore.
+WORD_BYTES = np.zeros(256, dtype=bool)
+WORD_BYTES[np.frombuffer(
+    b'_0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    dtype=np.uint8,
+)] = True
+
+def parse_digits(buffer, starts, ends):
+    """ Return int64 array of the decimal numbers in buffer[starts:ends],
+    converting all numbers one digit position at a time """
+    widths = ends - starts
+    values = np.zeros(len(starts), dtype=np.int64)
+    for offset in range(int(widths.max(initial=0))):
+        has_digit = offset < widths
+        digits = buffer[np.minimum(starts + offset, len(buffer) - 1)]
+        if np.any(has_digit & ((digits < ord('0')) | (digits > ord('9')))):
+            raise ValueError('Password policy bounds must be decimal numbers')
+        values = np.where(
+            has_digit, values * 10 + digits.astype(np.int64) - ord('0'),
+            values,
+        )
+    return values
+
+# Create columnar data model for "policy" rule components and passwords, so
+# that policies can be evaluated for all passwords at once.
+@dataclass(eq=False)
+class PasswordColumns:
+    """ Data Model for rule components and passwords as columns: the bytes
+    of the data file, and arrays of bounds, characters, and offsets of
+    passwords in those bytes, one element per line """
+    buffer: np.ndarray
+    min_times: np.ndarray
+    max_times: np.ndarray
+    chars: np.ndarray
+    pswd_starts: np.ndarray
+    pswd_ends: np.ndarray
+
+    @classmethod
+    def from_bytes(cls, data):
+        """ Parse lines such as b'1-3 a: abcde' in bulk, scanning the bytes
+        for line endings, dashes, and colons with NumPy rather than matching
+        a regex per line; raises ValueError for malformed lines """
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        line_ends = np.flatnonzero(buffer == ord('\n'))
+        number_of_newlines = len(line_ends)
+        if len(buffer) and buffer[-1] != ord('\n'):
+            line_ends = np.append(line_ends, len(buffer))
+        line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+        carriage_returns = (
+            buffer[np.maximum(line_ends - 1, 0)] == ord('\r')
+        ) & (line_ends > line_starts)
+        line_ends = line_ends - carriage_returns
+        nonblank = line_ends > line_starts
+        line_starts = line_starts[nonblank]
+        line_ends = line_ends[nonblank]
+
+        # Each line has exactly one dash (between the bounds) and one colon
+        # (after the character), with a space before the character and after
+        # the colon, and a non-empty password; the bounds are checked to be
+        # digits as they are parsed. Passwords are word characters, so the
+        # only other bytes are those four separators and line endings.
+        dashes = np.flatnonzero(buffer == ord('-'))
+        colons = np.flatnonzero(buffer == ord(':'))
+        if not (
+            len(dashes) == len(colons) == len(line_starts) and
+            np.all((line_starts < dashes) & (dashes < colons - 3)) and
+            np.all(colons + 2 < line_ends) and
+            np.all(buffer[colons - 2] == ord(' ')) and
+            np.all(WORD_BYTES[buffer[colons - 1]]) and
+            np.all(buffer[colons + 1] == ord(' ')) and
+            np.bincount(buffer, minlength=256)[~WORD_BYTES].sum() ==
+            4 * len(line_starts) + number_of_newlines +
+            np.count_nonzero(carriage_returns)
+        ):
+            raise ValueError(
+                'Every line must have the form "MIN-MAX CHAR: PASSWORD"'
+            )
+        return cls(
+            buffer=buffer,
+            min_times=parse_digits(buffer, line_starts, dashes),
+            max_times=parse_digits(buffer, dashes + 1, colons - 2),
+            chars=buffer[colons - 1],
+            pswd_starts=colons + 2,
+            pswd_ends=line_ends,
+        )
+
+    def __len__(self):
+        return len(self.chars)
+
+    def __getitem__(self, index):
+        """ Return view of one line as rule components and password """
+        return RuleComponentsAndPassword(
+            f'{self.min_times[index]}-{self.max_times[index]} '
+            f'{chr(self.chars[index])}: '
+            + self.buffer[
+                self.pswd_starts[index]:self.pswd_ends[index]
+            ].tobytes().decode()
+        )
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def char_counts(self):
+        """ Count occurrences of each line's character in its password, for
+        all lines at once, by comparing the bytes of the data file with the
+        character of the password they belong to (or 0 outside passwords) """
+        if not len(self):
+            return np.zeros(0, dtype=np.int64)
+        run_chars = np.zeros(2 * len(self) + 1, dtype=np.uint8)
+        run_chars[1::2] = self.chars
+        run_lengths = np.empty(2 * len(self) + 1, dtype=np.int64)
+        run_lengths[0] = self.pswd_starts[0]
+        run_lengths[2:-1:2] = self.pswd_starts[1:] - self.pswd_ends[:-1]
+        run_lengths[1::2] = self.pswd_ends - self.pswd_starts
+        run_lengths[-1] = len(self.buffer) - self.pswd_ends[-1]
+        matches = self.buffer == np.repeat(run_chars, run_lengths)
+
+        # Sum matches from each password's start to the next one's, with a
+        # trailing non-match, so that an empty last password sums to 0.
+        return np.add.reduceat(
+            np.append(matches, False), self.pswd_starts, dtype=np.int64
+        )
+
+    def valid_for_part1(self):
+        """ Determine which passwords match rules according to Part 1 """
+        char_counts = self.char_counts()
+        return (self.min_times <= char_counts) & (
+            char_counts <= self.max_times
+        )
+
+    def valid_for_part2(self):
+        """ Determine which passwords match rules according to Part 2,
+        where positions past the end of a password never match """
+
+        def char_at(times):
+            positions = self.pswd_starts + times - 1
+            in_password = (times >= 1) & (positions < self.pswd_ends)
+            return in_password & (
+                self.buffer[np.where(in_password, positions, 0)] == self.chars
+            )
+
+        return char_at(self.min_times) != char_at(self.max_times)
+
+# Read "policy" rule components and passwords lazily from text, data file, or
+# lines (e.g., stdin), so that part1 and part2 can also check them in constant
+# memory.
+def iter_passwords(source):
+    """ Yield rule components and passwords from text, specified file, or
+    lines """
+    return (
         RuleComponentsAndPassword(line.rstrip())
-        for line in fp
-    ]
+        for line in iter_lines(source) if line.strip()
+    )
+
+# Read "policy" rule components and passwords from text or data file into
+# columns.
+@cached_parse
+def parse(text_or_path):
+    """ Read rule components and passwords from text or specified file """
+    if isinstance(text_or_path, os.PathLike):
+        return PasswordColumns.from_bytes(Path(text_or_path).read_bytes())
+    return PasswordColumns.from_bytes(read_input(text_or_path).encode())
 
-# Count number of valid passwords for Part 1.
-number_of_valid_passwords = sum([v.is_valid_for_part1() for v in data_values])
-print(f'Number of valid passwords for Part 1: {number_of_valid_passwords}')
+def part1(data_values):
+    """ Count number of valid passwords for Part 1, given columns or any
+    iterable of rule components and passwords """
+    if isinstance(data_values, PasswordColumns):
+        return int(np.count_nonzero(data_values.valid_for_part1()))
+    return sum(v.is_valid_for_part1() for v in data_values)
 
 
 # Part 2: How many passwords in the provided data file are valid according to
 # the alternate interpretation for their corresponding "policies"?
 
 
-# Count number of valid passwords for Part 2.
-number_of_valid_passwords = sum([v.is_valid_for_part2() for v in data_values])
-print(f'Number of valid passwords for Part 2: {number_of_valid_passwords}')
+def part2(data_values):
+    """ Count number of valid passwords for Part 2, given columns or any
+    iterable of rule components and passwords """
+    if isinstance(data_values, PasswordColumns):
+        return int(np.count_nonzero(data_values.valid_for_part2()))
+    return sum(v.is_valid_for_part2() for v in data_values)
+
+
+# Validate password databases in chunks of at most 64 MiB when splitting them
+# across processes.
+DEFAULT_CHUNK_BYTES = 64 * 2**20
+
+# Split large password databases into byte ranges on line boundaries, which
+# worker processes validate by memory-mapping the file themselves, so that no
+# lines are pickled between processes.
+def chunk_ranges(file_path, number_of_chunks):
+    """ Return (start, stop) byte offsets splitting specified file into at
+    most number_of_chunks ranges of about equal size, each ending just after
+    a newline or at the end of the file """
+    with mapped_file(file_path) as mapping:
+        file_size = len(mapping)
+        boundaries = [0]
+        for chunk in range(1, number_of_chunks):
+            newline = mapping.find(
+                b'\n', max(file_size * chunk // number_of_chunks,
+                           boundaries[-1])
+            )
+            if newline == -1 or newline + 1 >= file_size:
+                break
+            boundaries.append(newline + 1)
+        if file_size:
+            boundaries.append(file_size)
+    return list(zip(boundaries, boundaries[1:]))
+
+def count_valid_passwords_in_range(file_path, start, stop):
+    """ Count passwords valid for Part 1 and for Part 2 among the lines in
+    specified byte range of a file, read from a memory map of the file """
+    with mapped_file(file_path) as mapping:
+        with memoryview(mapping) as view, view[start:stop] as chunk_view:
+            columns = PasswordColumns.from_bytes(chunk_view)
+            valid_counts = part1(columns), part2(columns)
+            # Release the columns' view of the memory map before closing it.
+            del columns
+    return valid_counts
+
+def solve_in_parallel(
+    file_path, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES
+):
+    """ Count passwords valid for Part 1 and for Part 2 in a data file,
+    validating byte ranges of at most about chunk_bytes in a pool of worker
+    processes (or in this process, if workers is 1) """
+    workers = workers or os.cpu_count()
+    ranges = chunk_ranges(
+        file_path,
+        max(workers, -(-os.path.getsize(file_path) // chunk_bytes)),
+    )
+    starts = [start for start, _ in ranges]
+    stops = [stop for _, stop in ranges]
+    if workers == 1:
+        valid_counts = list(map(
+            count_valid_passwords_in_range, repeat(file_path), starts, stops
+        ))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            valid_counts = list(executor.map(
+                count_valid_passwords_in_range, repeat(file_path), starts,
+                stops,
+            ))
+    return (
+        sum(part1_count for part1_count, _ in valid_counts),
+        sum(part2_count for _, part2_count in valid_counts),
+    )
+
+
+if __name__ == '__main__':
+    # Read "policy" rule components and passwords from data file.
+    data_values = parse(
+        input_source('data/day02_password_philosophy-data.txt')
+    )
+
+    # Count number of valid passwords for Part 1.
+    number_of_valid_passwords = part1(data_values)
+    print(f'Number of valid passwords for Part 1: {number_of_valid_passwords}')
+
+    # Count number of valid passwords for Part 2.
+    number_of_valid_passwords = part2(data_values)
+    print(f'Number of valid passwords for Part 2: {number_of_valid_passwords}')
@@ -1,8 +1,15 @@
 """ Solutions for https://adventofcode.com/2020/day/3 """
 
 # import modules used below.
-from collections import UserList
-from math import ceil, prod
+from math import prod
+
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from common.grid import Grid
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
 
 
 # Part 1: Starting at the top-left corner of the "map" in the provided data
@@ -11,38 +18,61 @@ from math import ceil, prod
 
 
 # Create data model for "map" in data file.
-class TobogganMap(UserList):
+class TobogganMap(Grid):
     """ Data Model for toboggan map from data file """
 
-    @classmethod
-    def from_file(cls, file_path):
-        """ Read toboggan map from specified file """
-        with open(file_path) as fp:
-            return cls(line.rstrip() for line in fp)
-
     def get_object(self, x, y):
         """ Return map component relative to top-left corner being (1,1) """
-        current_row = self[y-1]
-        return current_row[(x-1) % len(current_row)]
+        return self.get(y-1, x-1, toroidal=True)
 
     def traverse_path(self, right, down):
         """ Return objects along step path right/down from top-left corner """
-        objects_along_path = []
-        number_of_iterations = ceil(len(self)/down)
-        for n in range(1, number_of_iterations):
-            objects_along_path.append(
-                toboggan_map.get_object(right * n + 1, down * n + 1)
+        return self.slope_path(right, down)
+
+    def count_trees(self, slopes):
+        """ Count "trees" along each (right, down) slope from the top-left
+        corner, for any number of slopes at once """
+        slopes = np.asarray(slopes, dtype=np.int64).reshape(-1, 2)
+        if np.any(slopes[:, 1] < 1):
+            raise ValueError('Slopes must go down at least one row per step')
+        trees = self.mask('#')
+        width = trees.shape[1]
+        number_of_trees = np.zeros(len(slopes), dtype=np.int64)
+        if not width:
+            return number_of_trees.tolist()
+
+        # Step k right r reaches column ((k mod width) * r) mod width, so
+        # for each distinct down, a single pass over the rows it reaches can
+        # count trees by step modulo width and by column, after which every
+        # slope with that down sums width of those counts.
+        step_residues = np.arange(width)
+        for down in np.unique(slopes[:, 1]).tolist():
+            slope_indexes = np.flatnonzero(slopes[:, 1] == down)
+            reached_rows = trees[down::down]
+            rows_by_step = np.zeros(
+                (-(-(len(reached_rows) + 1) // width) * width, width),
+                dtype=bool,
+            )
+            rows_by_step[1:len(reached_rows) + 1] = reached_rows
+            tree_counts = rows_by_step.reshape(-1, width, width).sum(axis=0)
+            columns = (
+                step_residues * (slopes[slope_indexes, 0, np.newaxis] % width)
+                % width
             )
-        return objects_along_path
+            number_of_trees[slope_indexes] = tree_counts[
+                step_residues, columns
+            ].sum(axis=1)
+        return number_of_trees.tolist()
 
-# Read "map" from data file.
-toboggan_map = TobogganMap.from_file('data/day03_toboggan_trajectory-data.txt')
+# Read "map" from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read toboggan map from text or specified file """
+    return TobogganMap.from_text(read_input(text_or_path))
 
-# Count number of "trees" for Part 1.
-print(
-    f'Number of trees encountered for Part 1: '
-    f'{toboggan_map.traverse_path(3, 1).count("#")}'
-)
+def part1(toboggan_map):
+    """ Count number of "trees" encountered for Part 1 """
+    return toboggan_map.count_trees([(3, 1)])[0]
 
 
 # Part 2: Starting at the top-left corner of the "map" in the provided data
@@ -51,7 +81,7 @@ print(
 # (x,y) = (1,1), (3,1), (5,1), (7,1), (1,2)?
 
 
-# Determine number of "trees" along each path through "map".
+# Specify paths through "map" for Part 2.
 paths = [
     (1, 1),
     (3, 1),
@@ -59,13 +89,26 @@ paths = [
     (7, 1),
     (1, 2),
 ]
-number_of_trees = {
-    path: toboggan_map.traverse_path(*path).count('#')
-    for path in paths
-}
-
-# Calculate product of number of "trees" along each path for Part 2.
-print(
-    f'Product of number of trees encountered along each path for Part 2: '
-    f'{prod(number_of_trees.values())}'
-)
+
+def part2(toboggan_map):
+    """ Find product of number of "trees" along each path for Part 2 """
+    return prod(toboggan_map.count_trees(paths))
+
+
+if __name__ == '__main__':
+    # Read "map" from data file.
+    toboggan_map = parse(
+        input_source('data/day03_toboggan_trajectory-data.txt')
+    )
+
+    # Count number of "trees" for Part 1.
+    print(
+        f'Number of trees encountered for Part 1: '
+        f'{part1(toboggan_map)}'
+    )
+
+    # Calculate product of number of "trees" along each path for Part 2.
+    print(
+        f'Product of number of trees encountered along each path for Part 2: '
+        f'{part2(toboggan_map)}'
+    )
@@ -4,6 +4,11 @@
 from collections import UserDict
 import re
 
+# import local modules used below.
+from common.inputs import input_source
+from common.parse_cache import cached_parse
+from common.records import iter_records
+
 
 # Part 1: In the provided data file, how many "passports" are valid?
 
@@ -32,6 +37,11 @@ class Passport(UserDict):
         'pid': re.compile(r'^\d{9}$'),
     }
 
+    @classmethod
+    def from_record(cls, record):
+        """ Read "passport" from record of key:value components """
+        return cls(component.split(':') for component in record.split())
+
     def is_valid_for_part1(self):
         """ Determine whether "passport" has all components for Part 1 """
         return all(
@@ -46,30 +56,44 @@ class Passport(UserDict):
                 for component, rule in self.validation_rules_for_part2.items()
             )
 
-# Read "passports" from data file.
-passports = []
-current_passport = Passport()
-with open('data/day04_passport_processing-data.txt') as fp:
-    for line in fp:
-        if line == '\n':
-            passports.append(current_passport)
-            current_passport = Passport()
-            continue
-        current_passport.update(
-                component.split(':')
-                for component in line.rstrip().split(' ')
-        )
-    passports.append(current_passport)
+# Read "passports" lazily from text, data file, or lines (e.g., stdin), so
+# that part1 and part2 can also validate them in constant memory.
+def iter_passports(source):
+    """ Yield "passports" from text, specified file, or lines """
+    return map(Passport.from_record, iter_records(source))
+
+# Read "passports" from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read "passports" from text or specified file """
+    return list(iter_passports(text_or_path))
 
-# Count number of valid "passports" for Part 1.
-number_of_valid_passports1 = sum([p.is_valid_for_part1() for p in passports])
-print(f'Number of passports in data file: {len(passports)}')
-print(f'Number of valid passports for Part 1: {number_of_valid_passports1}')
+def part1(passports):
+    """ Count number of valid "passports" for Part 1 """
+    return sum(p.is_valid_for_part1() for p in passports)
 
 
 # Part 2: In the provided data file, how many "passports" have valid values?
 
 
-# Count number of valid "passports" for Part 2.
-number_of_valid_passports2 = sum([p.is_valid_for_part2() for p in passports])
-print(f'Number of valid passports for Part 2: {number_of_valid_passports2}')
+def part2(passports):
+    """ Count number of valid "passports" for Part 2 """
+    return sum(p.is_valid_for_part2() for p in passports)
+
+
+if __name__ == '__main__':
+    # Read "passports" from data file.
+    passports = parse(input_source('data/day04_passport_processing-data.txt'))
+
+    # Count number of valid "passports" for Part 1.
+    number_of_valid_passports1 = part1(passports)
+    print(f'Number of passports in data file: {len(passports)}')
+    print(
+        f'Number of valid passports for Part 1: {number_of_valid_passports1}'
+    )
+
+    # Count number of valid "passports" for Part 2.
+    number_of_valid_passports2 = part2(passports)
+    print(
+        f'Number of valid passports for Part 2: {number_of_valid_passports2}'
+    )
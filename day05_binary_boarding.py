@@ -3,6 +3,10 @@
 # import modules used below.
 from dataclasses import dataclass, field
 
+# import local modules used below.
+from common.inputs import input_source, iter_lines
+from common.parse_cache import cached_parse
+
 
 # Part 1: In the provided data file, what is the highest seat ID on a boarding
 # pass?
@@ -28,27 +32,54 @@ class BoardingPass:
         )
         self.seat_id = self.row * 8 + self.seat
 
-# Read "boarding passes" from data file.
-with open('data/day05_binary_boarding-data.txt') as fp:
-    data_values = [BoardingPass(line.rstrip()) for line in fp]
+# Read "boarding passes" lazily from text, data file, or lines (e.g., stdin),
+# so that part1 and part2 can also process them in constant memory.
+def iter_boarding_passes(source):
+    """ Yield "boarding passes" from text, specified file, or lines """
+    return (
+        BoardingPass(line.rstrip())
+        for line in iter_lines(source) if line.strip()
+    )
+
+# Read "boarding passes" from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read "boarding passes" from text or specified file """
+    return list(iter_boarding_passes(text_or_path))
 
-# Count number of valid "boarding passes" for Part 1.
-max_seat_id = max(v.seat_id for v in data_values)
-print(
-    f'Highest seat ID on a boarding pass for Part 1: {max_seat_id}'
-)
+def part1(data_values):
+    """ Find highest seat ID on a "boarding pass" for Part 1 """
+    return max(v.seat_id for v in data_values)
 
 
 # Part 2: What "boarding passes" are missing in the sequence between the
 # smallest and largest "boarding pass" ids from Part 1?
 
 
-# Find missing "boarding pass" for Part 2.
-min_seat_id = min(v.seat_id for v in data_values)
-missing_seat_id = (
-    set(range(min_seat_id, max_seat_id)) -
-    set(v.seat_id for v in data_values)
-)
-print(
-    f'Missing seat IDs for Part 2: {missing_seat_id}'
-)
+def find_missing_seat_ids(data_values):
+    """ Find seat IDs missing between the smallest and largest seat IDs,
+    in one pass over data_values (which may be a lazy iterator), keeping
+    only the set of seat IDs seen, which is bounded by the number of seats """
+    seat_ids = {v.seat_id for v in data_values}
+    return set(range(min(seat_ids), max(seat_ids))) - seat_ids
+
+def part2(data_values):
+    """ Find (smallest) missing "boarding pass" seat ID for Part 2 """
+    return min(find_missing_seat_ids(data_values))
+
+
+if __name__ == '__main__':
+    # Read "boarding passes" from data file.
+    data_values = parse(input_source('data/day05_binary_boarding-data.txt'))
+
+    # Count number of valid "boarding passes" for Part 1.
+    max_seat_id = part1(data_values)
+    print(
+        f'Highest seat ID on a boarding pass for Part 1: {max_seat_id}'
+    )
+
+    # Find missing "boarding pass" for Part 2.
+    missing_seat_id = find_missing_seat_ids(data_values)
+    print(
+        f'Missing seat IDs for Part 2: {missing_seat_id}'
+    )
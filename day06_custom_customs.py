@@ -1,58 +1,93 @@
 """ Solutions for https://adventofcode.com/2020/day/6 """
 
 # import modules used below.
-from collections import UserDict
+from dataclasses import dataclass
+
+# import local modules used below.
+from common.bitset import from_chars, popcount, to_chars
+from common.inputs import input_source
+from common.parse_cache import cached_parse
+from common.records import iter_records
 
 
 # Part 1: In the provided data file, how many group-wise "yeses" occur?
 
 
 # Create data model for "group responses" in data file.
-class GroupResponses(UserDict):
-    """ Data Model for "question group_responses" from data file """
+@dataclass
+class GroupResponses:
+    """ Data Model for "question group_responses" from data file, with the
+    questions anyone and everyone in the group answered "yes" to stored as
+    bitsets of letters """
+    any_yeses: int = 0
+    all_yeses: int = 0
+    group_size: int = 0
 
-    def __init__(self):
-        super().__init__()
-        self.group_size = 0
+    @classmethod
+    def from_record(cls, record):
+        """ Read group responses from record with one line per person """
+        group_responses = cls()
+        for responses in record.splitlines():
+            group_responses.add_responses(responses.rstrip())
+        return group_responses
 
     def add_responses(self, responses):
         """ Add questions responses for group, and increment group size """
-        for response in responses:
-            self[response] = self.get(response, 0) + 1
+        response_bits = from_chars(responses)
+        self.any_yeses |= response_bits
+        if self.group_size:
+            self.all_yeses &= response_bits
+        else:
+            self.all_yeses = response_bits
         self.group_size += 1
 
+    def __len__(self):
+        return popcount(self.any_yeses)
+
     @property
     def unanimous_yeses(self):
         """ Return questions for which the group unanimously responded """
-        return [q for q in self if self[q] == self.group_size]
-
-# Read "question group_responses" from data file.
-group_responses = []
-current_group = GroupResponses()
-with open('data/day06_custom_customs-data.txt') as fp:
-    for line in fp:
-        if line == '\n':
-            group_responses.append(current_group)
-            current_group = GroupResponses()
-            continue
-        current_group.add_responses(line.rstrip())
-    group_responses.append(current_group)
-
-# Count number of group-wise "yeses" for Part 1.
-number_of_gw_yeses = sum([len(r) for r in group_responses])
-print(f'Number of response groups in data file: {len(group_responses)}')
-print(f'Number of group-wise "yeses" for Part 1: {number_of_gw_yeses}')
+        return list(to_chars(self.all_yeses))
+
+# Read "question group_responses" lazily from text, data file, or lines (e.g.,
+# stdin), so that part1 and part2 can also count them in constant memory.
+def iter_group_responses(source):
+    """ Yield "question group_responses" from text, specified file, or lines
+    """
+    return map(GroupResponses.from_record, iter_records(source))
+
+# Read "question group_responses" from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read "question group_responses" from text or specified file """
+    return list(iter_group_responses(text_or_path))
+
+def part1(group_responses):
+    """ Count number of group-wise "yeses" for Part 1 """
+    return sum(len(r) for r in group_responses)
 
 
 # Part 2: In the provided data file, how many group-wise unanimous "yeses"
 # occur?
 
 
-# Count number of unanimous group-wise "yeses" for Part 2.
-number_of_unanimous_gw_yeses = sum(
-    [len(r.unanimous_yeses) for r in group_responses]
-)
-print(
-    f'Number of unanimous group-wise "yeses" for Part 2: '
-    f'{number_of_unanimous_gw_yeses}'
-)
+def part2(group_responses):
+    """ Count number of unanimous group-wise "yeses" for Part 2 """
+    return sum(popcount(r.all_yeses) for r in group_responses)
+
+
+if __name__ == '__main__':
+    # Read "question group_responses" from data file.
+    group_responses = parse(input_source('data/day06_custom_customs-data.txt'))
+
+    # Count number of group-wise "yeses" for Part 1.
+    number_of_gw_yeses = part1(group_responses)
+    print(f'Number of response groups in data file: {len(group_responses)}')
+    print(f'Number of group-wise "yeses" for Part 1: {number_of_gw_yeses}')
+
+    # Count number of unanimous group-wise "yeses" for Part 2.
+    number_of_unanimous_gw_yeses = part2(group_responses)
+    print(
+        f'Number of unanimous group-wise "yeses" for Part 2: '
+        f'{number_of_unanimous_gw_yeses}'
+    )
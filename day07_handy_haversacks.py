@@ -2,8 +2,14 @@
 
 # import modules used below.
 from collections import UserDict
+from functools import cached_property
 import re
 
+# import local modules used below.
+from common.graph import Digraph
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
+
 
 # Part 1: In the provided data file, how many bag colors can eventually contain
 # at least one shiny gold bag?
@@ -32,60 +38,74 @@ class Rule(UserDict):
                 break
             self[component_parts.group(2)] = int(component_parts.group(1))
 
+    @staticmethod
+    def rule_graph(rule_set):
+        """ Return graph with an edge from each color to each color directly
+        inside it, weighted by count, built once per RuleSet """
+        if isinstance(rule_set, RuleSet):
+            return rule_set.graph
+        return Digraph.from_adjacency(rule_set)
+
     @staticmethod
     def search_for_color(rule_set, target_color):
         """ Search for color in rule set """
-
-        def _reachable(target, current_color):
-            if target in rule_set[current_color]:
-                return True
-
-            reachable = False
-            for color_inside in rule_set[current_color]:
-                reachable = reachable or _reachable(target, color_inside)
-            return reachable
-
-        top_level_colors = set()
-        for color in rule_set:
-            if _reachable(target_color, color):
-                top_level_colors.add(color)
-        return top_level_colors
+        return Rule.rule_graph(rule_set).reachable(target_color, reverse=True)
 
     @staticmethod
     def bag_containment_count(rule_set, starting_color):
         """ Search bags contained within a given color bag """
+        return Rule.rule_graph(rule_set).weighted_path_sum(starting_color)
+
+# Create data model for "bag-containment rules" by color.
+class RuleSet(UserDict):
+    """ Data Model for "bag-containment rules" by color, along with their
+    graph, which is built when first needed and then kept """
+
+    @cached_property
+    def graph(self):
+        """ Return graph with an edge from each color to each color directly
+        inside it, weighted by count """
+        return Digraph.from_adjacency(self)
+
+# Read "bag-containment rules" from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read "bag-containment rules" from text or specified file """
+    return RuleSet({
+        rule.name: rule
+        for rule in [
+            Rule(line.rstrip())
+            for line in read_input(text_or_path).splitlines()
+            if line != ''
+        ]
+    })
 
-        def _search(current_color):
-            if not rule_set[current_color]:
-                return 0
+def part1(rules):
+    """ Count number of bags that can contain shiny gold for Part 1 """
+    return len(Rule.search_for_color(rules, 'shiny gold'))
 
-            return_value = 0
-            for color, count in rule_set[current_color].items():
-                return_value += count * (1 + _search(color))
-            return return_value
 
-        return _search(starting_color)
+# Part 2: How many individual bags are required inside a single shiny gold bag?
 
-# Read "bag-containment rules" from data file.
-with open('data/day07_handy_haversacks-data.txt') as fp:
-    rules = {
-        rule.name: rule
-        for rule in [Rule(line.rstrip()) for line in fp if line != '']
-    }
 
-# Count number of bags that can contain shiny gold for Part 1.
-print(f'Number of bag-containment rules in data file: {len(rules)}')
-print(
-    f'Number of bags that can contain shiny gold bags for Part 1: '
-    f'{len(Rule.search_for_color(rules, "shiny gold"))}'
-)
+def part2(rules):
+    """ Find number of bags within a single shiny gold bag for Part 2 """
+    return Rule.bag_containment_count(rules, 'shiny gold')
 
 
-# Part 2: How many individual bags are required inside a single shiny gold bag?
+if __name__ == '__main__':
+    # Read "bag-containment rules" from data file.
+    rules = parse(input_source('data/day07_handy_haversacks-data.txt'))
 
+    # Count number of bags that can contain shiny gold for Part 1.
+    print(f'Number of bag-containment rules in data file: {len(rules)}')
+    print(
+        f'Number of bags that can contain shiny gold bags for Part 1: '
+        f'{part1(rules)}'
+    )
 
-# Find number of bags within a single shiny gold bag for Part 2.
-print(
-    f'Number of bags contained within a shiny gold bags for Part 2: '
-    f'{Rule.bag_containment_count(rules, "shiny gold")}'
-)
+    # Find number of bags within a single shiny gold bag for Part 2.
+    print(
+        f'Number of bags contained within a shiny gold bags for Part 2: '
+        f'{part2(rules)}'
+    )
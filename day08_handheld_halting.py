@@ -3,6 +3,10 @@
 # import modules used below.
 from collections import UserList
 
+# import local modules used below.
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
+
 
 # Part 1: Immediately before any instruction is executed a second time, what
 # value is in the accumulator?
@@ -62,25 +66,47 @@ class BootCode(UserList):
 
         return accumulator, log, line_number, current_instruction
 
-# Read boot code program from data file.
-boot_code = BootCode.from_file('data/day08_handheld_halting-data.txt')
+# Read boot code program from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read boot code program from text or specified file """
+    return BootCode(
+        line.rstrip() for line in read_input(text_or_path).splitlines()
+    )
 
-# Find accumulator value for Part 1.
-result1, log1 = boot_code.execute_without_looping()
-print(f'Number of boot code lines in data file: {len(boot_code)}')
-print(f'Number of instructions executed for Part 1: {len(log1)}')
-print(f'Value of accumulator value for Part 1: {result1}')
+def part1(boot_code):
+    """ Find accumulator value immediately before looping for Part 1 """
+    accumulator, _ = boot_code.execute_without_looping()
+    return accumulator
 
 
 # Part 2: After fixing the corrupted jmp or nop instruction causing an infinite
 # loop, what value is in the accumulator?
 
 
-# Find accumulator value for Part 2.
-result2, log2, line_no2, instruction2 = boot_code.find_corrupted_instruction()
-print(f'\nNumber of instructions executed for Part 2: {len(log2)}')
-print(
-    f'Corrupted instruction in original boot code found at '
-    f'line {line_no2}: {instruction2}'
-)
-print(f'Value of accumulator value for Part 2: {result2}')
+def part2(boot_code):
+    """ Find accumulator value after fixing corrupted code for Part 2 """
+    accumulator, *_ = boot_code.find_corrupted_instruction()
+    return accumulator
+
+
+if __name__ == '__main__':
+    # Read boot code program from data file.
+    boot_code = parse(input_source('data/day08_handheld_halting-data.txt'))
+
+    # Find accumulator value for Part 1.
+    result1, log1 = boot_code.execute_without_looping()
+    print(f'Number of boot code lines in data file: {len(boot_code)}')
+    print(f'Number of instructions executed for Part 1: {len(log1)}')
+    print(f'Value of accumulator value for Part 1: {result1}')
+
+    # Find accumulator value for Part 2.
+    result2, log2, line_no2, instruction2 = (
+        boot_code.find_corrupted_instruction()
+    )
+    print(f'\nNumber of instructions executed for Part 2: {len(log2)}')
+    print(
+        f'Corrupted instruction in original boot code found at '
+        f'line {line_no2}: {instruction2}'
+    )
+    print(f'Value of accumulator value for Part 2: {result2}')
@@ -1,7 +1,16 @@
 """ Solutions for https://adventofcode.com/2020/day/9 """
 
 # import modules used below.
-from collections import UserList
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from common.columns import read_int_values
+from common.inputs import input_source
+from common.parse_cache import cached_parse
 
 
 # Part 1: What is the first number, excluding the first 25 in the data file,
@@ -9,20 +18,40 @@ from collections import UserList
 
 
 # Create data model for cypher data in data file.
-class CypherData(UserList):
-    """ Data Model for cypher data from data file """
+@dataclass(eq=False)
+class CypherData:
+    """ Data Model for cypher data from data file, stored as int64 array """
+    values: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64)
+    )
+
+    def __post_init__(self):
+        self.values = np.asarray(
+            self.values if hasattr(self.values, '__len__')
+            else list(self.values),
+            dtype=np.int64,
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values.tolist())
+
+    def __getitem__(self, index):
+        return self.values[index]
 
     @classmethod
     def from_file(cls, file_path):
-        """ Read cypher data from specified file """
-        with open(file_path) as fp:
-            return cls(int(line.rstrip()) for line in fp)
+        """ Read cypher data from specified text or int64 column file """
+        return cls(read_int_values(Path(file_path)))
 
     def find_encryption_flaw_for_part1(self, preamble_length):
         """ Find encryption flaw for Part 1 """
-        for line_number in range(preamble_length+1, len(self)+1):
-            target_value = self[line_number-1]
-            evaluation_window = self[
+        values = self.values.tolist()
+        for line_number in range(preamble_length+1, len(values)+1):
+            target_value = values[line_number-1]
+            evaluation_window = values[
                 line_number-preamble_length-1:line_number-1
             ]
             differences_from_target_value = {
@@ -39,33 +68,59 @@ class CypherData(UserList):
     def find_encryption_weakness_for_part2(self, preamble_length):
         """ Find encryption weakness for Part 2 """
         _, target_value = self.find_encryption_flaw_for_part1(preamble_length)
+
+        # Sum all windows of each length at once as differences of prefix
+        # sums, taking the earliest window of the shortest length.
+        prefix_sums = np.concatenate(([0], np.cumsum(self.values)))
         for window_length in range(2, len(self)):
-            for position in range(len(self)-window_length+1):
-                values_window = self[position:position+window_length]
-                if sum(values_window) == target_value:
-                    return values_window
+            window_sums = (
+                prefix_sums[window_length:] - prefix_sums[:-window_length]
+            )
+            if len(positions := np.flatnonzero(window_sums == target_value)):
+                position = positions[0]
+                return self.values[position:position+window_length].tolist()
         return None
 
-# Read cypher data from data file.
-cypher_data = CypherData.from_file('data/day09_encoding_error-data.txt')
+# Read cypher data from text, data file, or int64 column file.
+@cached_parse
+def parse(text_or_path):
+    """ Read cypher data from text or specified file """
+    return CypherData(read_int_values(text_or_path))
 
-# Find encryption flaw in cypher data for Part 1.
-line_in_file, flaw = cypher_data.find_encryption_flaw_for_part1(25)
-print(f'Number of cypher values in data file: {len(cypher_data)}')
-print(f'Line number in file of encryption flaw for Part 1: {line_in_file}')
-print(f'Value of encryption flaw for Part 1: {flaw}')
+def part1(cypher_data):
+    """ Find value of encryption flaw for Part 1 """
+    _, flaw = cypher_data.find_encryption_flaw_for_part1(25)
+    return flaw
 
 
 # Part 2: What sequence of consecutive values in the data file add up to the
 # result obtained in Part 1?
 
 
-# Find encryption weakness in cypher data for Part 2.
-weak_sequence = cypher_data.find_encryption_weakness_for_part2(25)
-min_value = min(weak_sequence)
-max_value = max(weak_sequence)
-print(f'\nLength of weakness sequence for Part 2: {len(weak_sequence)}')
-print(f'Minimum value of weakness sequence for Part 2: {len(weak_sequence)}')
-print(f'Minimum value of weakness sequence for Part 2: {min_value}')
-print(f'Maximum value of weakness sequence for Part 2: {max_value}')
-print(f'Sum of min and max value for Part 2: {min_value + max_value}')
+def part2(cypher_data):
+    """ Find sum of min and max value of weakness sequence for Part 2 """
+    weak_sequence = cypher_data.find_encryption_weakness_for_part2(25)
+    return min(weak_sequence) + max(weak_sequence)
+
+
+if __name__ == '__main__':
+    # Read cypher data from data file.
+    cypher_data = parse(input_source('data/day09_encoding_error-data.txt'))
+
+    # Find encryption flaw in cypher data for Part 1.
+    line_in_file, flaw = cypher_data.find_encryption_flaw_for_part1(25)
+    print(f'Number of cypher values in data file: {len(cypher_data)}')
+    print(f'Line number in file of encryption flaw for Part 1: {line_in_file}')
+    print(f'Value of encryption flaw for Part 1: {flaw}')
+
+    # Find encryption weakness in cypher data for Part 2.
+    weak_sequence = cypher_data.find_encryption_weakness_for_part2(25)
+    min_value = min(weak_sequence)
+    max_value = max(weak_sequence)
+    print(f'\nLength of weakness sequence for Part 2: {len(weak_sequence)}')
+    print(
+        f'Minimum value of weakness sequence for Part 2: {len(weak_sequence)}'
+    )
+    print(f'Minimum value of weakness sequence for Part 2: {min_value}')
+    print(f'Maximum value of weakness sequence for Part 2: {max_value}')
+    print(f'Sum of min and max value for Part 2: {min_value + max_value}')
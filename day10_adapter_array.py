@@ -1,9 +1,19 @@
 """ Solutions for https://adventofcode.com/2020/day/10 """
 
 # import modules used below.
-from collections import Counter, UserList
+from collections import Counter
+from dataclasses import dataclass, field
 from itertools import chain, combinations
 from math import prod
+from pathlib import Path
+
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from common.columns import read_int_values
+from common.inputs import input_source
+from common.parse_cache import cached_parse
 
 
 # Part 1: What is the number of 1-jolt differences multiplied by the number of
@@ -11,30 +21,52 @@ from math import prod
 
 
 # Create data model for output "joltages" in data file.
-class OutputJoltages(UserList):
-    """ Data Model for output joltages from data file """
+@dataclass(eq=False)
+class OutputJoltages:
+    """ Data Model for output joltages from data file, stored as int64 array
+    """
+    values: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64)
+    )
+
+    def __post_init__(self):
+        self.values = np.asarray(
+            self.values if hasattr(self.values, '__len__')
+            else list(self.values),
+            dtype=np.int64,
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values.tolist())
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    @classmethod
+    def from_values(cls, values_in_file):
+        """ Return output joltages for values, adding min/max """
+        return cls(np.concatenate(
+            ([0], values_in_file, [values_in_file.max()+3])
+        ))
 
     @classmethod
     def from_file(cls, file_path):
-        """ Read output joltages from specified file and add min/max """
-        with open(file_path) as fp:
-            values_in_file = [int(line.rstrip()) for line in fp]
-            return cls(chain([0], values_in_file, [max(values_in_file)+3]))
+        """ Read output joltages from specified text or int64 column file and
+        add min/max """
+        return cls.from_values(read_int_values(Path(file_path)))
 
     def sorted_pairwise_differences(self, joltages=None):
         """ Find sorted pairwise differences for Part 1 """
         if joltages is None:
-            joltages = self
-        sorted_data_values = sorted(joltages)
-        pairwise_differences = [
-            sorted_data_values[i] - sorted_data_values[i-1]
-            for i in range(1, len(joltages))
-        ]
-        return pairwise_differences
+            joltages = self.values
+        return np.diff(np.sort(np.fromiter(joltages, dtype=np.int64)))
 
     def partition_into_valid_joltage_subsequences(self):
         """ Find all possible joltage subsequences for Part 2 """
-        sorted_data_values = sorted(self)
+        sorted_data_values = np.sort(self.values).tolist()
         joltage_diffs = self.sorted_pairwise_differences()
         data_partitions = {}
         partition_lower_bound_index = 0
@@ -63,27 +95,52 @@ class OutputJoltages(UserList):
                     data_partitions[partition].append(partition_subset)
         return data_partitions
 
-# Read "joltage" values from data file.
-output_joltages = OutputJoltages.from_file('data/day10_adapter_array-data.txt')
+# Read "joltage" values from text, data file, or int64 column file.
+@cached_parse
+def parse(text_or_path):
+    """ Read output joltages from text or specified file and add min/max """
+    return OutputJoltages.from_values(read_int_values(text_or_path))
 
-# Find "joltages" differences for Part 1.
-diffs = output_joltages.sorted_pairwise_differences()
-counts = Counter(diffs)
-print(f'Number of joltages values in data file: {len(output_joltages)}')
-print(f'Number of differences of 1 for Part 1: {counts[1]}')
-print(f'Number of differences of 3 for Part 1: {counts[3]}')
-print(f'Product for Part 1: {counts[1]}*{counts[3]}={counts[1]*counts[3]}')
+def part1(output_joltages):
+    """ Find product of numbers of 1- and 3-jolt differences for Part 1 """
+    differences = output_joltages.sorted_pairwise_differences()
+    return int(
+        np.count_nonzero(differences == 1) *
+        np.count_nonzero(differences == 3)
+    )
 
 
 # Part 2: What is the total number of valid "joltage" sequences?
 
 
-# Find total number of valid "joltage" sequences for Part 2.
-partitions = output_joltages.partition_into_valid_joltage_subsequences()
-number_of_sequences = prod(
-    len(v) for v in partitions.values() if len(v) != 0
-)
-print(f'\nLength of partitions for Part 2: {len(partitions)}')
-print(f'Minimum partition length for Part 2: {min(partitions)}')
-print(f'Maximum partition length for Part 2: {max(partitions)}')
-print(f'Number of sequences for Part 2: {number_of_sequences}')
+def part2(output_joltages):
+    """ Find total number of valid "joltage" sequences for Part 2 """
+    partitions = output_joltages.partition_into_valid_joltage_subsequences()
+    return prod(
+        len(v) for v in partitions.values() if len(v) != 0
+    )
+
+
+if __name__ == '__main__':
+    # Read "joltage" values from data file.
+    output_joltages = parse(input_source('data/day10_adapter_array-data.txt'))
+
+    # Find "joltages" differences for Part 1.
+    diffs = output_joltages.sorted_pairwise_differences()
+    counts = Counter(diffs)
+    print(f'Number of joltages values in data file: {len(output_joltages)}')
+    print(f'Number of differences of 1 for Part 1: {counts[1]}')
+    print(f'Number of differences of 3 for Part 1: {counts[3]}')
+    print(
+        f'Product for Part 1: {counts[1]}*{counts[3]}={counts[1]*counts[3]}'
+    )
+
+    # Find total number of valid "joltage" sequences for Part 2.
+    partitions = output_joltages.partition_into_valid_joltage_subsequences()
+    number_of_sequences = prod(
+        len(v) for v in partitions.values() if len(v) != 0
+    )
+    print(f'\nLength of partitions for Part 2: {len(partitions)}')
+    print(f'Minimum partition length for Part 2: {min(partitions)}')
+    print(f'Maximum partition length for Part 2: {max(partitions)}')
+    print(f'Number of sequences for Part 2: {number_of_sequences}')
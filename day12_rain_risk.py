@@ -1,9 +1,12 @@
 """ Solutions for https://adventofcode.com/2020/day/12 """
 
 # import modules used below.
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from math import cos, radians, sin
-from typing import List, Tuple
+
+# import local modules used below.
+from common.inputs import input_source, iter_lines
+from common.parse_cache import cached_parse
 
 
 # Part 1: Using the provided data file and the movement rules for Part 1, what
@@ -18,10 +21,8 @@ class ShipPosition:
     ship_x: int = 0
     ship_y: int = 0
     ship_theta: int = 0
-    movements_for_part1: List[Tuple[str, str]] = field(default_factory=list)
     waypoint_x: int = 10
     waypoint_y: int = 1
-    movements_for_part2: List[Tuple[str, str]] = field(default_factory=list)
 
     def move_for_part1(self, cmd, arg):
         """ Apply movement rules for Part 1 """
@@ -42,7 +43,6 @@ class ShipPosition:
         elif cmd == 'F':
             self.ship_x += round(arg * cos(radians(self.ship_theta)))
             self.ship_y += round(arg * sin(radians(self.ship_theta)))
-        self.movements_for_part1.append((cmd, arg))
 
     def move_for_part2(self, cmd, arg):
         """ Apply movement rules for Part 2 """
@@ -79,30 +79,33 @@ class ShipPosition:
         elif cmd == 'F':
             self.ship_x += arg * self.waypoint_x
             self.ship_y += arg * self.waypoint_y
-        self.movements_for_part2.append((cmd, arg))
 
     def manhattan_distance_from(self, x, y):
         """ Calculate Manhattan distance from self """
         return int(abs(self.ship_x - x) + abs(self.ship_y - y))
 
-# Read ship movement rules from data file.
-with open('data/day12_rain_risk-data.txt') as fp:
-    ship_movements = [line.rstrip() for line in fp]
-
-# Find ship position1 after applying movement rules for Part 1.
-position1 = ShipPosition()
-for m in ship_movements:
-    position1.move_for_part1(m[0], int(m[1:]))
-print(f'Number of ship movements in data file: {len(ship_movements)}')
-print(
-    f'Position of ship after movements for Part 1: '
-    f'({position1.ship_x}, {position1.ship_y})'
-)
-print(f'Direction of ship after movements for Part 1: {position1.ship_theta}')
-print(
-    f'Manhattan distance from origin for Part 1: '
-    f'{position1.manhattan_distance_from(0, 0)}'
-)
+# Read ship movement rules lazily from text, data file, or lines (e.g.,
+# stdin), so that part1 and part2 can also apply them in constant memory.
+def iter_ship_movements(source):
+    """ Yield ship movement commands and arguments from text, specified
+    file, or lines """
+    return (
+        (line[0], int(line[1:].rstrip()))
+        for line in iter_lines(source) if line.strip()
+    )
+
+# Read ship movement rules from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read ship movement commands and arguments from text or file """
+    return list(iter_ship_movements(text_or_path))
+
+def part1(ship_movements):
+    """ Find Manhattan distance after movements for Part 1 """
+    position = ShipPosition()
+    for cmd, arg in ship_movements:
+        position.move_for_part1(cmd, arg)
+    return position.manhattan_distance_from(0, 0)
 
 
 # Part 2: Using the provided data file and the movement rules for Part 2, what
@@ -110,19 +113,49 @@ print(
 # ship's starting position1?
 
 
-# Find ship position1 after applying movement rules for Part 2.
-position2 = ShipPosition()
-for m in ship_movements:
-    position2.move_for_part2(m[0], int(m[1:]))
-print(
-    f'\nPosition of ship after movements for Part 2: '
-    f'({position2.ship_x}, {position2.ship_y})'
-)
-print(
-    f'Relative position of waypoint after movements for Part 2: '
-    f'({position2.waypoint_x}, {position2.waypoint_y})'
-)
-print(
-    f'Manhattan distance from origin for Part 2: '
-    f'{position2.manhattan_distance_from(0, 0)}'
-)
+def part2(ship_movements):
+    """ Find Manhattan distance after movements for Part 2 """
+    position = ShipPosition()
+    for cmd, arg in ship_movements:
+        position.move_for_part2(cmd, arg)
+    return position.manhattan_distance_from(0, 0)
+
+
+if __name__ == '__main__':
+    # Read ship movement rules from data file.
+    ship_movements = parse(input_source('data/day12_rain_risk-data.txt'))
+
+    # Find ship position1 after applying movement rules for Part 1.
+    position1 = ShipPosition()
+    for cmd, arg in ship_movements:
+        position1.move_for_part1(cmd, arg)
+    print(f'Number of ship movements in data file: {len(ship_movements)}')
+    print(
+        f'Position of ship after movements for Part 1: '
+        f'({position1.ship_x}, {position1.ship_y})'
+    )
+    print(
+        f'Direction of ship after movements for Part 1: '
+        f'{position1.ship_theta}'
+    )
+    print(
+        f'Manhattan distance from origin for Part 1: '
+        f'{position1.manhattan_distance_from(0, 0)}'
+    )
+
+    # Find ship position1 after applying movement rules for Part 2.
+    position2 = ShipPosition()
+    for cmd, arg in ship_movements:
+        position2.move_for_part2(cmd, arg)
+    print(
+        f'\nPosition of ship after movements for Part 2: '
+        f'({position2.ship_x}, {position2.ship_y})'
+    )
+    print(
+        f'Relative position of waypoint after movements for Part 2: '
+        f'({position2.waypoint_x}, {position2.waypoint_y})'
+    )
+    print(
+        f'Manhattan distance from origin for Part 2: '
+        f'{position2.manhattan_distance_from(0, 0)}'
+    )
@@ -2,16 +2,27 @@
 
 # import standard library modules used below.
 from collections import UserList
-from math import floor
+from math import floor, prod
 
-# import third-party modules used below.
-from sympy.ntheory.modular import crt
+# import local modules used below.
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
 
 
 # Part 1: In the provided data file, what is the ID of the earliest bus to the
 # airport multiplied by the number of minutes waiting?
 
 
+def solve_congruences(moduli, remainders):
+    """ Return least non-negative solution of x = remainder (mod modulus)
+    for pairwise coprime moduli using the Chinese Remainder Theorem """
+    moduli_product = prod(moduli)
+    solution = 0
+    for modulus, remainder in zip(moduli, remainders):
+        cofactor = moduli_product // modulus
+        solution += remainder * cofactor * pow(cofactor, -1, modulus)
+    return solution % moduli_product
+
 # Create data model for output "bus schedule" in data file.
 class BusSchedule(UserList):
     """ Data Model for bus schedule from data file """
@@ -39,39 +50,72 @@ class BusSchedule(UserList):
             if bus.isdigit():
                 moduli.append(int(bus))
                 congruences.append(-1*i)
-        return crt(moduli, congruences, check=False)[0]
-
-# Read waiting start time and "bus schedule" values from data file.
-with open('data/day13_shuttle_search-data.txt') as fp:
-    waiting_start_time = int(fp.readline().rstrip())
-    bus_schedule = BusSchedule.from_str(fp.readline().rstrip())
-
-# Find wait time and bus taken for Part 1.
-bus_options = bus_schedule.find_next_departure_times_from(waiting_start_time)
-departure_time = min(bus_options.values())
-wait_time = departure_time - waiting_start_time
-bus_taken = dict(map(reversed, bus_options.items()))[departure_time]
-print(
-    f'Number of in-service buses in data file: '
-    f'{len([v for v in bus_schedule if v != "x"])}'
-)
-print(f'Bus taken for Part 1: {bus_taken}')
-print(f'Earliest bus departure time for Part 1: {departure_time}')
-print(
-    f'Total wait time for Part 1: '
-    f'{departure_time}-{waiting_start_time}={wait_time}')
-print(
-    f'Request product for for Part 1: '
-    f'{int(bus_taken)}*{wait_time}={int(bus_taken)*wait_time}'
-)
+        return solve_congruences(moduli, congruences)
+
+# Read waiting start time and "bus schedule" values from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read waiting start time and bus schedule from text or file """
+    lines = read_input(text_or_path).splitlines()
+    waiting_start_time = int(lines[0].rstrip())
+    bus_schedule = BusSchedule.from_str(lines[1].rstrip())
+    return waiting_start_time, bus_schedule
+
+def find_bus_taken(waiting_start_time, bus_schedule):
+    """ Find earliest bus taken and its departure time """
+    bus_options = bus_schedule.find_next_departure_times_from(
+        waiting_start_time
+    )
+    departure_time = min(bus_options.values())
+    bus_taken = dict(map(reversed, bus_options.items()))[departure_time]
+    return bus_taken, departure_time
+
+def part1(notes):
+    """ Find product of bus taken and total wait time for Part 1 """
+    waiting_start_time, bus_schedule = notes
+    bus_taken, departure_time = find_bus_taken(
+        waiting_start_time, bus_schedule
+    )
+    return int(bus_taken) * (departure_time - waiting_start_time)
 
 
 # Part 2: What is the earliest timestamp such that all of the listed bus IDs
 # depart at offsets matching their positions in the list?
 
 
-# Find timestamp for Part 2.
-print(
-    f'Request timestamp for for Part 2: '
-    f'{bus_schedule.find_departure_time_for_part2()}'
-)
+def part2(notes):
+    """ Find earliest timestamp with buses at matching offsets for Part 2 """
+    _, bus_schedule = notes
+    return int(bus_schedule.find_departure_time_for_part2())
+
+
+if __name__ == '__main__':
+    # Read waiting start time and "bus schedule" values from data file.
+    waiting_start_time, bus_schedule = parse(
+        input_source('data/day13_shuttle_search-data.txt')
+    )
+
+    # Find wait time and bus taken for Part 1.
+    bus_taken, departure_time = find_bus_taken(
+        waiting_start_time, bus_schedule
+    )
+    wait_time = departure_time - waiting_start_time
+    print(
+        f'Number of in-service buses in data file: '
+        f'{len([v for v in bus_schedule if v != "x"])}'
+    )
+    print(f'Bus taken for Part 1: {bus_taken}')
+    print(f'Earliest bus departure time for Part 1: {departure_time}')
+    print(
+        f'Total wait time for Part 1: '
+        f'{departure_time}-{waiting_start_time}={wait_time}')
+    print(
+        f'Request product for for Part 1: '
+        f'{int(bus_taken)}*{wait_time}={int(bus_taken)*wait_time}'
+    )
+
+    # Find timestamp for Part 2.
+    print(
+        f'Request timestamp for for Part 2: '
+        f'{bus_schedule.find_departure_time_for_part2()}'
+    )
@@ -4,6 +4,10 @@
 from collections import defaultdict
 from copy import deepcopy
 
+# import local modules used below.
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
+
 
 # Part 1: Following the rules for the described memory game using the starting
 # values in the provided data file, what will be the 2020th number spoken?
@@ -42,32 +46,50 @@ class MemoryGameSequence:
 
         return self._sequence[n-1]
 
-# Read starting values from data file.
-memory_game_sequence = MemoryGameSequence.from_file(
-    'data/day15_rambunctious_recitation-data.txt'
-)
+# Read starting values from text or data file.
+@cached_parse
+def parse(text_or_path, dlm=','):
+    """ Read starting values from text or specified file """
+    return [
+        int(v) for v in read_input(text_or_path).splitlines()[0].split(dlm)
+    ]
 
-# Find 2020th memory game sequence value for Part 1.
-value_for_2020 = memory_game_sequence[2020]
-print(
-    f'Number of starting values read from data file: '
-    f'{len(memory_game_sequence.starting_values)}'
-)
-print(f'2020th memory game sequence value: {value_for_2020}')
-print(
-    f'Turns 2020th memory game sequence value occurred: '
-    f'{memory_game_sequence.number_usage[value_for_2020]}'
-)
+def part1(starting_values):
+    """ Find 2020th memory game sequence value for Part 1 """
+    return MemoryGameSequence(starting_values)[2020]
 
 
 # Part 2: Following the rules for the described memory game using the starting
 # values in the provided data file, what will be the 30000000th number spoken?
 
 
-# Find 30000000th memory game sequence value for Part 2.
-value_for_30000000 = memory_game_sequence[30000000]
-print(f'\n30000000th memory game sequence value: {value_for_30000000}')
-print(
-    f'Turns 30000000th memory game sequence value occurred: '
-    f'{memory_game_sequence.number_usage[value_for_30000000]}'
-)
+def part2(starting_values):
+    """ Find 30000000th memory game sequence value for Part 2 """
+    return MemoryGameSequence(starting_values)[30000000]
+
+
+if __name__ == '__main__':
+    # Read starting values from data file.
+    memory_game_sequence = MemoryGameSequence(
+        parse(input_source('data/day15_rambunctious_recitation-data.txt'))
+    )
+
+    # Find 2020th memory game sequence value for Part 1.
+    value_for_2020 = memory_game_sequence[2020]
+    print(
+        f'Number of starting values read from data file: '
+        f'{len(memory_game_sequence.starting_values)}'
+    )
+    print(f'2020th memory game sequence value: {value_for_2020}')
+    print(
+        f'Turns 2020th memory game sequence value occurred: '
+        f'{memory_game_sequence.number_usage[value_for_2020]}'
+    )
+
+    # Find 30000000th memory game sequence value for Part 2.
+    value_for_30000000 = memory_game_sequence[30000000]
+    print(f'\n30000000th memory game sequence value: {value_for_30000000}')
+    print(
+        f'Turns 30000000th memory game sequence value occurred: '
+        f'{memory_game_sequence.number_usage[value_for_30000000]}'
+    )
@@ -1,11 +1,18 @@
 """ Solutions for https://adventofcode.com/2020/day/16 """
 
 # import standard library modules used below.
-from collections import defaultdict, UserList
+from collections import UserList
+from dataclasses import dataclass, field
 from itertools import chain
 from math import prod
 import re
 
+# import local modules used below.
+from common.graph import perfect_matching
+from common.inputs import input_source
+from common.parse_cache import cached_parse
+from common.records import iter_records
+
 
 # Part 1: Considering just the "nearby tickets" and the validation rules for
 # ticket fields in the provided data file, what is ticket scanning error rate
@@ -16,25 +23,11 @@ import re
 class Ticket(UserList):
     """ Data Model for tickets with validation rules for ticket fields """
 
-    validation_rule_regex = re.compile(
-        r'^([\w ]+): ([0-9]+)-([0-9]+) or ([0-9]+)-([0-9]+)'
-    )
-    validation_rules = {}
-
-    @classmethod
-    def add_validation_rule(cls, rule_str):
-        """ Add new validation rule for ticket fields """
-        rule_components = cls.validation_rule_regex.search(rule_str)
-        rule_name = rule_components.group(1)
-        rule_group1_lb = int(rule_components.group(2))
-        rule_group1_ub = int(rule_components.group(3))
-        rule_group2_lb = int(rule_components.group(4))
-        rule_group2_ub = int(rule_components.group(5))
-        rule_value_set = (
-            set(range(rule_group1_lb, rule_group1_ub+1)) |
-            set(range(rule_group2_lb, rule_group2_ub+1))
+    def __init__(self, initlist=None, validation_rules=None):
+        super().__init__(initlist)
+        self.validation_rules = (
+            {} if validation_rules is None else validation_rules
         )
-        cls.validation_rules[rule_name] = rule_value_set
 
     @property
     def invalid_values(self):
@@ -58,78 +51,131 @@ class Ticket(UserList):
         """ Return boolean indicating whether ticket has invalid values """
         return bool(self.invalid_values)
 
-# Read validation rules and tickets from data file.
-with open('data/day16_ticket_translation-data.txt') as fp:
-    while (line := fp.readline().rstrip()) != '':
-        Ticket.add_validation_rule(line)
-    if line := fp.readline().rstrip() == 'your ticket:':
-        your_ticket = Ticket(int(v) for v in fp.readline().rstrip().split(','))
-    if line := fp.readline().rstrip() == '':
-        pass
-    nearby_tickets = []
-    if line := fp.readline().rstrip() == 'nearby tickets:':
-        for line in fp:
-            nearby_tickets.append(
-                Ticket(int(v) for v in line.rstrip().split(','))
+# Create data model for notes with validation rules and "tickets".
+@dataclass
+class TicketNotes:
+    """ Data Model for validation rules, your ticket, and nearby tickets """
+    validation_rules: dict = field(default_factory=dict)
+    your_ticket: Ticket = None
+    nearby_tickets: list = field(default_factory=list)
+
+    validation_rule_regex = re.compile(
+        r'^([\w ]+): ([0-9]+)-([0-9]+) or ([0-9]+)-([0-9]+)'
+    )
+
+    def add_validation_rule(self, rule_str):
+        """ Add new validation rule for ticket fields """
+        rule_components = self.validation_rule_regex.search(rule_str)
+        rule_name = rule_components.group(1)
+        rule_group1_lb = int(rule_components.group(2))
+        rule_group1_ub = int(rule_components.group(3))
+        rule_group2_lb = int(rule_components.group(4))
+        rule_group2_ub = int(rule_components.group(5))
+        rule_value_set = (
+            set(range(rule_group1_lb, rule_group1_ub+1)) |
+            set(range(rule_group2_lb, rule_group2_ub+1))
+        )
+        self.validation_rules[rule_name] = rule_value_set
+
+    def ticket_from_str(self, ticket_str, dlm=','):
+        """ Return ticket sharing the validation rules in self """
+        return Ticket(
+            (int(v) for v in ticket_str.rstrip().split(dlm)),
+            self.validation_rules
+        )
+
+    def find_field_positions(self):
+        """ Impute "validation rule" order using valid nearby tickets, as a
+        perfect matching of positions to rules their values all satisfy """
+        valid_tickets = [
+            ticket for ticket in self.nearby_tickets if ticket.is_valid
+        ]
+        ticket_length = len(valid_tickets[0])
+        candidate_fields = {}
+        for field_position in range(0, ticket_length):
+            ticket_values_at_position = set(
+                ticket[field_position] for ticket in valid_tickets
             )
+            candidate_fields[field_position] = [
+                name
+                for name, rule_values in self.validation_rules.items()
+                if ticket_values_at_position <= rule_values
+            ]
+        return perfect_matching(candidate_fields)
+
+# Read validation rules and tickets from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read validation rules and tickets from text or specified file """
+    ticket_notes = TicketNotes()
+    rules, your_ticket, nearby_tickets = iter_records(text_or_path)
+    for line in rules.splitlines():
+        ticket_notes.add_validation_rule(line.rstrip())
+    header, line = your_ticket.splitlines()
+    if header.rstrip() == 'your ticket:':
+        ticket_notes.your_ticket = ticket_notes.ticket_from_str(line)
+    header, *lines = nearby_tickets.splitlines()
+    if header.rstrip() == 'nearby tickets:':
+        for line in lines:
+            ticket_notes.nearby_tickets.append(
+                ticket_notes.ticket_from_str(line)
+            )
+    return ticket_notes
 
-# Find ticket scanning error rate for nearby "tickets" for Part 1.
-print(
-    f'Number of validation rules in data file: '
-    f'{len(Ticket.validation_rules)}'
-)
-print(f'Number of nearby tickets in data file: {len(nearby_tickets)}')
-print(
-    f'Number of invalid nearby tickets for Part 1: '
-    f'{sum(ticket.is_invalid for ticket in nearby_tickets)}'
-)
-print(
-    f'Ticket scanning error rate for Part 1: '
-    f'{sum(chain.from_iterable(t.invalid_values for t in nearby_tickets))}'
-)
+def part1(ticket_notes):
+    """ Find ticket scanning error rate for nearby "tickets" for Part 1 """
+    return sum(
+        chain.from_iterable(
+            t.invalid_values for t in ticket_notes.nearby_tickets
+        )
+    )
 
 
 # Part 2: After determining "ticket field" order, what is the product of the
 # values on your "ticket" that start with the word "departure"?
 
 
-# Impute "validation rule" order.
-valid_tickets = [ticket for ticket in nearby_tickets if ticket.is_valid]
-ticket_length = len(valid_tickets[0])
-ticket_field_positions = defaultdict(list)
-for field_position in range(0, ticket_length):
-    ticket_values_at_position = set(
-        ticket[field_position] for ticket in valid_tickets
-    )
-    for name, rule_values in Ticket.validation_rules.items():
-        if all(value in rule_values for value in ticket_values_at_position):
-            ticket_field_positions[field_position].append(name)
-while max((len(value) for value in ticket_field_positions.values())) > 1:
-    singleton_fields = [
-        fields[0]
-        for fields
-        in ticket_field_positions.values()
-        if len(fields) == 1
+def find_departure_field_values(ticket_notes):
+    """ Find values of "departure" fields in "your ticket" """
+    ticket_field_positions = ticket_notes.find_field_positions()
+    return [
+        value
+        for position, value
+        in enumerate(ticket_notes.your_ticket)
+        if 'departure' in ticket_field_positions[position]
     ]
-    for position, fields_set in ticket_field_positions.items():
-        if len(fields_set) == 1:
-            continue
-        for field in singleton_fields:
-            if field in fields_set:
-                ticket_field_positions[position].remove(field)
-
-# Find product of "departure" fields in "your ticket" for Part 2.
-departure_field_values = [
-    value
-    for position, value
-    in enumerate(your_ticket)
-    if 'departure' in ticket_field_positions[position][0]
-]
-print(
-    f'\nDeparture fields in your ticket for Part 2: '
-    f'{departure_field_values}'
-)
-print(
-    f'Product of departure field values for Part 2: '
-    f'{prod(departure_field_values)}'
-)
+
+def part2(ticket_notes):
+    """ Find product of "departure" fields in "your ticket" for Part 2 """
+    return prod(find_departure_field_values(ticket_notes))
+
+
+if __name__ == '__main__':
+    # Read validation rules and tickets from data file.
+    ticket_notes = parse(
+        input_source('data/day16_ticket_translation-data.txt')
+    )
+    nearby_tickets = ticket_notes.nearby_tickets
+
+    # Find ticket scanning error rate for nearby "tickets" for Part 1.
+    print(
+        f'Number of validation rules in data file: '
+        f'{len(ticket_notes.validation_rules)}'
+    )
+    print(f'Number of nearby tickets in data file: {len(nearby_tickets)}')
+    print(
+        f'Number of invalid nearby tickets for Part 1: '
+        f'{sum(ticket.is_invalid for ticket in nearby_tickets)}'
+    )
+    print(f'Ticket scanning error rate for Part 1: {part1(ticket_notes)}')
+
+    # Find product of "departure" fields in "your ticket" for Part 2.
+    departure_field_values = find_departure_field_values(ticket_notes)
+    print(
+        f'\nDeparture fields in your ticket for Part 2: '
+        f'{departure_field_values}'
+    )
+    print(
+        f'Product of departure field values for Part 2: '
+        f'{prod(departure_field_values)}'
+    )
@@ -4,6 +4,10 @@
 from collections import UserString
 from itertools import chain
 
+# import local modules used below.
+from common.inputs import input_source, iter_lines
+from common.parse_cache import cached_parse
+
 
 # Part 1: After evaluating each arithmetic expression in the provided data
 # file, with + and * having the same level of operator precedence, what is the
@@ -97,29 +101,26 @@ class ArithmeticExpression(UserString):
 
         return evaluate(self.tokenized)
 
-# Read and evaluate arithmetic expressions from data file for Part 1.
-expressions = []
-evaluations1 = []
-with open('data/day18_operation_order-data.txt') as fp:
-    for line in fp:
-        expressions.append(
-            ArithmeticExpression(line.rstrip())
-        )
-        evaluations1.append(
-            ArithmeticExpression(line.rstrip()).evaluate_using_precedence(
-                {1: {'+', '*'}}
-            )
-        )
+# Read arithmetic expressions lazily from text, data file, or lines (e.g.,
+# stdin), so that part1 and part2 can also evaluate them in constant memory.
+def iter_expressions(source):
+    """ Yield arithmetic expressions from text, specified file, or lines """
+    return (
+        ArithmeticExpression(line.rstrip())
+        for line in iter_lines(source) if line.strip()
+    )
 
-# Find sum of evaluated arithmetic expressions for Part 1.
-print(
-    f'Number of arithmetic expressions in data file: '
-    f'{len(expressions)}'
-)
-print(
-    f'Sum of evaluated arithmetic expressions for Part 1: '
-    f'{sum(evaluations1)}'
-)
+# Read arithmetic expressions from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read arithmetic expressions from text or specified file """
+    return list(iter_expressions(text_or_path))
+
+def part1(expressions):
+    """ Find sum of expressions evaluated using rules for Part 1 """
+    return sum(
+        exp.evaluate_using_precedence({1: {'+', '*'}}) for exp in expressions
+    )
 
 
 # Part 2: After evaluating each arithmetic expression in the provided data
@@ -127,13 +128,30 @@ print(
 # resulting values?
 
 
-# Read arithmetic expressions from data file for Part 2.
-evaluations2 = []
-for exp in expressions:
-    evaluations2.append(exp.evaluate_using_precedence({1: {'+'}, 2: {'*'}}))
-
-# Find sum of evaluated arithmetic expressions for Part 2.
-print(
-    f'Sum of evaluated arithmetic expressions for Part 2: '
-    f'{sum(evaluations2)}'
-)
+def part2(expressions):
+    """ Find sum of expressions evaluated using rules for Part 2 """
+    return sum(
+        exp.evaluate_using_precedence({1: {'+'}, 2: {'*'}})
+        for exp in expressions
+    )
+
+
+if __name__ == '__main__':
+    # Read arithmetic expressions from data file.
+    expressions = parse(input_source('data/day18_operation_order-data.txt'))
+
+    # Find sum of evaluated arithmetic expressions for Part 1.
+    print(
+        f'Number of arithmetic expressions in data file: '
+        f'{len(expressions)}'
+    )
+    print(
+        f'Sum of evaluated arithmetic expressions for Part 1: '
+        f'{part1(expressions)}'
+    )
+
+    # Find sum of evaluated arithmetic expressions for Part 2.
+    print(
+        f'Sum of evaluated arithmetic expressions for Part 2: '
+        f'{part2(expressions)}'
+    )
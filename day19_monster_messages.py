@@ -4,8 +4,9 @@
 from collections import UserDict
 import re
 
-# import third-party modules used below.
-import regex
+# import local modules used below.
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
 
 
 # Part 1: Using the parsing rules and messages in the provided data file, how
@@ -18,6 +19,15 @@ class ParsingRules(UserDict):
 
     rules_regex = re.compile(r'([0-9]+): (.+)')
 
+    def __init__(self, *args, **kwargs):
+        self.expanded_rules = {}
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, rule_index, rule_text):
+        """ Set rule text, discarding expansions that may depend on it """
+        self.expanded_rules.clear()
+        super().__setitem__(rule_index, rule_text)
+
     def add_rule(self, rule_str):
         """ Add parsing rule to self """
         rule_components = self.rules_regex.search(rule_str)
@@ -25,49 +35,44 @@ class ParsingRules(UserDict):
         rule_text = rule_components.group(2).replace('"', '')
         self[rule_number] = rule_text
 
+    def expand_rule(self, rule_index):
+        """ Return regex pattern for rule at specified index, expanding each
+        rule referenced along the way only once per rule set """
+        if rule_index not in self.expanded_rules:
+            pattern_components = []
+            for component in self[rule_index].split(' '):
+                if component.isdigit():
+                    component_pattern = self.expand_rule(int(component))
+                    if ' ' in self[int(component)]:
+                        component_pattern = f'({component_pattern})'
+                    pattern_components.append(component_pattern)
+                else:
+                    pattern_components.append(component)
+            self.expanded_rules[rule_index] = ''.join(pattern_components)
+        return self.expanded_rules[rule_index]
+
     def as_regex(self, rule_index, prefix='^', suffix='$'):
         """ Return regex corresponding to rule at specified index """
-        rule_components = self[rule_index].split(' ')
-        position = 0
-        while any(component.isdigit() for component in rule_components):
-            component = rule_components[position]
-            if component.isdigit():
-                component_replacement = self[int(component)].split(' ')
-                include_parentheses = len(component_replacement) > 1
-                rule_components = (
-                    rule_components[:position] +
-                    (['('] if include_parentheses else []) +
-                    component_replacement +
-                    ([')'] if include_parentheses else []) +
-                    rule_components[position+1:]
-                )
-            else:
-                position += 1
-        return re.compile(prefix+''.join(rule_components)+suffix)
-
-# Read rules and messages from data file.
-parsing_rules = ParsingRules()
-messages = []
-with open('data/day19_monster_messages-data.txt') as fp:
-    while (line := fp.readline().rstrip()) != '':
-        if line == '':
-            break
+        return re.compile(prefix + self.expand_rule(rule_index) + suffix)
+
+# Read rules and messages from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read parsing rules and messages from text or specified file """
+    parsing_rules = ParsingRules()
+    lines = iter(read_input(text_or_path).splitlines())
+    while (line := next(lines).rstrip()) != '':
         parsing_rules.add_rule(line)
-    for line in fp:
-        messages.append(line.rstrip())
-
-# Find messages matching Rule 0 for Part 1.
-rule_0_for_part1_regex = parsing_rules.as_regex(0)
-messages_matching_rule_0_part1 = []
-for message in messages:
-    if rule_0_for_part1_regex.search(message):
-        messages_matching_rule_0_part1.append(message)
-print(f'Number of parsing rules read from data file: {len(parsing_rules)}')
-print(f'Number of messages read from data file: {len(messages)}')
-print(
-    f'Number of messages satisfying Rule 0 for Part 1: '
-    f'{len(messages_matching_rule_0_part1)}'
-)
+    messages = [line.rstrip() for line in lines]
+    return parsing_rules, messages
+
+def part1(rules_and_messages):
+    """ Count messages matching Rule 0 for Part 1 """
+    parsing_rules, messages = rules_and_messages
+    rule_0_for_part1_regex = parsing_rules.as_regex(0)
+    return sum(
+        bool(rule_0_for_part1_regex.search(message)) for message in messages
+    )
 
 
 # Part 2: Using the parsing rules and messages in the provided data file, but
@@ -75,23 +80,53 @@ print(
 # how many messages satisfy Rule 0 = 8 11?
 
 
-# Find messages matching Rule 0 for Part 2.
-rule_31_for_part2 = parsing_rules.as_regex(31, prefix='', suffix='').pattern
-rule_42_for_part2 = parsing_rules.as_regex(42, prefix='', suffix='').pattern
-rule_0_for_part2 = (
-    '(' + rule_42_for_part2 + ')+'
-    '(?P<rule11>' +
-        '(' + rule_42_for_part2 + ')' +
-        '(?&rule11)?' +
-        '(' + rule_31_for_part2 + ')' +
-    ')'
-)
-rule_0_part2_regex = regex.compile(rule_0_for_part2)
-messages_matching_rule_0_part2 = []
-for n, message in enumerate(messages):
-    if rule_0_part2_regex.fullmatch(message):
-        messages_matching_rule_0_part2.append(message)
-print(
-    f'Number of messages satisfying Rule 0 for Part 2: '
-    f'{len(messages_matching_rule_0_part2)}'
-)
+def rule_0_as_regex_for_part2(parsing_rules):
+    """ Return recursive regex for Rule 0 = 8 11 with Part 2 changes """
+    # Import regex only here, since re lacks recursive patterns and regex
+    # would otherwise slow down importing this module for Part 1 alone.
+    import regex
+
+    rule_31_for_part2 = parsing_rules.as_regex(
+        31, prefix='', suffix=''
+    ).pattern
+    rule_42_for_part2 = parsing_rules.as_regex(
+        42, prefix='', suffix=''
+    ).pattern
+    rule_0_for_part2 = (
+        '(' + rule_42_for_part2 + ')+'
+        '(?P<rule11>' +
+            '(' + rule_42_for_part2 + ')' +
+            '(?&rule11)?' +
+            '(' + rule_31_for_part2 + ')' +
+        ')'
+    )
+    return regex.compile(rule_0_for_part2)
+
+def part2(rules_and_messages):
+    """ Count messages matching Rule 0 for Part 2 """
+    parsing_rules, messages = rules_and_messages
+    rule_0_part2_regex = rule_0_as_regex_for_part2(parsing_rules)
+    return sum(
+        bool(rule_0_part2_regex.fullmatch(message)) for message in messages
+    )
+
+
+if __name__ == '__main__':
+    # Read rules and messages from data file.
+    parsing_rules, messages = parse(
+        input_source('data/day19_monster_messages-data.txt')
+    )
+
+    # Find messages matching Rule 0 for Part 1.
+    print(f'Number of parsing rules read from data file: {len(parsing_rules)}')
+    print(f'Number of messages read from data file: {len(messages)}')
+    print(
+        f'Number of messages satisfying Rule 0 for Part 1: '
+        f'{part1((parsing_rules, messages))}'
+    )
+
+    # Find messages matching Rule 0 for Part 2.
+    print(
+        f'Number of messages satisfying Rule 0 for Part 2: '
+        f'{part2((parsing_rules, messages))}'
+    )
@@ -1,9 +1,14 @@
 """ Solutions for https://adventofcode.com/2020/day/21 """
 
 # import modules used below.
-from collections import defaultdict, UserString
+from collections import defaultdict, UserList, UserString
 import re
 
+# import local modules used below.
+from common.graph import perfect_matching
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
+
 
 # Part 1: Using the ingredients/allergens lists in the provided data file, how
 # many times do ingredients appear that cannot possibly contain any allergens?
@@ -12,8 +17,6 @@ import re
 # Create data model for nutritional labels.
 class NutritionalLabel(UserString):
     """ Data Model for nutritional labels with ingredients and allergens """
-    allergens_map: dict = {}
-    ingredient_counts: defaultdict = defaultdict(int)
     label_re = re.compile(r'([\w ]+) \(contains ([\w, ]+)\)')
 
     def __init__(self, label_as_string):
@@ -26,81 +29,91 @@ class NutritionalLabel(UserString):
             in label_components.group(2).split(',')
         }
 
+class NutritionalLabels(UserList):
+    """ Data Model for nutritional labels and their combined allergens map """
+
+    def __init__(self, labels=None):
+        super().__init__(labels)
+        self.allergens_map = {}
+        self.ingredient_counts = defaultdict(int)
+        for current_label in self:
+            for allergen in current_label.allergens:
+                if self.allergens_map.get(allergen, None) is None:
+                    self.allergens_map[allergen] = current_label.ingredients
+                else:
+                    self.allergens_map[allergen] = (
+                        self.allergens_map[allergen] &
+                        current_label.ingredients
+                    )
+            for ingredient in current_label.ingredients:
+                self.ingredient_counts[ingredient] += 1
+        self.allergens_map = dict(
+            sorted(perfect_matching(self.allergens_map).items())
+        )
+
     @classmethod
     def read_multiple_labels_from_file(cls, file_path):
-        """ Read multiple nutritional labels and build global allergens map """
-        labels_found = []
+        """ Read multiple nutritional labels and build allergens map """
         with open(file_path) as fp:
-            for line in fp:
-                current_label = cls(line)
-                labels_found.append(current_label)
-                for allergen in current_label.allergens:
-                    if cls.allergens_map.get(allergen, None) is None:
-                        cls.allergens_map[allergen] = current_label.ingredients
-                    else:
-                        cls.allergens_map[allergen] = (
-                            cls.allergens_map[allergen] &
-                            current_label.ingredients
-                        )
-                for ingredient in current_label.ingredients:
-                    cls.ingredient_counts[ingredient] += 1
-            while (
-                non_singleton_allergens := [
-                    allergen
-                    for allergen, ingredients_list
-                    in cls.allergens_map.items() if len(ingredients_list) > 1
-                ]
-            ):
-                singleton_ingredients = {
-                    tuple(ingredients_list)[0]
-                    for ingredients_list
-                    in cls.allergens_map.values() if len(ingredients_list) == 1
-                }
-                for allergen in non_singleton_allergens:
-                    cls.allergens_map[allergen] = (
-                        cls.allergens_map[allergen] -
-                        singleton_ingredients
-                    )
-            cls.allergens_map = {
-                    allergen: tuple(ingredients_list)[0]
-                    for allergen, ingredients_list
-                    in sorted(cls.allergens_map.items())
-                }
-        return labels_found
-
-# Read nutritional labels from data file.
-nutritional_labels = NutritionalLabel.read_multiple_labels_from_file(
-    'data/day21_allergen_assessment-data.txt'
-)
-
-# Find allergen-free ingredients count for Part 1.
-allergen_free_ingredients = {
-    ingredient: ingredient_count
-    for ingredient, ingredient_count
-    in NutritionalLabel.ingredient_counts.items()
-    if ingredient not in NutritionalLabel.allergens_map.values()
-}
-print(f'Number of labels read from data file: {len(nutritional_labels)}')
-print(
-    f'Number of allergens reads from data file: '
-    f'{len(NutritionalLabel.allergens_map)}'
-)
-print(
-    f'Number of allergens reads from data file: '
-    f'{len(NutritionalLabel.ingredient_counts)}'
-)
-print(
-    f'Number of occurrences of allergen-free ingredients for Part 1: '
-    f'{sum(allergen_free_ingredients.values())}'
-)
+            return cls(NutritionalLabel(line) for line in fp)
+
+    @property
+    def allergen_free_ingredients(self):
+        """ Return counts for ingredients not containing any allergens """
+        allergen_ingredients = set(self.allergens_map.values())
+        return {
+            ingredient: ingredient_count
+            for ingredient, ingredient_count
+            in self.ingredient_counts.items()
+            if ingredient not in allergen_ingredients
+        }
+
+# Read nutritional labels from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read nutritional labels from text or specified file """
+    return NutritionalLabels(
+        NutritionalLabel(line)
+        for line in read_input(text_or_path).splitlines()
+    )
+
+def part1(nutritional_labels):
+    """ Find allergen-free ingredients count for Part 1 """
+    return sum(nutritional_labels.allergen_free_ingredients.values())
 
 
 # Part 2: After sorting allergens in alphabetical order, what are their
 # corresponding "dangerous" ingredients"?
 
 
-# Find canonical dangerous ingredient list for Part 2.
-print(
-    f'Canonical dangerous ingredient list for Part 2: '
-    f'{",".join(v for k, v in NutritionalLabel.allergens_map.items())}'
-)
+def part2(nutritional_labels):
+    """ Find canonical dangerous ingredient list for Part 2 """
+    return ','.join(v for k, v in nutritional_labels.allergens_map.items())
+
+
+if __name__ == '__main__':
+    # Read nutritional labels from data file.
+    nutritional_labels = parse(
+        input_source('data/day21_allergen_assessment-data.txt')
+    )
+
+    # Find allergen-free ingredients count for Part 1.
+    print(f'Number of labels read from data file: {len(nutritional_labels)}')
+    print(
+        f'Number of allergens reads from data file: '
+        f'{len(nutritional_labels.allergens_map)}'
+    )
+    print(
+        f'Number of allergens reads from data file: '
+        f'{len(nutritional_labels.ingredient_counts)}'
+    )
+    print(
+        f'Number of occurrences of allergen-free ingredients for Part 1: '
+        f'{part1(nutritional_labels)}'
+    )
+
+    # Find canonical dangerous ingredient list for Part 2.
+    print(
+        f'Canonical dangerous ingredient list for Part 2: '
+        f'{part2(nutritional_labels)}'
+    )
@@ -1,9 +1,19 @@
 """ Solutions for https://adventofcode.com/2020/day/22 """
 
 # import modules used below.
-from collections import deque, UserDict
+from collections import Counter, deque, UserDict
+from pathlib import Path
 import re
 
+# import local modules used below.
+from common.inputs import input_source
+from common.parse_cache import cached_parse
+from common.records import iter_records
+
+
+# Counters for hot loops below, updated once per sub-game to stay lightweight.
+hot_loop_stats = Counter()
+
 
 # Part 1: After Combat is played with the Space Card decks in the provided data
 # file, what is the winning player's score?
@@ -47,10 +57,12 @@ class CombatGame(UserDict):
                 deck1 = self[1].copy()
             if deck2 is None:
                 deck2 = self[2].copy()
+            hot_loop_stats['subgames'] += 1
             previous_game_states = set()
             while deck1 and deck2:
                 current_game_state = (tuple(deck1), tuple(deck2))
                 if current_game_state in previous_game_states:
+                    hot_loop_stats['rounds'] += len(previous_game_states)
                     return 1, deck1
                 previous_game_states.add(current_game_state)
                 top_card_from_deck1 = deck1.deal_from_top()
@@ -78,49 +90,72 @@ class CombatGame(UserDict):
                 else:
                     winning_deck.stack_on_bottom(top_card_from_deck2)
                     winning_deck.stack_on_bottom(top_card_from_deck1)
+            hot_loop_stats['rounds'] += len(previous_game_states)
             return winning_player, winning_deck
         return play_subgame(recursive_game=recurse)
 
     @classmethod
-    def read_multiple_decks_from_file(cls, file_path, dlm='\n'):
+    def read_multiple_decks_from_file(cls, file_path):
         """ Read multiple Space Card decks from specified file """
-        with open(file_path) as fp:
-            decks = {}
-            for line in fp:
-                if (
-                        player_number_regex_match := (
-                            cls.player_number_regex.fullmatch(line.rstrip())
-                        )
-                ):
-                    player_number = int(player_number_regex_match.group(1))
-                    decks[player_number] = SpaceCardDeck()
-                    continue
-                elif line == dlm:
-                    continue
-                decks[player_number].append(int(line.strip()))
+        return cls.read_multiple_decks_from_lines(Path(file_path))
+
+    @classmethod
+    def read_multiple_decks_from_lines(cls, lines):
+        """ Read multiple Space Card decks from text, file path, or lines """
+        decks = {}
+        for record in iter_records(lines):
+            title, *cards = record.splitlines()
+            player_number = int(
+                cls.player_number_regex.fullmatch(title.rstrip()).group(1)
+            )
+            decks[player_number] = SpaceCardDeck(
+                int(card.strip()) for card in cards
+            )
         return cls(decks)
 
-# Read nutritional labels from data file.
-combat_game = CombatGame.read_multiple_decks_from_file(
-    'data/day22_crab_combat-data.txt'
-)
+# Read Space Card decks from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read Space Card decks from text or specified file """
+    return CombatGame.read_multiple_decks_from_lines(text_or_path)
 
-# Find winning score for Part 1.
-part1_winner, part1_winning_deck = combat_game.find_winning_deck(recurse=False)
-print(f'Number of Space Card Decks read from data file: {len(combat_game)}')
-print(
-    f'Number of cards read per player from data file: '
-    f'{dict((player,len(deck)) for player, deck in combat_game.items())}'
-)
-print(f'Winning player for Part 1: Player {part1_winner}')
-print(f'Winning score for Part 1: {part1_winning_deck.score()}')
+def part1(combat_game):
+    """ Find winning score after Combat for Part 1 """
+    _, winning_deck = combat_game.find_winning_deck(recurse=False)
+    return winning_deck.score()
 
 
 # Part 2: After Recursive Combat is played with the Space Card decks in the
 # provided data file, what is the winning player's score?
 
 
-# Find winning score for Part 2.
-part2_winner, part2_winning_deck = combat_game.find_winning_deck(recurse=True)
-print(f'\nWinning player for Part 2: Player {part2_winner}')
-print(f'Winning score for Part 2: {part2_winning_deck.score()}')
+def part2(combat_game):
+    """ Find winning score after Recursive Combat for Part 2 """
+    _, winning_deck = combat_game.find_winning_deck(recurse=True)
+    return winning_deck.score()
+
+
+if __name__ == '__main__':
+    # Read Space Card decks from data file.
+    combat_game = parse(input_source('data/day22_crab_combat-data.txt'))
+
+    # Find winning score for Part 1.
+    part1_winner, part1_winning_deck = combat_game.find_winning_deck(
+        recurse=False
+    )
+    print(
+        f'Number of Space Card Decks read from data file: {len(combat_game)}'
+    )
+    print(
+        f'Number of cards read per player from data file: '
+        f'{dict((player,len(deck)) for player, deck in combat_game.items())}'
+    )
+    print(f'Winning player for Part 1: Player {part1_winner}')
+    print(f'Winning score for Part 1: {part1_winning_deck.score()}')
+
+    # Find winning score for Part 2.
+    part2_winner, part2_winning_deck = combat_game.find_winning_deck(
+        recurse=True
+    )
+    print(f'\nWinning player for Part 2: Player {part2_winner}')
+    print(f'Winning score for Part 2: {part2_winning_deck.score()}')
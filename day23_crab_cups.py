@@ -1,10 +1,18 @@
 """ Solutions for https://adventofcode.com/2020/day/23 """
 
 # import modules used below.
-from collections import UserList
+from collections import Counter, UserList
 from dataclasses import dataclass
 from math import prod
 
+# import local modules used below.
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
+
+
+# Counters for hot loops below, updated once per call to stay lightweight.
+hot_loop_stats = Counter()
+
 
 # Part 1: After 100 moves in the crab cup game using the starting configuration
 # specified in the provided data file, what are the labels of all cups after
@@ -73,6 +81,7 @@ class CrabCubGame(UserList):
                 insertion_point = insertion_point.clockwise_neighbor
             insertion_point.clockwise_neighbor = destination_cup_neighbor
             current_cup = current_cup.clockwise_neighbor
+        hot_loop_stats['moves'] += number_of_moves
 
     def get_labels_after_cup(self, cup_label, number_of_cup_labels):
         """ Return labels immediately following cup with specified label """
@@ -83,28 +92,23 @@ class CrabCubGame(UserList):
             current_cup = current_cup.clockwise_neighbor
         return cup_labels_to_return
 
-# Read cup labels from data file.
-with open('data/day23_crab_cups-data.txt') as fp:
-    cup_labels_for_part1 = [int(digit) for digit in fp.readline().rstrip()]
-
-# Find cup arrangement for Part 1.
-crab_cup_game1 = CrabCubGame(cup_labels_for_part1)
-crab_cup_game1.move_cups(100, 3)
-cup_labels_after_1_for_part1 = crab_cup_game1.get_labels_after_cup(1, 8)
-concatenated_cup_labels_for_part1 = ''.join(
-    str(digit)
-    for digit in cup_labels_after_1_for_part1
-)
-print(f'Number of cup labels read from data file: {len(cup_labels_for_part1)}')
-print(f'Number of cup labels used for Part 1: {len(cup_labels_for_part1)}')
-print(
-    f'Cups immediately following Cup 1 for Part 1: '
-    f'{cup_labels_after_1_for_part1}'
-)
-print(
-    f'Concatenated cup labels for Part 1: '
-    f'{concatenated_cup_labels_for_part1}'
-)
+# Read cup labels from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read cup labels from text or specified file """
+    return [
+        int(digit)
+        for digit in read_input(text_or_path).splitlines()[0].rstrip()
+    ]
+
+def part1(cup_labels):
+    """ Find concatenated cup labels after Cup 1 for Part 1 """
+    crab_cup_game = CrabCubGame(cup_labels)
+    crab_cup_game.move_cups(100, 3)
+    return ''.join(
+        str(digit)
+        for digit in crab_cup_game.get_labels_after_cup(1, 8)
+    )
 
 
 # Part 2: After 10M moves in the crab cup game using an augmented version of
@@ -112,21 +116,61 @@ print(
 # labels of the first two cups after the cup labeled "1"?
 
 
-# Find cup arrangement for Part 2.
-cup_labels_for_part2 = (
-    cup_labels_for_part1 +
-    list(range(max(cup_labels_for_part1) + 1, 1_000_001))
-)
-crab_cup_game2 = CrabCubGame(cup_labels_for_part2)
-crab_cup_game2.move_cups(10_000_000, 3)
-cup_labels_after_1_for_part2 = crab_cup_game2.get_labels_after_cup(1, 2)
-product_of_cup_labels_for_part2 = prod(cup_labels_after_1_for_part2)
-print(f'\nNumber of cup labels used for Part 2: {len(cup_labels_for_part2):,}')
-print(
-    f'Cups immediately following Cup 1 for Part 2: '
-    f'{cup_labels_after_1_for_part2}'
-)
-print(
-    f'Product of cup labels for Part 2: '
-    f'{product_of_cup_labels_for_part2}'
-)
+def part2(cup_labels):
+    """ Find product of cup labels after Cup 1 for Part 2 """
+    crab_cup_game = CrabCubGame(
+        cup_labels + list(range(max(cup_labels) + 1, 1_000_001))
+    )
+    crab_cup_game.move_cups(10_000_000, 3)
+    return prod(crab_cup_game.get_labels_after_cup(1, 2))
+
+
+if __name__ == '__main__':
+    # Read cup labels from data file.
+    cup_labels_for_part1 = parse(input_source('data/day23_crab_cups-data.txt'))
+
+    # Find cup arrangement for Part 1.
+    crab_cup_game1 = CrabCubGame(cup_labels_for_part1)
+    crab_cup_game1.move_cups(100, 3)
+    cup_labels_after_1_for_part1 = crab_cup_game1.get_labels_after_cup(1, 8)
+    concatenated_cup_labels_for_part1 = ''.join(
+        str(digit)
+        for digit in cup_labels_after_1_for_part1
+    )
+    print(
+        f'Number of cup labels read from data file: '
+        f'{len(cup_labels_for_part1)}'
+    )
+    print(
+        f'Number of cup labels used for Part 1: {len(cup_labels_for_part1)}'
+    )
+    print(
+        f'Cups immediately following Cup 1 for Part 1: '
+        f'{cup_labels_after_1_for_part1}'
+    )
+    print(
+        f'Concatenated cup labels for Part 1: '
+        f'{concatenated_cup_labels_for_part1}'
+    )
+
+    # Find cup arrangement for Part 2.
+    cup_labels_for_part2 = (
+        cup_labels_for_part1 +
+        list(range(max(cup_labels_for_part1) + 1, 1_000_001))
+    )
+    crab_cup_game2 = CrabCubGame(cup_labels_for_part2)
+    crab_cup_game2.move_cups(10_000_000, 3)
+    cup_labels_after_1_for_part2 = crab_cup_game2.get_labels_after_cup(1, 2)
+    product_of_cup_labels_for_part2 = prod(cup_labels_after_1_for_part2)
+    print(
+        f'\nNumber of cup labels used for Part 2: '
+        f'{len(cup_labels_for_part2):,}'
+    )
+    print(
+        f'Cups immediately following Cup 1 for Part 2: '
+        f'{cup_labels_after_1_for_part2}'
+    )
+    print(
+        f'Product of cup labels for Part 2: '
+        f'{product_of_cup_labels_for_part2}'
+    )
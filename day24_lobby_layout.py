@@ -5,6 +5,13 @@ from collections import Counter, UserDict
 from copy import deepcopy
 from dataclasses import dataclass
 
+# import local modules used below.
+from common.automaton import (
+    evolve, HEX_AXIAL_OFFSETS, LifeRule, SparseAutomaton
+)
+from common.inputs import input_source, iter_lines
+from common.parse_cache import cached_parse
+
 
 # Part 1: After flipping the tiles in a hexagonal grid specified in the
 # provided data file, how many tiles will be black-side up?
@@ -68,6 +75,10 @@ class HexagonalTile:
 class TileLayout(UserDict):
     """ Data Model for tile layout """
 
+    # Black tiles with zero or more than two black neighbors flip to white,
+    # and white tiles with exactly two black neighbors flip to black.
+    evolution_rule = LifeRule(birth={2}, survival={1, 2})
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.reference_tile = HexagonalTile(0, 0)
@@ -110,66 +121,45 @@ class TileLayout(UserDict):
 
     def evolve_layout(self, number_of_evolutions):
         """ Evolve layout using rules specified for Part 2 """
-        for _ in range(number_of_evolutions):
-            black_tile_coordinates = set(
+        black_tile_coordinates, _ = evolve(
+            SparseAutomaton(HEX_AXIAL_OFFSETS, self.evolution_rule),
+            {
                 tile_coordinates
-                for tile_coordinates
-                in self
-                if self[tile_coordinates].black_side_up
-            )
-            tile_coordinates_to_consider = set()
-            for tile_coordinates in black_tile_coordinates:
-                tile_coordinates_to_consider.add(tile_coordinates)
-                tile_coordinates_to_consider.update(
-                    neighbor_coordinates
-                    for neighbor_coordinates
-                    in HexagonalTile(*tile_coordinates).neighbor_coordinates
-                )
-            white_tile_coordinates = (
-                tile_coordinates_to_consider -
-                black_tile_coordinates
-            )
-            tiles_to_flip = []
-            for tile_coordinates in tile_coordinates_to_consider:
-                tile_neighbor_coordinates = set(HexagonalTile(
-                    *tile_coordinates
-                ).neighbor_coordinates)
-                black_neighbor_count = len(
-                    tile_neighbor_coordinates &
-                    black_tile_coordinates
-                )
-                if (
-                    (
-                        tile_coordinates in black_tile_coordinates and (
-                            black_neighbor_count == 0 or
-                            black_neighbor_count > 2
-                        )
-                    )
-                    or (
-                        tile_coordinates in white_tile_coordinates and
-                        black_neighbor_count == 2
-                    )
-                ):
-                    tiles_to_flip.append(tile_coordinates)
-            for tile_coordinates in tiles_to_flip:
-                if tile_coordinates not in self:
-                    self[tile_coordinates] = HexagonalTile(*tile_coordinates)
-                self[tile_coordinates].black_side_up ^= True
-
-# Read tile paths data file.
-with open('data/day24_lobby_layout-data.txt') as fp:
-    tile_paths = [path.rstrip() for path in fp]
-
-# Find tile layout for Part 1.
-tile_layout1 = TileLayout()
-for path in tile_paths:
-    tile_layout1.flip_tile_at_end_of_path(path)
-print(f'Number of tile paths read from data file: {len(tile_paths)}')
-print(f'Tile visit counts for Part 1: {tile_layout1.visit_counts}')
-print(
-    f'Number of black-side up tiles for Part 1: '
-    f'{tile_layout1.number_of_black_tiles}'
-)
+                for tile_coordinates, tile in self.items()
+                if tile.black_side_up
+            },
+            number_of_evolutions,
+        )
+        for tile_coordinates, tile in self.items():
+            tile.black_side_up = tile_coordinates in black_tile_coordinates
+        for tile_coordinates in black_tile_coordinates - self.keys():
+            self[tile_coordinates] = HexagonalTile(*tile_coordinates)
+            self[tile_coordinates].black_side_up = True
+
+# Read tile paths lazily from text, data file, or lines (e.g., stdin), so that
+# tiles can be flipped without holding every path in memory.
+def iter_tile_paths(source):
+    """ Yield tile paths from text, specified file, or lines """
+    return (
+        path.rstrip() for path in iter_lines(source) if path.strip()
+    )
+
+# Read tile paths from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read tile paths from text or specified file """
+    return list(iter_tile_paths(text_or_path))
+
+def flip_tiles(tile_paths):
+    """ Return tile layout after flipping tiles at end of each path """
+    tile_layout = TileLayout()
+    for path in tile_paths:
+        tile_layout.flip_tile_at_end_of_path(path)
+    return tile_layout
+
+def part1(tile_paths):
+    """ Count black-side up tiles for Part 1 """
+    return flip_tiles(tile_paths).number_of_black_tiles
 
 
 # Part 2: After using the specified version of Conway's Game of Life to
@@ -177,10 +167,30 @@ print(
 # black-side up??
 
 
-# Find tile layout for Part 2.
-tile_layout2 = deepcopy(tile_layout1)
-tile_layout2.evolve_layout(100)
-print(
-    f'Number of black-side up tiles for Part 2: '
-    f'{tile_layout2.number_of_black_tiles}'
-)
+def part2(tile_paths):
+    """ Count black-side up tiles after 100 evolutions for Part 2 """
+    tile_layout = flip_tiles(tile_paths)
+    tile_layout.evolve_layout(100)
+    return tile_layout.number_of_black_tiles
+
+
+if __name__ == '__main__':
+    # Read tile paths data file.
+    tile_paths = parse(input_source('data/day24_lobby_layout-data.txt'))
+
+    # Find tile layout for Part 1.
+    tile_layout1 = flip_tiles(tile_paths)
+    print(f'Number of tile paths read from data file: {len(tile_paths)}')
+    print(f'Tile visit counts for Part 1: {tile_layout1.visit_counts}')
+    print(
+        f'Number of black-side up tiles for Part 1: '
+        f'{tile_layout1.number_of_black_tiles}'
+    )
+
+    # Find tile layout for Part 2.
+    tile_layout2 = deepcopy(tile_layout1)
+    tile_layout2.evolve_layout(100)
+    print(
+        f'Number of black-side up tiles for Part 2: '
+        f'{tile_layout2.number_of_black_tiles}'
+    )
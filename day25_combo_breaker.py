@@ -3,12 +3,30 @@
 # import modules used below.
 from math import ceil, sqrt
 from dataclasses import dataclass
+from functools import lru_cache
+
+# import local modules used below.
+from common.inputs import input_source, read_input
+from common.parse_cache import cached_parse
 
 
 # Part 1: Using the public encryption keys specified in the provided data file,
 # what is the private encryption key established by the key-exchange handshake?
 
 
+# Share baby-step tables between encryption objects with the same parameters,
+# keeping only the few most recently used, since each holds about the square
+# root of the modulus entries.
+@lru_cache(maxsize=16)
+def baby_steps(base, modulus):
+    """ Return giant-step size m and table of base^j (mod modulus), j < m """
+    m = ceil(sqrt(modulus))
+    powers_of_base = {
+        pow(base, j, modulus): j
+        for j in range(m)
+    }
+    return m, powers_of_base
+
 # Create data model for encryption object.
 @dataclass
 class EncryptionObject:
@@ -23,11 +41,7 @@ class EncryptionObject:
         giant-step algorithm to compute discrete logarithm, with
         inverse step computed using Fermat's Little Theorem; for definitions,
         see https://en.wikipedia.org/wiki/Baby-step_giant-step """
-        m = ceil(sqrt(self.modulus))
-        powers_of_base = {
-            pow(self.base, j, self.modulus): j
-            for j in range(m)
-        }
+        m, powers_of_base = baby_steps(self.base, self.modulus)
         base_to_the_negative_m = pow(
             self.base,
             (self.modulus - 1) - m,
@@ -40,30 +54,50 @@ class EncryptionObject:
             else:
                 gamma = (gamma * base_to_the_negative_m) % self.modulus
 
-# Read public keys from data file.
-with open('data/day25_combo_breaker-data.txt') as fp:
-    card = EncryptionObject(int(fp.readline().rstrip()))
-    door = EncryptionObject(int(fp.readline().rstrip()))
-
-# Compute private encryption key, using two different techniques, for Part 1.
-private_encryption_key_from_card = pow(
-    door.public_key,
-    card.loop_size,
-    door.modulus
-)
-private_encryption_key_from_door = pow(
-    card.public_key,
-    door.loop_size,
-    card.modulus
-)
-print(
-    f'Private encryption key, using card as basis, for Part 1: '
-    f'{private_encryption_key_from_card}'
-)
-print(
-    f'Private encryption key, using door as basis, for Part 1: '
-    f'{private_encryption_key_from_door}'
-)
+# Read public keys from text or data file.
+@cached_parse
+def parse(text_or_path):
+    """ Read card and door public keys from text or specified file """
+    lines = read_input(text_or_path).splitlines()
+    card = EncryptionObject(int(lines[0].rstrip()))
+    door = EncryptionObject(int(lines[1].rstrip()))
+    return card, door
+
+def part1(card_and_door):
+    """ Compute private encryption key for Part 1 """
+    card, door = card_and_door
+    return pow(door.public_key, card.loop_size, door.modulus)
 
 
 # Part 2: No computation needed for Part 2.
+
+
+def part2(card_and_door):
+    """ No computation needed for Part 2 """
+    return None
+
+
+if __name__ == '__main__':
+    # Read public keys from data file.
+    card, door = parse(input_source('data/day25_combo_breaker-data.txt'))
+
+    # Compute private encryption key, using two different techniques, for
+    # Part 1.
+    private_encryption_key_from_card = pow(
+        door.public_key,
+        card.loop_size,
+        door.modulus
+    )
+    private_encryption_key_from_door = pow(
+        card.public_key,
+        door.loop_size,
+        card.modulus
+    )
+    print(
+        f'Private encryption key, using card as basis, for Part 1: '
+        f'{private_encryption_key_from_card}'
+    )
+    print(
+        f'Private encryption key, using door as basis, for Part 1: '
+        f'{private_encryption_key_from_door}'
+    )
@@ -0,0 +1 @@
+""" Tooling for running, timing, and checking the daily solutions """
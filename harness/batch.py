@@ -0,0 +1,111 @@
+""" Solve many input files for one day in warm processes
+
+Inputs are given as files, directories (all *.txt files within), or glob
+patterns. Each worker process imports the day's solution module once and
+solves its share of the inputs in turn, so per-day setup cached at module
+level (e.g., the Day 25 baby-step table) is reused across inputs. One JSON
+record is written per input file, and answers are stored and reused across
+runs when the AOC_ANSWER_CACHE environment variable is set (see
+common/answer_cache.py). Example usage, from the repo root:
+
+    python -m harness.batch 25 inputs/day25/ --workers 4 --output day25.jsonl
+"""
+
+# import modules used below.
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+import json
+from pathlib import Path
+import sys
+
+# import local modules used below.
+from harness.runner import solve_day
+
+
+def expand_input_paths(input_specs):
+    """ Return sorted input file paths for files, directories, and globs """
+    input_paths = set()
+    for input_spec in input_specs:
+        path = Path(input_spec)
+        if path.is_dir():
+            input_paths.update(path.glob('*.txt'))
+        elif path.is_file():
+            input_paths.add(path)
+        else:
+            input_paths.update(Path(match) for match in glob(input_spec))
+    return sorted(input_paths)
+
+def solve_inputs(day, input_paths, verify=False):
+    """ Return one result record per input file, solved in this process """
+    records = []
+    for input_path in input_paths:
+        try:
+            record = solve_day(day, Path(input_path), verify=verify)
+        except Exception as error:
+            record = {
+                'day': day,
+                'error': f'{type(error).__name__}: {error}',
+            }
+        record['input'] = str(input_path)
+        records.append(record)
+    return records
+
+def run_batch(day, input_paths, workers=1, verify=False):
+    """ Return result records for input files, split across workers """
+    if workers <= 1:
+        return solve_inputs(day, input_paths, verify)
+    shares = [input_paths[n::workers] for n in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        share_records = executor.map(
+            solve_inputs, [day] * workers, shares, [verify] * workers
+        )
+    records_by_input = {
+        record['input']: record
+        for records in share_records
+        for record in records
+    }
+    return [records_by_input[str(path)] for path in input_paths]
+
+def build_argument_parser():
+    """ Return command-line argument parser for batch mode """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('day', type=int, help='day whose inputs to solve')
+    parser.add_argument(
+        'inputs', nargs='+',
+        help='input files, directories of *.txt files, or glob patterns'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='number of worker processes (default: 1, i.e., in-process)'
+    )
+    parser.add_argument(
+        '--verify', action='store_true',
+        help='recompute answers found in the answer cache (enabled by '
+        'setting AOC_ANSWER_CACHE) and exit non-zero if any differ'
+    )
+    parser.add_argument(
+        '--output', default=None,
+        help='path of JSON Lines file to write (default: standard output)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Solve batch of input files from the command line """
+    args = build_argument_parser().parse_args(argv)
+    input_paths = expand_input_paths(args.inputs)
+    records = run_batch(args.day, input_paths, args.workers, args.verify)
+    fp = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for record in records:
+            fp.write(json.dumps(record, default=str) + '\n')
+    finally:
+        if fp is not sys.stdout:
+            fp.close()
+    if any('answer_mismatches' in record for record in records):
+        sys.exit(1)
+    return records
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,411 @@
+""" Benchmark parse/part1/part2 of each day with repetitions and JSON output
+
+Example usage, from the repo root:
+
+    python -m harness.benchmark --days 1-10 --repeat 5 --output bench.json
+    python -m harness.benchmark --days 2 11 --synthetic-size 1000 10000
+    python -m harness.benchmark --days 1 --index-queries 10000
+    python -m harness.benchmark --days 2 --scaling-workers 1 2 4 8
+
+For days whose modules define build_index (e.g., Day 1), --index-queries
+also reports the time to build the query index and the throughput of
+queries for pairs and triples of entries summing to random targets. For
+days whose modules define solve_in_parallel (e.g., Day 2),
+--scaling-workers also times solving each input file with each number of
+worker processes, reporting speedup and scaling efficiency relative to the
+first number of workers.
+
+A failing or (with --time-limit) overlong input is recorded in the report
+with its error instead of aborting the run, and the command then exits
+non-zero.
+"""
+
+# import modules used below.
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
+import gc
+import json
+import math
+from pathlib import Path
+import platform
+import signal
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# import third-party modules used below.
+import numpy as np
+
+# import local modules used below.
+from harness.generators import generate_input, synthetic_file_name
+from harness.solvers import data_file, load_day, parse_days, PHASES
+
+
+class BenchmarkTimeout(Exception):
+    """ Raised when benchmarking one input exceeds its time limit """
+
+@contextmanager
+def time_limit(seconds):
+    """ Raise BenchmarkTimeout if the enclosed block runs longer than seconds,
+    using SIGALRM (so no limit applies where it is unavailable) """
+    if not seconds or not hasattr(signal, 'setitimer'):
+        yield
+        return
+
+    def handle_alarm(signum, frame):
+        raise BenchmarkTimeout(f'exceeded time limit of {seconds}s')
+
+    previous_handler = signal.signal(signal.SIGALRM, handle_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+def percentile(values, pct):
+    """ Return nearest-rank percentile of values """
+    ordered_values = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered_values)), 1)
+    return ordered_values[rank - 1]
+
+def summarize_timings(timings):
+    """ Return min/median/p95/mean summary of timings in seconds """
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'p95': percentile(timings, 95),
+        'mean': statistics.mean(timings),
+        'runs': timings,
+    }
+
+def time_phase(func, arg, repeat=5, warmup=1):
+    """ Return timings of func(arg) after warm-up calls, plus its result """
+    for _ in range(warmup):
+        func(arg)
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            result = func(arg)
+            timings.append(time.perf_counter() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings, result
+
+def measure_peak_memory(func, arg):
+    """ Return peak memory, in bytes, traced while evaluating func(arg) """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+def benchmark_input(module, text, repeat=5, warmup=1, memory=True):
+    """ Benchmark each phase of a solution module against one input """
+    phase_results = {}
+    answers = {}
+    argument = text
+    parsed = None
+    for phase in PHASES:
+        func = getattr(module, phase)
+        if phase != 'parse':
+            argument = parsed
+        timings, result = time_phase(func, argument, repeat, warmup)
+        phase_results[phase] = summarize_timings(timings)
+        if memory:
+            phase_results[phase]['peak_memory_bytes'] = measure_peak_memory(
+                func, argument
+            )
+        if phase == 'parse':
+            parsed = result
+        else:
+            answers[phase] = result
+    return phase_results, answers
+
+def benchmark_inputs_for_day(
+    day, input_dir=None, synthetic_sizes=(), seed=0
+):
+    """ Return (label, text) pairs for data file and extra inputs of a day """
+    path = data_file(day)
+    inputs = [(str(path.relative_to(path.parent.parent)), path.read_text())]
+    if input_dir is not None:
+        for extra_path in sorted(Path(input_dir).glob(f'day{day:02d}*.txt')):
+            inputs.append((str(extra_path), extra_path.read_text()))
+    for size in synthetic_sizes:
+        inputs.append((
+            f'synthetic/{synthetic_file_name(day, size, seed)}',
+            generate_input(day, size, seed),
+        ))
+    return inputs
+
+def index_query_targets(sorted_values, k, number_of_queries, seed=0):
+    """ Return targets for queries for k entries of sorted values: half of
+    them sums of k random entries, and half random totals within the range
+    of such sums (which may or may not be sums of k entries) """
+    rng = np.random.default_rng(seed)
+    number_of_sums = (number_of_queries + 1) // 2
+    sums = np.array([
+        sorted_values[rng.choice(len(sorted_values), k, replace=False)].sum()
+        for _ in range(number_of_sums)
+    ], dtype=np.int64)
+    totals = rng.integers(
+        int(sorted_values[:k].sum()),
+        int(sorted_values[-k:].sum()) + 1,
+        number_of_queries - number_of_sums,
+    )
+    return rng.permutation(np.concatenate((sums, totals)))
+
+def benchmark_index(
+    module, parsed, number_of_queries, repeat=5, warmup=1, seed=0,
+    query_sizes=(2, 3),
+):
+    """ Return timings of building a day's query index from parsed input,
+    and of answering number_of_queries queries for each number of entries
+    in query_sizes, with query throughput """
+    build_timings, index = time_phase(
+        module.build_index, parsed, repeat, warmup
+    )
+    index_result = {
+        'build': summarize_timings(build_timings),
+        'values': len(index.sorted_values),
+        'queries': {},
+    }
+    if len(index.sorted_values) < max(query_sizes):
+        return index_result
+    for k in query_sizes:
+        targets = index_query_targets(
+            index.sorted_values, k, number_of_queries, seed
+        )
+        query_timings, answers = time_phase(
+            partial(index.find_many, k), targets, repeat, warmup
+        )
+        index_result['queries'][k] = {
+            **summarize_timings(query_timings),
+            'number_of_queries': number_of_queries,
+            'answered': sum(answer is not None for answer in answers),
+            'queries_per_second': (
+                number_of_queries / statistics.median(query_timings)
+            ),
+        }
+    return index_result
+
+def benchmark_scaling(module, text, worker_counts, repeat=5, warmup=1):
+    """ Return timings of a day's multi-process solution of an input file
+    for each number of workers, with speedup and efficiency (speedup per
+    worker) relative to the first number of workers """
+    scaling = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = Path(temp_dir) / 'input.txt'
+        input_path.write_text(text)
+        for workers in worker_counts:
+            timings, answers = time_phase(
+                partial(module.solve_in_parallel, workers=workers),
+                input_path, repeat, warmup,
+            )
+            scaling[workers] = {
+                **summarize_timings(timings),
+                'answers': answers,
+            }
+    base_workers = worker_counts[0]
+    base_median = scaling[base_workers]['median']
+    for workers, summary in scaling.items():
+        summary['speedup'] = base_median / summary['median']
+        summary['efficiency'] = summary['speedup'] * base_workers / workers
+    return scaling
+
+def run_benchmarks(
+    days, repeat=5, warmup=1, memory=True, inputs_for_day=None,
+    time_limit_seconds=None, index_queries=0, seed=0, scaling_workers=(),
+):
+    """ Return benchmark report for specified days as a JSON-ready dict, with
+    an error recorded for each input that fails or exceeds the time limit,
+    with query index timings for days defining build_index if
+    index_queries is positive, and with multi-process timings for days
+    defining solve_in_parallel if scaling_workers are given """
+    if inputs_for_day is None:
+        inputs_for_day = benchmark_inputs_for_day
+    results = []
+    for day in days:
+        module = load_day(day)
+        for input_label, text in inputs_for_day(day):
+            result = {
+                'day': day,
+                'module': module.__name__,
+                'input': input_label,
+                'input_bytes': len(text.encode()),
+                'phases': {},
+                'answers': {},
+            }
+            try:
+                with time_limit(time_limit_seconds):
+                    result['phases'], result['answers'] = benchmark_input(
+                        module, text, repeat, warmup, memory
+                    )
+                    if index_queries and hasattr(module, 'build_index'):
+                        result['index'] = benchmark_index(
+                            module, module.parse(text), index_queries,
+                            repeat, warmup, seed,
+                        )
+                    if scaling_workers and hasattr(
+                        module, 'solve_in_parallel'
+                    ):
+                        result['scaling'] = benchmark_scaling(
+                            module, text, scaling_workers, repeat, warmup
+                        )
+            except Exception as error:
+                result['error'] = f'{type(error).__name__}: {error}'
+            results.append(result)
+    return {
+        'metadata': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'warmup': warmup,
+            'time_limit': time_limit_seconds,
+            'index_queries': index_queries,
+            'scaling_workers': list(scaling_workers),
+        },
+        'results': results,
+    }
+
+def format_report(report):
+    """ Return human-readable table of median/p95 timings for report """
+    lines = [
+        f'{"day":>3}  {"input":<44} {"phase":<6} '
+        f'{"min (s)":>10} {"median (s)":>10} {"p95 (s)":>10} {"peak MiB":>9}'
+    ]
+    for result in report['results']:
+        if 'error' in result:
+            lines.append(
+                f'{result["day"]:>3}  {result["input"][-44:]:<44} '
+                f'FAILED: {result["error"]}'
+            )
+        for phase, summary in result['phases'].items():
+            peak_memory = summary.get('peak_memory_bytes')
+            lines.append(
+                f'{result["day"]:>3}  {result["input"][-44:]:<44} '
+                f'{phase:<6} {summary["min"]:>10.4f} '
+                f'{summary["median"]:>10.4f} {summary["p95"]:>10.4f} '
+                + (
+                    f'{peak_memory / 2**20:>9.2f}'
+                    if peak_memory is not None else f'{"-":>9}'
+                )
+            )
+        if 'index' in result:
+            index_result = result['index']
+            lines.append(
+                f'{result["day"]:>3}  {result["input"][-44:]:<44} '
+                f'index of {index_result["values"]} values built in '
+                f'{index_result["build"]["median"]:.4f} s (median)'
+            )
+            for k, summary in index_result['queries'].items():
+                lines.append(
+                    f'{result["day"]:>3}  {result["input"][-44:]:<44} '
+                    f'k={k}: {summary["queries_per_second"]:,.0f} queries/s '
+                    f'({summary["answered"]}/{summary["number_of_queries"]} '
+                    f'answered)'
+                )
+        for workers, summary in result.get('scaling', {}).items():
+            lines.append(
+                f'{result["day"]:>3}  {result["input"][-44:]:<44} '
+                f'{workers} workers: {summary["median"]:.4f} s (median), '
+                f'speedup {summary["speedup"]:.2f}x, '
+                f'efficiency {summary["efficiency"]:.0%}'
+            )
+    return '\n'.join(lines)
+
+def build_argument_parser():
+    """ Return command-line argument parser for benchmark suite """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to benchmark, e.g. 1 2 5-9 (default: all days)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of timed repetitions per phase (default: 5)'
+    )
+    parser.add_argument(
+        '--warmup', type=int, default=1,
+        help='number of untimed warm-up calls per phase (default: 1)'
+    )
+    parser.add_argument(
+        '--no-memory', action='store_true',
+        help='skip the separate tracemalloc pass measuring peak memory'
+    )
+    parser.add_argument(
+        '--input-dir', default=None,
+        help='directory of extra dayNN*.txt inputs to benchmark per day'
+    )
+    parser.add_argument(
+        '--synthetic-size', type=int, nargs='+', default=[],
+        help='sizes of generated synthetic inputs to benchmark per day'
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='seed for generated synthetic inputs (default: 0)'
+    )
+    parser.add_argument(
+        '--index-queries', type=int, default=0,
+        help='number of random target queries per number of entries with '
+        'which to benchmark the query index of days defining build_index '
+        '(default: 0, i.e., skip)'
+    )
+    parser.add_argument(
+        '--scaling-workers', type=int, nargs='+', default=[],
+        help='numbers of worker processes with which to time days defining '
+        'solve_in_parallel, e.g. 1 2 4 8 (default: skip)'
+    )
+    parser.add_argument(
+        '--time-limit', type=float, default=None,
+        help='seconds allowed per input, including repetitions, before it is '
+        'recorded as failed (default: no limit)'
+    )
+    parser.add_argument(
+        '--output', default=None,
+        help='path of JSON report to write (default: print table only)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Run benchmark suite from the command line """
+    args = build_argument_parser().parse_args(argv)
+    report = run_benchmarks(
+        parse_days(args.days),
+        repeat=args.repeat,
+        warmup=args.warmup,
+        memory=not args.no_memory,
+        inputs_for_day=partial(
+            benchmark_inputs_for_day,
+            input_dir=args.input_dir,
+            synthetic_sizes=args.synthetic_size,
+            seed=args.seed,
+        ),
+        time_limit_seconds=args.time_limit,
+        index_queries=args.index_queries,
+        seed=args.seed,
+        scaling_workers=args.scaling_workers,
+    )
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2, default=str)
+    if any('error' in result for result in report['results']):
+        sys.exit(1)
+    return report
+
+
+if __name__ == '__main__':
+    main()
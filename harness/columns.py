@@ -0,0 +1,64 @@
+""" Convert integer-list inputs to binary int64 column files
+
+Inputs with one integer per line (Days 1, 9, and 10) can be converted once
+to column files (see common/columns.py), which their parsers memory-map
+instead of parsing text. Inputs are given as text files or as day numbers
+(for the provided data files), and each column file is written next to its
+text file (or to --output-dir) with a .i64 suffix. Example usage, from the
+repo root:
+
+    python -m harness.columns 1 9 10 inputs/day01-large.txt
+"""
+
+# import modules used below.
+import argparse
+from pathlib import Path
+import time
+
+# import local modules used below.
+from common.columns import column_path_for, convert_text_to_column
+from harness.solvers import data_file
+
+
+def input_text_path(input_spec):
+    """ Return text file path for a day number or a file path """
+    if input_spec.isdigit():
+        return data_file(int(input_spec))
+    return Path(input_spec)
+
+def build_argument_parser():
+    """ Return command-line argument parser for column file converter """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'inputs', nargs='+',
+        help='day numbers (for provided data files) or text file paths'
+    )
+    parser.add_argument(
+        '--output-dir', default=None,
+        help='directory for column files (default: next to text files)'
+    )
+    parser.add_argument(
+        '--chunk-lines', type=int, default=2**20,
+        help='number of lines converted at a time (default: 1048576)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Convert text files to column files from the command line """
+    args = build_argument_parser().parse_args(argv)
+    if args.output_dir is not None:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    for input_spec in args.inputs:
+        text_path = input_text_path(input_spec)
+        column_path = column_path_for(text_path, args.output_dir)
+        start_time = time.perf_counter()
+        length = convert_text_to_column(
+            text_path, column_path, chunk_lines=args.chunk_lines
+        )
+        elapsed = time.perf_counter() - start_time
+        print(f'{text_path} -> {column_path}: {length} values in '
+              f'{elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,290 @@
+""" Warm solver daemon answering JSON requests over a Unix socket or TCP
+
+All day modules are imported once at startup. Each request is a line of
+JSON such as {"day": 22, "part": 2, "input": "...", "timeout": 10}, where
+part is 1, 2, or omitted for both, and input is the puzzle text (defaulting
+to the provided data file). The input is only ever treated as text, never
+as a path to read. Each solve runs in a process forked from the
+warm daemon, with at most --workers solves at once, so the event loop never
+blocks, and a solve exceeding its timeout is killed without starving other
+requests. Each response is a line of JSON with answers and timings.
+Request and response lines may be up to --max-request-mib long (256 MiB by
+default); a longer request line is skipped with an error response. With
+the AOC_ANSWER_CACHE environment variable set (see common/answer_cache.py),
+stored answers are returned without solving, unless the request includes
+"verify": true, in which case they are recomputed and compared. Example
+usage, from the repo root:
+
+    python -m harness.daemon --socket /tmp/aoc.sock --workers 4
+    echo '{"day": 1, "part": 2}' | nc -U /tmp/aoc.sock
+"""
+
+# import modules used below.
+import argparse
+import asyncio
+from collections import Counter
+import json
+import multiprocessing
+import os
+import time
+
+# import local modules used below.
+from harness.runner import solve_day
+from harness.solvers import available_days, load_day
+
+
+# Allow request lines (which may include puzzle inputs) of up to 256 MiB,
+# rather than the 64 KiB default of asyncio streams.
+DEFAULT_LINE_LIMIT = 256 * 2**20
+
+
+def solve_request(day, parts, text, verify=False):
+    """ Return answers and per-phase timings for requested parts of a day,
+    along with answer cache statistics when the answer cache is enabled """
+    day_result = solve_day(day, text, parts=parts, verify=verify)
+    return {
+        key: day_result[key]
+        for key in ('answers', 'timings', 'answer_cache', 'answer_mismatches')
+        if key in day_result
+    }
+
+async def wait_for_exit(process):
+    """ Wait without blocking the event loop until process exits """
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+    loop.add_reader(
+        process.sentinel,
+        lambda: exited.done() or exited.set_result(None),
+    )
+    try:
+        await exited
+    finally:
+        loop.remove_reader(process.sentinel)
+    process.join()
+    process.close()
+
+def solve_in_child(connection, day, parts, text, verify):
+    """ Send result of solve_request, or its error, through connection """
+    try:
+        result = solve_request(day, parts, text, verify)
+    except Exception as error:
+        result = {'error': f'{type(error).__name__}: {error}'}
+    connection.send_bytes(json.dumps(result, default=str).encode())
+    connection.close()
+
+async def discard_line(reader):
+    """ Skip the rest of a line too long to buffer, up to and including its
+    newline (or the end of the stream) """
+    while True:
+        try:
+            await reader.readuntil(b'\n')
+            return
+        except asyncio.LimitOverrunError as error:
+            await reader.readexactly(error.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+class SolverDaemon:
+    """ Data Model for warm solver daemon with bounded, killable workers """
+
+    def __init__(
+        self, workers=None, default_timeout=60.0,
+        line_limit=DEFAULT_LINE_LIMIT,
+    ):
+        self.days = available_days()
+        for day in self.days:
+            load_day(day)
+        self.default_timeout = default_timeout
+        self.line_limit = line_limit
+        self.worker_slots = asyncio.Semaphore(workers or os.cpu_count())
+        self.context = multiprocessing.get_context('fork')
+        self.stats = {'requests': 0, 'errors': 0, 'timeouts': 0}
+        self.answer_cache_stats = Counter()
+
+    async def run_solve(self, day, parts, text, timeout, verify=False):
+        """ Return result of solving request in forked child process """
+        loop = asyncio.get_running_loop()
+        receiver, sender = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=solve_in_child, args=(sender, day, parts, text, verify)
+        )
+        result_ready = loop.create_future()
+        loop.add_reader(
+            receiver.fileno(),
+            lambda: result_ready.done() or result_ready.set_result(None),
+        )
+        process.start()
+        sender.close()
+        try:
+            await asyncio.wait_for(result_ready, timeout)
+            try:
+                return json.loads(receiver.recv_bytes())
+            except EOFError:
+                return {
+                    'error': f'worker exited with code {process.exitcode}'
+                }
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            return {'error': f'timed out after {timeout}s'}
+        finally:
+            loop.remove_reader(receiver.fileno())
+            receiver.close()
+            if process.is_alive():
+                process.kill()
+            await wait_for_exit(process)
+
+    async def handle_request(self, request):
+        """ Return response for one decoded request """
+        start_time = time.perf_counter()
+        self.stats['requests'] += 1
+        if request.get('stats'):
+            stats = dict(self.stats)
+            if self.answer_cache_stats:
+                stats['answer_cache'] = dict(self.answer_cache_stats)
+            return {'stats': stats}
+        day = int(request['day'])
+        if day not in self.days:
+            raise ValueError(f'No solution module found for day {day}')
+        part = request.get('part')
+        parts = (1, 2) if part is None else (int(part),)
+        if not set(parts) <= {1, 2}:
+            raise ValueError(f'Invalid part {part}; expected 1 or 2')
+        text = request.get('input')
+        if text is not None and not isinstance(text, str):
+            raise TypeError('input must be puzzle text given as a string')
+        timeout = float(request.get('timeout', self.default_timeout))
+        waiting_start_time = time.perf_counter()
+        async with self.worker_slots:
+            waited = time.perf_counter() - waiting_start_time
+            response = await self.run_solve(
+                day, parts, text, timeout, bool(request.get('verify'))
+            )
+        self.answer_cache_stats.update(response.get('answer_cache', {}))
+        response.update({
+            'day': day,
+            'parts': list(parts),
+            'queued': waited,
+            'elapsed': time.perf_counter() - start_time,
+        })
+        return response
+
+    async def handle_client(self, reader, writer):
+        """ Answer newline-delimited JSON requests until client disconnects """
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.IncompleteReadError as error:
+                    line = error.partial
+                except asyncio.LimitOverrunError:
+                    await discard_line(reader)
+                    self.stats['errors'] += 1
+                    await self.send_response(writer, {
+                        'error': 'ValueError: request line exceeds '
+                        f'{self.line_limit} bytes'
+                    })
+                    continue
+                if not line:
+                    break
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except (KeyError, TypeError, ValueError) as error:
+                    response = {'error': f'{type(error).__name__}: {error}'}
+                if 'error' in response:
+                    self.stats['errors'] += 1
+                await self.send_response(writer, response)
+        finally:
+            writer.close()
+
+    async def send_response(self, writer, response):
+        """ Write response as a line of JSON """
+        writer.write(json.dumps(response, default=str).encode())
+        writer.write(b'\n')
+        await writer.drain()
+
+async def serve(socket_path=None, host='127.0.0.1', port=8765, **kwargs):
+    """ Run solver daemon on Unix socket, if specified, or TCP otherwise """
+    daemon = SolverDaemon(**kwargs)
+    if socket_path is not None:
+        server = await asyncio.start_unix_server(
+            daemon.handle_client, path=socket_path, limit=daemon.line_limit
+        )
+    else:
+        server = await asyncio.start_server(
+            daemon.handle_client, host, port, limit=daemon.line_limit
+        )
+    addresses = ', '.join(
+        str(sock.getsockname()) for sock in server.sockets
+    )
+    print(f'Serving {len(daemon.days)} days on {addresses}', flush=True)
+    async with server:
+        await server.serve_forever()
+
+async def send_request(
+    request, socket_path=None, host='127.0.0.1', port=8765,
+    line_limit=DEFAULT_LINE_LIMIT,
+):
+    """ Return response from solver daemon for one request """
+    if socket_path is not None:
+        reader, writer = await asyncio.open_unix_connection(
+            socket_path, limit=line_limit
+        )
+    else:
+        reader, writer = await asyncio.open_connection(
+            host, port, limit=line_limit
+        )
+    try:
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+def build_argument_parser():
+    """ Return command-line argument parser for solver daemon """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--socket', default=None,
+        help='path of Unix socket to listen on (default: use TCP)'
+    )
+    parser.add_argument(
+        '--host', default='127.0.0.1',
+        help='host to listen on for TCP (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port', type=int, default=8765,
+        help='port to listen on for TCP (default: 8765)'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='maximum number of concurrent solves (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--timeout', type=float, default=60.0,
+        help='default per-request timeout in seconds (default: 60)'
+    )
+    parser.add_argument(
+        '--max-request-mib', type=float, default=DEFAULT_LINE_LIMIT / 2**20,
+        help='maximum length of a request line in MiB (default: 256)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Run solver daemon from the command line """
+    args = build_argument_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(
+            socket_path=args.socket,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            default_timeout=args.timeout,
+            line_limit=int(args.max_request_mib * 2**20),
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
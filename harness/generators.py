@@ -0,0 +1,705 @@
+""" Deterministic synthetic puzzle inputs at arbitrary scale for every day
+
+Each generate_dayNN(rng, size) function returns the text of a valid input
+for the corresponding day, using the same format as the provided data files.
+The meaning of size depends on the format (e.g., the number of passwords for
+Day 2, the side length of the seat map for Day 11, or the side length of the
+tile grid for Day 20), and is documented in each generator. Example usage,
+from the repo root:
+
+    python -m harness.generators --days 2 11 --size 1000 --output-dir tmp
+"""
+
+# import modules used below.
+import argparse
+from itertools import count
+from math import ceil, log2
+from pathlib import Path
+import random
+import string
+
+# import local modules used below.
+from harness.solvers import parse_days
+
+
+def random_word(rng, min_length=3, max_length=8):
+    """ Return random lowercase word """
+    return ''.join(
+        rng.choice(string.ascii_lowercase)
+        for _ in range(rng.randint(min_length, max_length))
+    )
+
+def unique_words(rng, number_of_words, min_length=3, max_length=8):
+    """ Return list of distinct random lowercase words """
+    words = set()
+    while len(words) < number_of_words:
+        words.add(random_word(rng, min_length, max_length))
+    return sorted(words)
+
+def first_primes(number_of_primes, minimum=2):
+    """ Return list of the first primes greater than or equal to minimum """
+    primes = []
+    for candidate in count(minimum):
+        if all(candidate % p for p in range(2, int(candidate**0.5) + 1)):
+            primes.append(candidate)
+            if len(primes) == number_of_primes:
+                return primes
+
+def generate_day01(rng, size):
+    """ size expense report entries, with one pair and one triple summing to
+    2020; all other entries exceed 1010, so no other pair or triple does """
+    values = [rng.randint(1011, 2019) for _ in range(max(size - 5, 0))]
+    pair_value = rng.randint(1, 1009)
+    triple_values = [rng.randint(1, 500), rng.randint(1, 500)]
+    values += [pair_value, 2020 - pair_value]
+    values += triple_values + [2020 - sum(triple_values)]
+    rng.shuffle(values)
+    return ''.join(f'{v}\n' for v in values)
+
+def generate_day02(rng, size):
+    """ size password policies and passwords """
+    lines = []
+    for _ in range(size):
+        password_length = rng.randint(3, 20)
+        min_times = rng.randint(1, password_length - 1)
+        max_times = rng.randint(min_times + 1, password_length)
+        char = rng.choice(string.ascii_lowercase[:8])
+        password = ''.join(
+            rng.choice(string.ascii_lowercase[:8])
+            for _ in range(password_length)
+        )
+        lines.append(f'{min_times}-{max_times} {char}: {password}\n')
+    return ''.join(lines)
+
+def generate_day03(rng, size, width=31):
+    """ size rows of a toboggan map with fixed width """
+    return ''.join(
+        ''.join('#' if rng.random() < 0.25 else '.' for _ in range(width))
+        + '\n'
+        for _ in range(size)
+    )
+
+def generate_day04(rng, size):
+    """ size passports, with a mix of missing and invalid components """
+    valid_components = {
+        'byr': lambda: str(rng.randint(1920, 2002)),
+        'iyr': lambda: str(rng.randint(2010, 2020)),
+        'eyr': lambda: str(rng.randint(2020, 2030)),
+        'hgt': lambda: rng.choice([
+            f'{rng.randint(150, 193)}cm', f'{rng.randint(59, 76)}in'
+        ]),
+        'hcl': lambda: '#' + ''.join(rng.choices('0123456789abcdef', k=6)),
+        'ecl': lambda: rng.choice(
+            ['amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth']
+        ),
+        'pid': lambda: ''.join(rng.choices(string.digits, k=9)),
+        'cid': lambda: str(rng.randint(1, 350)),
+    }
+    invalid_components = {
+        'byr': lambda: str(rng.randint(1800, 1919)),
+        'iyr': lambda: str(rng.randint(2021, 2099)),
+        'eyr': lambda: str(rng.randint(1990, 2019)),
+        'hgt': lambda: f'{rng.randint(100, 149)}',
+        'hcl': lambda: ''.join(rng.choices('0123456789abcdef', k=6)),
+        'ecl': lambda: random_word(rng, 3, 3),
+        'pid': lambda: ''.join(rng.choices(string.digits, k=10)),
+        'cid': lambda: str(rng.randint(1, 350)),
+    }
+    passports = []
+    for _ in range(size):
+        components = []
+        for name in valid_components:
+            if rng.random() < 0.05:
+                continue
+            component_source = (
+                invalid_components if rng.random() < 0.05
+                else valid_components
+            )
+            components.append(f'{name}:{component_source[name]()}')
+        rng.shuffle(components)
+        lines = []
+        while components:
+            components_per_line = rng.randint(1, 4)
+            lines.append(' '.join(components[:components_per_line]))
+            components = components[components_per_line:]
+        passports.append('\n'.join(lines) + '\n')
+    return '\n'.join(passports)
+
+def generate_day05(rng, size):
+    """ size boarding passes for contiguous seats with one missing seat;
+    seat IDs are 10-bit values, so size is capped at 1022 """
+    size = max(min(size, 1022), 3)
+    first_seat_id = rng.randint(0, 1023 - size)
+    seat_ids = list(range(first_seat_id, first_seat_id + size + 1))
+    seat_ids.remove(rng.choice(seat_ids[1:-1]))
+    rng.shuffle(seat_ids)
+    return ''.join(
+        f'{seat_id >> 3:07b}'.replace('0', 'F').replace('1', 'B') +
+        f'{seat_id & 7:03b}'.replace('0', 'L').replace('1', 'R') +
+        '\n'
+        for seat_id in seat_ids
+    )
+
+def generate_day06(rng, size):
+    """ size groups of customs declaration responses """
+    groups = []
+    for _ in range(size):
+        group_questions = rng.sample(
+            string.ascii_lowercase, rng.randint(1, 26)
+        )
+        groups.append(''.join(
+            ''.join(rng.sample(
+                group_questions, rng.randint(1, len(group_questions))
+            )) + '\n'
+            for _ in range(rng.randint(1, 5))
+        ))
+    return '\n'.join(groups)
+
+def generate_day07(rng, size, max_contents=4, window=50):
+    """ size bag-containment rules forming a DAG containing shiny gold """
+    colors = set()
+    while len(colors) < max(size - 1, 1):
+        color = f'{random_word(rng)} {random_word(rng)}'
+        if color != 'shiny gold':
+            colors.add(color)
+    colors = sorted(colors)
+    rng.shuffle(colors)
+    colors.insert(len(colors) // 2, 'shiny gold')
+    lines = []
+    for i, color in enumerate(colors):
+        candidates = colors[i+1:i+1+window]
+        contents = rng.sample(
+            candidates, min(rng.randint(0, max_contents), len(candidates))
+        )
+        if not contents:
+            lines.append(f'{color} bags contain no other bags.\n')
+            continue
+        components = []
+        for inner_color in contents:
+            number = rng.randint(1, 5)
+            components.append(
+                f'{number} {inner_color} bag{"s" if number > 1 else ""}'
+            )
+        lines.append(f'{color} bags contain {", ".join(components)}.\n')
+    rng.shuffle(lines)
+    return ''.join(lines)
+
+def generate_day08(rng, size):
+    """ size boot code instructions, with one jmp corrupted to loop """
+    size = max(size, 3)
+    instructions = []
+    for line_number in range(1, size):
+        if rng.random() < 0.2 and line_number < size - 1:
+            instructions.append(
+                ['jmp', rng.randint(1, min(5, size - line_number))]
+            )
+        else:
+            instructions.append(
+                [rng.choice(['acc', 'nop']), rng.randint(-50, 50)]
+            )
+    instructions.append(['acc', 1])
+
+    execution_path = []
+    line_number = 1
+    while line_number <= size:
+        execution_path.append(line_number)
+        name, argument = instructions[line_number-1]
+        line_number += argument if name == 'jmp' else 1
+    corrupted_line_number = rng.choice(execution_path[1:-1])
+    target_line_number = rng.choice(
+        execution_path[:execution_path.index(corrupted_line_number)]
+    )
+    instructions[corrupted_line_number-1] = [
+        'jmp', target_line_number - corrupted_line_number
+    ]
+    return ''.join(
+        f'{name} {argument:+d}\n' for name, argument in instructions
+    )
+
+def generate_day09(rng, size, preamble_length=25):
+    """ size cypher values, with one flaw equal to a contiguous sum; values
+    must be sums of earlier values, so they grow roughly as 2**(size/25) """
+    size = max(size, 2 * preamble_length + 2)
+    values = rng.sample(range(1, 100), preamble_length)
+    flaw_position = size // 2
+    while len(values) < size:
+        if len(values) == flaw_position:
+            window = values[-preamble_length:]
+            pairwise_sums = {
+                v1 + v2 for v1 in window for v2 in window if v1 != v2
+            }
+            while True:
+                weakness_start = rng.randint(0, preamble_length - 3)
+                weakness_length = rng.randint(2, 3)
+                flaw = sum(
+                    values[weakness_start:weakness_start+weakness_length]
+                )
+                if flaw not in pairwise_sums:
+                    break
+            values.append(flaw)
+            continue
+        window = sorted(set(values[-preamble_length:]))
+        v1, v2 = rng.sample(window[:3], 2)
+        values.append(v1 + v2)
+    return ''.join(f'{v}\n' for v in values)
+
+def generate_day10(rng, size):
+    """ size adapter joltages, with runs of 1-jolt differences up to 4 long """
+    joltages = []
+    joltage = 0
+    while len(joltages) < size:
+        for _ in range(rng.randint(1, 4)):
+            joltage += 1
+            joltages.append(joltage)
+        joltage += 2
+    joltages = joltages[:size]
+    rng.shuffle(joltages)
+    return ''.join(f'{v}\n' for v in joltages)
+
+def random_aisles(rng, size, min_gap, max_gap):
+    """ Return set of indices below size spaced by random gaps """
+    aisles = set()
+    index = rng.randint(min_gap, max_gap)
+    while index < size:
+        aisles.add(index)
+        index += rng.randint(min_gap, max_gap)
+    return aisles
+
+def generate_day11(rng, size):
+    """ size by size seat map laid out in blocks between mostly-floor aisles,
+    like the provided data file, that converges under both parts' rules by
+    construction: floor replaces any seat whose four neighbors preceding it
+    in reading order (up-left, up, up-right, and left) would all be seats
+
+    Starting from all seats empty, every seat fills, seats with at least
+    the tolerated number of occupied neighbors empty, and seats next to
+    those that stay occupied stay empty for good; the seats left then
+    repeat the same cycle among themselves, so the rules converge unless
+    some remaining group of seats all have that many neighbors in it. The
+    last seat of any group in reading order has at most one neighbor in
+    each preceding direction within it, which is at most four visible seats
+    (below the Part 2 tolerance of five) and, with floor placed as above,
+    at most three adjacent seats (below the Part 1 tolerance of four). """
+    aisle_rows = random_aisles(rng, size, 4, 7)
+    aisle_columns = random_aisles(rng, size, 4, 10)
+
+    def floor_probability(row, column):
+        if row in aisle_rows:
+            return 0.6
+        if column in aisle_columns:
+            return 0.9
+        return 0.03
+
+    lines = []
+    previous_line = '.' * (size + 2)
+    for row in range(size):
+        line = ['.']
+        for column in range(size):
+            preceding_seats = (
+                line[-1] + previous_line[column:column + 3] == 'LLLL'
+            )
+            if (
+                rng.random() < floor_probability(row, column) or
+                preceding_seats
+            ):
+                line.append('.')
+            else:
+                line.append('L')
+        previous_line = ''.join(line) + '.'
+        lines.append(previous_line[1:-1] + '\n')
+    return ''.join(lines)
+
+def generate_day12(rng, size):
+    """ size ship navigation instructions """
+    lines = []
+    for _ in range(size):
+        cmd = rng.choice('NSEWLRFF')
+        if cmd in 'LR':
+            arg = rng.choice([90, 180, 270])
+        else:
+            arg = rng.randint(1, 100)
+        lines.append(f'{cmd}{arg}\n')
+    return ''.join(lines)
+
+def generate_day13(rng, size):
+    """ size bus schedule entries, with distinct primes for in-service buses
+    so that the Part 2 system of congruences always has a solution """
+    size = max(size, 2)
+    bus_positions = sorted(
+        [0] + rng.sample(range(1, size), max(size // 5, 1))
+    )
+    bus_numbers = first_primes(len(bus_positions), minimum=13)
+    rng.shuffle(bus_numbers)
+    schedule = ['x'] * size
+    for position, bus_number in zip(bus_positions, bus_numbers):
+        schedule[position] = str(bus_number)
+    return f'{rng.randint(10**5, 10**7)}\n{",".join(schedule)}\n'
+
+def generate_day14(rng, size, max_floating_bits=9):
+    """ size memory writes, under masks with at most 9 floating bits """
+    lines = []
+    writes = 0
+    while writes < size:
+        mask = [rng.choice('01') for _ in range(36)]
+        for position in rng.sample(
+            range(36), rng.randint(0, max_floating_bits)
+        ):
+            mask[position] = 'X'
+        lines.append(f'mask = {"".join(mask)}\n')
+        for _ in range(min(rng.randint(1, 6), size - writes)):
+            lines.append(
+                f'mem[{rng.randint(0, 2**16)}] = {rng.randint(0, 2**30)}\n'
+            )
+            writes += 1
+    return ''.join(lines)
+
+def generate_day15(rng, size):
+    """ size distinct starting values for the memory game """
+    return ','.join(str(v) for v in rng.sample(range(size * 3), size)) + '\n'
+
+def generate_day16(rng, size, number_of_fields=20):
+    """ size nearby tickets, with nested validation rules so that field
+    positions are determined uniquely by elimination """
+    field_names = [
+        f'departure {word}' for word in unique_words(rng, 6)
+    ] + [
+        f'{word1} {word2}'
+        for word1, word2 in zip(
+            unique_words(rng, number_of_fields - 6),
+            unique_words(rng, number_of_fields - 6),
+        )
+    ]
+    field_names = field_names[:number_of_fields]
+    rng.shuffle(field_names)
+    upper_bounds = [
+        1000 + 10 * (number_of_fields - k) - 1
+        for k in range(number_of_fields)
+    ]
+    lines = [
+        f'{name}: 1-100 or 1000-{upper_bound}\n'
+        for name, upper_bound in zip(field_names, upper_bounds)
+    ]
+    positions = list(range(number_of_fields))
+    rng.shuffle(positions)
+
+    def random_ticket():
+        return [rng.randint(1, 100) for _ in range(number_of_fields)]
+
+    lines.append(f'\nyour ticket:\n{",".join(map(str, random_ticket()))}\n')
+    lines.append('\nnearby tickets:\n')
+    nearby_tickets = [random_ticket() for _ in range(max(size, 1))]
+    for k, position in enumerate(positions):
+        rng.choice(nearby_tickets)[position] = upper_bounds[k]
+    for ticket in rng.sample(nearby_tickets, len(nearby_tickets) // 4):
+        if max(ticket) <= 100:
+            ticket[rng.randrange(number_of_fields)] = rng.randint(101, 999)
+    lines.extend(
+        f'{",".join(map(str, ticket))}\n' for ticket in nearby_tickets
+    )
+    return ''.join(lines)
+
+def generate_day17(rng, size):
+    """ size by size initial slice of Conway Cubes """
+    return ''.join(
+        ''.join('#' if rng.random() < 0.5 else '.' for _ in range(size))
+        + '\n'
+        for _ in range(size)
+    )
+
+def generate_day18(rng, size, max_depth=3):
+    """ size arithmetic expressions with nested parentheses """
+
+    def expression(depth):
+        terms = []
+        for _ in range(rng.randint(2, 5)):
+            if depth < max_depth and rng.random() < 0.3:
+                terms.append(f'({expression(depth + 1)})')
+            else:
+                terms.append(str(rng.randint(1, 9)))
+        return ' '.join(
+            term if n == 0 else f'{rng.choice("+*")} {term}'
+            for n, term in enumerate(terms)
+        )
+
+    return ''.join(f'{expression(0)}\n' for _ in range(size))
+
+def generate_day19(rng, size, chunk_length=8):
+    """ size messages, for rules where Rule 42 (31) matches strings of a
+    fixed length with an even (odd) number of b's """
+    reserved_rule_numbers = {0, 8, 11, 31, 42}
+    free_rule_numbers = [
+        n for n in range(4 * chunk_length + 10)
+        if n not in reserved_rule_numbers
+    ]
+    rng.shuffle(free_rule_numbers)
+    rule_a, rule_b = free_rule_numbers.pop(), free_rule_numbers.pop()
+    even_rules = {1: rule_a}
+    odd_rules = {1: rule_b}
+    for length in range(2, chunk_length + 1):
+        even_rules[length] = (
+            42 if length == chunk_length else free_rule_numbers.pop()
+        )
+        odd_rules[length] = (
+            31 if length == chunk_length else free_rule_numbers.pop()
+        )
+    rules = {
+        0: '8 11',
+        8: '42',
+        11: '42 31',
+        rule_a: '"a"',
+        rule_b: '"b"',
+    }
+    for length in range(2, chunk_length + 1):
+        rules[even_rules[length]] = (
+            f'{rule_a} {even_rules[length-1]} | '
+            f'{rule_b} {odd_rules[length-1]}'
+        )
+        rules[odd_rules[length]] = (
+            f'{rule_a} {odd_rules[length-1]} | '
+            f'{rule_b} {even_rules[length-1]}'
+        )
+    rule_lines = [f'{n}: {rule}\n' for n, rule in rules.items()]
+    rng.shuffle(rule_lines)
+
+    def chunk(parity):
+        while True:
+            candidate = ''.join(rng.choices('ab', k=chunk_length))
+            if candidate.count('b') % 2 == parity:
+                return candidate
+
+    messages = []
+    for _ in range(size):
+        chunks_for_31 = rng.randint(1, 3)
+        chunks_for_42 = chunks_for_31 + rng.randint(0, 2)
+        message = (
+            ''.join(chunk(0) for _ in range(chunks_for_42)) +
+            ''.join(chunk(1) for _ in range(chunks_for_31))
+        )
+        if rng.random() < 0.2:
+            message += rng.choice('ab')
+        messages.append(f'{message}\n')
+    return ''.join(rule_lines) + '\n' + ''.join(messages)
+
+def generate_day20(rng, size, tile_size=None):
+    """ size by size grid of image tiles in random orientations, with sea
+    monsters planted in the assembled image; tile_size defaults to the
+    smallest size keeping all edges unique, and at least 10 """
+    size = max(size, 2)
+    number_of_edges = 2 * size * (size + 1)
+    if tile_size is None:
+        tile_size = max(10, ceil(log2(number_of_edges)) + 6)
+    step = tile_size - 1
+    image_size = size * step + 1
+    image = [
+        [rng.choice('.#') for _ in range(image_size)]
+        for _ in range(image_size)
+    ]
+
+    # Plant sea monsters in the image without tile borders.
+    sea_monster = [
+        '                  # ',
+        '#    ##    ##    ###',
+        ' #  #  #  #  #  #   ',
+    ]
+    inner_size = tile_size - 2
+    borderless_size = size * inner_size
+
+    def image_coordinate(borderless_coordinate):
+        tile_index, offset = divmod(borderless_coordinate, inner_size)
+        return tile_index * step + 1 + offset
+
+    monster_count = max(size * size // 4, 1)
+    if borderless_size < len(sea_monster[0]):
+        monster_count = 0
+    for _ in range(monster_count):
+        top = rng.randrange(borderless_size - 2)
+        left = rng.randrange(borderless_size - 19)
+        for i, monster_row in enumerate(sea_monster):
+            for j, monster_char in enumerate(monster_row):
+                if monster_char == '#':
+                    image[image_coordinate(top + i)][
+                        image_coordinate(left + j)
+                    ] = '#'
+
+    # Re-randomize tile edges until all are unique, including when flipped.
+    def edge_coordinates(row, column):
+        top, left = row * step, column * step
+        return {
+            ('h', row, column): [(top, left + k) for k in range(tile_size)],
+            ('v', row, column): [(top + k, left) for k in range(tile_size)],
+            ('h', row + 1, column): [
+                (top + step, left + k) for k in range(tile_size)
+            ],
+            ('v', row, column + 1): [
+                (top + k, left + step) for k in range(tile_size)
+            ],
+        }
+
+    all_edges = {}
+    for row in range(size):
+        for column in range(size):
+            all_edges.update(edge_coordinates(row, column))
+    while True:
+        seen_edges = {}
+        duplicate_edges = []
+        for edge_key, coordinates in all_edges.items():
+            edge = ''.join(image[r][c] for r, c in coordinates)
+            canonical_edge = min(edge, edge[::-1])
+            if edge == edge[::-1] or canonical_edge in seen_edges:
+                duplicate_edges.append(edge_key)
+            seen_edges[canonical_edge] = edge_key
+        if not duplicate_edges:
+            break
+        for edge_key in duplicate_edges:
+            for r, c in all_edges[edge_key][1:-1]:
+                image[r][c] = rng.choice('.#')
+
+    # Cut tiles from image, and apply random rotations/flips.
+    def transform(tile):
+        for _ in range(rng.randrange(4)):
+            tile = [''.join(row) for row in zip(*tile[::-1])]
+        if rng.random() < 0.5:
+            tile = [row[::-1] for row in tile]
+        return tile
+
+    tile_ids = rng.sample(range(1000, 1000 + 10 * size * size), size * size)
+    tiles = []
+    for row in range(size):
+        for column in range(size):
+            top, left = row * step, column * step
+            tile = [
+                ''.join(image[top + i][left:left + tile_size])
+                for i in range(tile_size)
+            ]
+            tiles.append(transform(tile))
+    order = list(range(len(tiles)))
+    rng.shuffle(order)
+    return '\n'.join(
+        f'Tile {tile_ids[n]}:\n' + ''.join(f'{row}\n' for row in tiles[n])
+        for n in order
+    )
+
+def generate_day21(rng, size, number_of_allergens=8, pantry_size=None):
+    """ size nutritional labels, with each allergen in exactly one ingredient
+    and enough labels for allergens to be determined by elimination """
+    if pantry_size is None:
+        pantry_size = max(4 * number_of_allergens, min(size, 200))
+    allergens = unique_words(rng, number_of_allergens)
+    ingredients = unique_words(rng, pantry_size, 4, 8)
+    dangerous_ingredients = dict(
+        zip(allergens, rng.sample(ingredients, number_of_allergens))
+    )
+    safe_ingredients = sorted(
+        set(ingredients) - set(dangerous_ingredients.values())
+    )
+
+    def label(label_allergens, safe_sample):
+        label_ingredients = safe_sample + [
+            dangerous_ingredients[allergen] for allergen in label_allergens
+        ]
+        rng.shuffle(label_ingredients)
+        return (
+            f'{" ".join(label_ingredients)} '
+            f'(contains {", ".join(sorted(label_allergens))})\n'
+        )
+
+    lines = []
+    for allergen in allergens:
+        shuffled_safe_ingredients = rng.sample(
+            safe_ingredients, len(safe_ingredients)
+        )
+        half = len(shuffled_safe_ingredients) // 2
+        lines.append(label([allergen], shuffled_safe_ingredients[:half][:10]))
+        lines.append(label([allergen], shuffled_safe_ingredients[half:][:10]))
+    while len(lines) < size:
+        lines.append(label(
+            rng.sample(allergens, rng.randint(1, 3)),
+            rng.sample(safe_ingredients, rng.randint(1, 10)),
+        ))
+    rng.shuffle(lines)
+    return ''.join(lines)
+
+def generate_day22(rng, size):
+    """ Two Space Card decks with size cards each """
+    cards = list(range(1, 2 * size + 1))
+    rng.shuffle(cards)
+    return (
+        'Player 1:\n' + ''.join(f'{card}\n' for card in cards[:size]) +
+        '\nPlayer 2:\n' + ''.join(f'{card}\n' for card in cards[size:])
+    )
+
+def generate_day23(rng, size):
+    """ Cup labels 1-9 in random order; the format holds single-digit labels,
+    so size is ignored """
+    labels = list(range(1, 10))
+    rng.shuffle(labels)
+    return ''.join(map(str, labels)) + '\n'
+
+def generate_day24(rng, size):
+    """ size tile paths """
+    return ''.join(
+        ''.join(
+            rng.choice(['e', 'se', 'sw', 'w', 'nw', 'ne'])
+            for _ in range(rng.randint(10, 20))
+        ) + '\n'
+        for _ in range(size)
+    )
+
+def generate_day25(rng, size, base=7, modulus=20201227):
+    """ Card and door public keys with loop sizes of at most size """
+    loop_sizes = [rng.randint(1, min(max(size, 1), modulus - 2)) for _ in '12']
+    return ''.join(
+        f'{pow(base, loop_size, modulus)}\n' for loop_size in loop_sizes
+    )
+
+GENERATORS = {
+    int(name[len('generate_day'):]): generator
+    for name, generator in sorted(globals().items())
+    if name.startswith('generate_day')
+}
+
+def generate_input(day, size, seed=0):
+    """ Return synthetic input text for specified day, size, and seed """
+    return GENERATORS[int(day)](random.Random(f'{day}-{size}-{seed}'), size)
+
+def synthetic_file_name(day, size, seed=0):
+    """ Return file name used for synthetic input of specified day """
+    return f'day{int(day):02d}-size{size}-seed{seed}.txt'
+
+def build_argument_parser():
+    """ Return command-line argument parser for synthetic input generators """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to generate inputs for, e.g. 1 2 5-9 (default: all days)'
+    )
+    parser.add_argument(
+        '--size', type=int, nargs='+', required=True,
+        help='one or more sizes to generate inputs for'
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='seed for the deterministic random number generator'
+    )
+    parser.add_argument(
+        '--output-dir', default='synthetic_data',
+        help='directory to write generated inputs to'
+    )
+    return parser
+
+def main(argv=None):
+    """ Write synthetic inputs from the command line """
+    args = build_argument_parser().parse_args(argv)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for day in parse_days(args.days):
+        for size in args.size:
+            output_path = (
+                output_dir / synthetic_file_name(day, size, args.seed)
+            )
+            output_path.write_text(generate_input(day, size, args.seed))
+            print(f'Wrote {output_path}')
+
+
+if __name__ == '__main__':
+    main()
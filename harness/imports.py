@@ -0,0 +1,169 @@
+""" Report cold import time of each day's solution module
+
+Each day's module is imported in a fresh interpreter run with -X importtime,
+which reports the cumulative time spent importing every module. The fastest
+of --repeat runs is reported per day (so one-off disk or bytecode compilation
+delays are excluded), along with the direct imports of the day's module that
+took longest, which usually pinpoint a heavy third-party dependency. With
+--budget, the command exits non-zero when any day's cold import exceeds its
+budget. Example usage, from the repo root:
+
+    python -m harness.imports --days 1-25 --top 3 --budget 50 11=200
+"""
+
+# import modules used below.
+import argparse
+import json
+import subprocess
+import sys
+
+# import local modules used below.
+from harness.solvers import module_name, parse_days, REPO_ROOT
+
+
+def parse_import_times(importtime_output):
+    """ Return (depth, module, self seconds, cumulative seconds) for each
+    line of -X importtime output, in the order reported (i.e., each module
+    after the modules it imports) """
+    import_times = []
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, cumulative_time, name = line[12:].split('|')
+        if not self_time.strip().isdigit():
+            continue
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        import_times.append((
+            depth,
+            module,
+            int(self_time) / 1e6,
+            int(cumulative_time) / 1e6,
+        ))
+    return import_times
+
+def measure_import(module, top=5):
+    """ Return cold import time of a module in a fresh interpreter, in
+    seconds, and its top direct imports by cumulative time """
+    completed_process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = parse_import_times(completed_process.stderr)
+    total_time = None
+    direct_imports = []
+    for depth, name, _, cumulative_time in reversed(import_times):
+        if depth == 0:
+            if total_time is not None:
+                break
+            if name == module:
+                total_time = cumulative_time
+        elif depth == 1 and total_time is not None:
+            direct_imports.append({'module': name, 'seconds': cumulative_time})
+    direct_imports.sort(key=lambda entry: entry['seconds'], reverse=True)
+    return total_time, direct_imports[:top]
+
+def measure_day(day, repeat=3, top=5):
+    """ Return fastest cold import time of a day's module over repeated
+    runs, and its top direct imports from that run """
+    total_time, top_imports = min(
+        (measure_import(module_name(day), top) for _ in range(repeat)),
+        key=lambda measurement: measurement[0],
+    )
+    return {'seconds': total_time, 'top_imports': top_imports}
+
+def parse_budgets(budget_specs):
+    """ Return default budget and per-day budgets in seconds, given specs
+    such as '50' (milliseconds for all days) or '11=200' (milliseconds for
+    Day 11) """
+    default_budget = None
+    day_budgets = {}
+    for budget_spec in budget_specs or []:
+        if '=' in budget_spec:
+            day, budget = budget_spec.split('=')
+            day_budgets[int(day)] = float(budget) / 1000
+        else:
+            default_budget = float(budget_spec) / 1000
+    return default_budget, day_budgets
+
+def find_budget_violations(results, default_budget=None, day_budgets=None):
+    """ Return (day, import time, budget) for days exceeding budgets """
+    day_budgets = day_budgets or {}
+    violations = []
+    for day, result in results.items():
+        budget = day_budgets.get(day, default_budget)
+        if budget is not None and result['seconds'] > budget:
+            violations.append((day, result['seconds'], budget))
+    return violations
+
+def format_report(results):
+    """ Return human-readable report of cold import times """
+    lines = []
+    for day, result in results.items():
+        lines.append(
+            f'Day {day:>2} {module_name(day)}: '
+            f'{result["seconds"] * 1000:.1f} ms'
+        )
+        for entry in result['top_imports']:
+            lines.append(
+                f'    {entry["seconds"] * 1000:>8.1f} ms  {entry["module"]}'
+            )
+    return '\n'.join(lines)
+
+def build_argument_parser():
+    """ Return command-line argument parser for import-time report """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to measure, e.g. 1 2 5-9 (default: all days)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of cold imports per day, keeping the fastest '
+        '(default: 3)'
+    )
+    parser.add_argument(
+        '--top', type=int, default=5,
+        help='number of slowest direct imports to report per day '
+        '(default: 5)'
+    )
+    parser.add_argument(
+        '--budget', nargs='*', default=None,
+        help='cold import budget in milliseconds, either for all days '
+        '(e.g. 50) or for one day (e.g. 11=200)'
+    )
+    parser.add_argument(
+        '--output', default=None,
+        help='path of JSON report to write (default: print report only)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Report cold import times from the command line, exiting non-zero
+    when a budget is exceeded """
+    args = build_argument_parser().parse_args(argv)
+    results = {
+        day: measure_day(day, args.repeat, args.top)
+        for day in parse_days(args.days)
+    }
+    print(format_report(results))
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2)
+    violations = find_budget_violations(results, *parse_budgets(args.budget))
+    for day, import_time, budget in violations:
+        print(
+            f'Budget exceeded for Day {day} import: '
+            f'{import_time * 1000:.1f} ms > {budget * 1000:.1f} ms',
+            file=sys.stderr,
+        )
+    if violations:
+        sys.exit(1)
+    return results
+
+
+if __name__ == '__main__':
+    main()
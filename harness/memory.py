@@ -0,0 +1,207 @@
+""" Report peak traced memory and top allocation sites per day and phase
+
+Each phase of each day runs under tracemalloc in the current process. While
+it runs, a sampling thread snapshots the traced allocations whenever their
+total reaches a new high, so the reported top sites are those alive at (or
+near) the phase's peak, including temporaries freed before it returns. The
+sites still alive when the phase returns (i.e., mostly its result) are
+reported separately as retained sites. With --budget, the command exits
+non-zero when any phase's peak exceeds its budget. Example usage, from the
+repo root:
+
+    python -m harness.memory --days 15 23 --top 5 --budget 256 23=512
+"""
+
+# import modules used below.
+import argparse
+import gc
+import json
+import sys
+import threading
+import tracemalloc
+
+# import local modules used below.
+from harness.solvers import data_file, load_day, parse_days, PHASES
+
+
+def summarize_sites(snapshot, top=10):
+    """ Return largest allocation sites in a tracemalloc snapshot """
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    return [
+        {
+            'site': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+            'size_bytes': stat.size,
+            'count': stat.count,
+        }
+        for stat in snapshot.statistics('lineno')[:top]
+    ]
+
+class PeakSampler(threading.Thread):
+    """ Thread snapshotting traced allocations whenever their total exceeds
+    that of the previous snapshot by more than the given growth factor """
+
+    def __init__(self, interval=0.01, growth=1.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_memory = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            current_memory, _ = tracemalloc.get_traced_memory()
+            if current_memory > self.snapshot_memory * self.growth:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_memory = current_memory
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+def trace_phase(func, arg, top=10, frames=1):
+    """ Return result of func(arg), its peak traced memory in bytes, its top
+    allocation sites sampled at (or near) the peak, and its top allocation
+    sites still alive when it returns """
+    gc.collect()
+    tracemalloc.start(frames)
+    sampler = PeakSampler()
+    sampler.start()
+    try:
+        result = func(arg)
+    finally:
+        sampler.stop()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        final_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    current_memory = sum(
+        stat.size for stat in final_snapshot.statistics('filename')
+    )
+    peak_snapshot = final_snapshot
+    if sampler.snapshot and sampler.snapshot_memory > current_memory:
+        peak_snapshot = sampler.snapshot
+    return (
+        result,
+        peak_memory,
+        summarize_sites(peak_snapshot, top),
+        summarize_sites(final_snapshot, top),
+    )
+
+def trace_day(day, text_or_path=None, top=10):
+    """ Return peak memory and top allocation sites per phase for a day """
+    module = load_day(day)
+    argument = data_file(day) if text_or_path is None else text_or_path
+    phase_results = {}
+    for phase in PHASES:
+        result, peak_memory, top_sites, retained_sites = trace_phase(
+            getattr(module, phase), argument, top
+        )
+        phase_results[phase] = {
+            'peak_memory_bytes': peak_memory,
+            'top_sites': top_sites,
+            'retained_sites': retained_sites,
+        }
+        if phase == 'parse':
+            argument = result
+    return phase_results
+
+def parse_budgets(budget_specs):
+    """ Return default budget and per-day budgets in bytes, given specs such
+    as '256' (MiB for all days) or '15=512' (MiB for Day 15) """
+    default_budget = None
+    day_budgets = {}
+    for budget_spec in budget_specs or []:
+        if '=' in budget_spec:
+            day, budget = budget_spec.split('=')
+            day_budgets[int(day)] = float(budget) * 2**20
+        else:
+            default_budget = float(budget_spec) * 2**20
+    return default_budget, day_budgets
+
+def find_budget_violations(results, default_budget=None, day_budgets=None):
+    """ Return (day, phase, peak, budget) for phases exceeding budgets """
+    day_budgets = day_budgets or {}
+    violations = []
+    for day, phase_results in results.items():
+        budget = day_budgets.get(day, default_budget)
+        if budget is None:
+            continue
+        for phase, phase_result in phase_results.items():
+            if phase_result['peak_memory_bytes'] > budget:
+                violations.append(
+                    (day, phase, phase_result['peak_memory_bytes'], budget)
+                )
+    return violations
+
+def format_report(results):
+    """ Return human-readable report of peak memory and top sites """
+    lines = []
+    for day, phase_results in results.items():
+        for phase, phase_result in phase_results.items():
+            lines.append(
+                f'Day {day} {phase}: peak '
+                f'{phase_result["peak_memory_bytes"] / 2**20:.2f} MiB'
+            )
+            for sites_key, heading in (
+                ('top_sites', 'at peak'),
+                ('retained_sites', 'retained'),
+            ):
+                lines.append(f'  top sites {heading}:')
+                for site in phase_result[sites_key]:
+                    lines.append(
+                        f'    {site["size_bytes"] / 2**20:>9.2f} MiB '
+                        f'{site["count"]:>9} blocks  {site["site"]}'
+                    )
+    return '\n'.join(lines)
+
+def build_argument_parser():
+    """ Return command-line argument parser for memory report """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to trace, e.g. 1 2 5-9 (default: all days)'
+    )
+    parser.add_argument(
+        '--top', type=int, default=10,
+        help='number of allocation sites to report per phase (default: 10)'
+    )
+    parser.add_argument(
+        '--budget', nargs='*', default=None,
+        help='peak-memory budget per phase in MiB, either for all days '
+        '(e.g. 256) or for one day (e.g. 15=512)'
+    )
+    parser.add_argument(
+        '--output', default=None,
+        help='path of JSON report to write (default: print report only)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Report memory usage from the command line, exiting non-zero when a
+    budget is exceeded """
+    args = build_argument_parser().parse_args(argv)
+    results = {
+        day: trace_day(day, top=args.top) for day in parse_days(args.days)
+    }
+    print(format_report(results))
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2)
+    violations = find_budget_violations(results, *parse_budgets(args.budget))
+    for day, phase, peak_memory, budget in violations:
+        print(
+            f'Budget exceeded for Day {day} {phase}: '
+            f'{peak_memory / 2**20:.2f} MiB > {budget / 2**20:.2f} MiB',
+            file=sys.stderr,
+        )
+    if violations:
+        sys.exit(1)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+""" Profile parse/part1/part2 of each day with cProfile and hot-loop counters
+
+Stats for each phase are dumped to dayNN-<phase>.prof files (viewable with
+pstats or snakeviz), and the top functions by cumulative time are printed.
+Solution modules may also expose a hot_loop_stats Counter, whose values are
+reported per phase. Example usage, from the repo root:
+
+    python -m harness.profiling --days 11 22 23 --top 15 --output-dir prof
+"""
+
+# import modules used below.
+import argparse
+import cProfile
+import io
+from pathlib import Path
+import pstats
+
+# import local modules used below.
+from harness.solvers import data_file, load_day, parse_days, PHASES
+
+
+def profile_phase(func, arg, profile_path=None, top=0):
+    """ Return result of func(arg), profile stats summary, and its top-N """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, arg)
+    if profile_path is not None:
+        profiler.dump_stats(profile_path)
+    stats_stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stats_stream)
+    if top:
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result, {
+        'total_calls': stats.total_calls,
+        'total_time': stats.total_tt,
+    }, stats_stream.getvalue()
+
+def profile_day(day, text_or_path=None, output_dir=None, top=0):
+    """ Return per-phase profile summaries and hot-loop counters for a day """
+    module = load_day(day)
+    hot_loop_stats = getattr(module, 'hot_loop_stats', None)
+    argument = data_file(day) if text_or_path is None else text_or_path
+    phase_results = {}
+    for phase in PHASES:
+        if hot_loop_stats is not None:
+            hot_loop_stats.clear()
+        profile_path = None
+        if output_dir is not None:
+            profile_path = Path(output_dir) / f'day{day:02d}-{phase}.prof'
+        result, summary, top_functions = profile_phase(
+            getattr(module, phase), argument, profile_path, top
+        )
+        if hot_loop_stats is not None:
+            summary['hot_loop_stats'] = dict(hot_loop_stats)
+        if profile_path is not None:
+            summary['profile_path'] = str(profile_path)
+        summary['top_functions'] = top_functions
+        phase_results[phase] = summary
+        if phase == 'parse':
+            argument = result
+    return phase_results
+
+def build_argument_parser():
+    """ Return command-line argument parser for profiler """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to profile, e.g. 1 2 5-9 (default: all days)'
+    )
+    parser.add_argument(
+        '--top', type=int, default=20,
+        help='number of functions to print by cumulative time (default: 20)'
+    )
+    parser.add_argument(
+        '--output-dir', default='profiles',
+        help='directory to write .prof files to (default: profiles)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Profile selected days from the command line """
+    args = build_argument_parser().parse_args(argv)
+    Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    results = {}
+    for day in parse_days(args.days):
+        results[day] = profile_day(
+            day, output_dir=args.output_dir, top=args.top
+        )
+        for phase, summary in results[day].items():
+            print(
+                f'Day {day} {phase}: {summary["total_calls"]} calls in '
+                f'{summary["total_time"]:.3f}s, '
+                f'stats written to {summary["profile_path"]}'
+            )
+            if summary.get('hot_loop_stats'):
+                print(f'Hot-loop counters: {summary["hot_loop_stats"]}')
+            print(summary['top_functions'])
+    return results
+
+
+if __name__ == '__main__':
+    main()
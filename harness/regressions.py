@@ -0,0 +1,276 @@
+""" Compare benchmark reports against a stored baseline and flag regressions
+
+Median timings of each (day, input, phase) in a fresh benchmark report are
+compared with those in the baseline report (by default the checked-in
+harness/benchmark_baseline.json). A phase regresses when its median exceeds
+the baseline median by more than both the relative tolerance and the
+absolute noise floor, in which case the command exits non-zero. Example
+usage, from the repo root:
+
+    python -m harness.benchmark --days 1-10 --repeat 5 --output bench.json
+    python -m harness.regressions bench.json --tolerance 0.25 17=0.5
+    python -m harness.regressions --run --days 1-10 --update-baseline
+
+With --run, the fresh benchmark uses the repeat and warm-up counts recorded
+in the baseline's metadata unless overridden. With --update-baseline, fresh
+results replace baseline results for the same (day, input), leaving other
+baseline results in place; the update is refused when any phase regressed,
+unless --force is also given.
+
+The checked-in baseline must be refreshed whenever a solver changes (in the
+same change, once its timings are confirmed to be intended), e.g., with
+--run --days N --update-baseline for the changed days, or with --force for
+deliberate slowdowns; otherwise later comparisons measure against timings of
+code that no longer exists.
+"""
+
+# import modules used below.
+import argparse
+import json
+import sys
+
+# import local modules used below.
+from harness.benchmark import run_benchmarks
+from harness.solvers import parse_days, REPO_ROOT
+
+
+BASELINE_PATH = REPO_ROOT / 'harness' / 'benchmark_baseline.json'
+
+
+def load_report(report_path):
+    """ Read benchmark report from specified JSON file """
+    with open(report_path) as fp:
+        return json.load(fp)
+
+def median_timings(report):
+    """ Return mapping of (day, input, phase) to median timing in seconds """
+    return {
+        (result['day'], result['input'], phase): summary['median']
+        for result in report['results']
+        for phase, summary in result['phases'].items()
+    }
+
+def parse_tolerances(tolerance_specs, default_tolerance=0.25):
+    """ Return default tolerance and per-day tolerances, given specs such as
+    '0.25' (for all days) or '17=0.5' (for Day 17) """
+    day_tolerances = {}
+    for tolerance_spec in tolerance_specs or []:
+        if '=' in tolerance_spec:
+            day, tolerance = tolerance_spec.split('=')
+            day_tolerances[int(day)] = float(tolerance)
+        else:
+            default_tolerance = float(tolerance_spec)
+    return default_tolerance, day_tolerances
+
+def compare_reports(
+    baseline, fresh, default_tolerance=0.25, day_tolerances=None,
+    noise_floor=0.002,
+):
+    """ Return comparison rows for phases present in either report """
+    day_tolerances = day_tolerances or {}
+    baseline_medians = median_timings(baseline)
+    fresh_medians = median_timings(fresh)
+    rows = []
+    for key in sorted(baseline_medians.keys() | fresh_medians.keys()):
+        day, input_label, phase = key
+        baseline_median = baseline_medians.get(key)
+        fresh_median = fresh_medians.get(key)
+        tolerance = day_tolerances.get(day, default_tolerance)
+        if baseline_median is None:
+            status = 'new'
+        elif fresh_median is None:
+            status = 'missing'
+        elif (
+            fresh_median > baseline_median * (1 + tolerance) and
+            fresh_median - baseline_median > noise_floor
+        ):
+            status = 'REGRESSED'
+        elif (
+            fresh_median < baseline_median / (1 + tolerance) and
+            baseline_median - fresh_median > noise_floor
+        ):
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append({
+            'day': day,
+            'input': input_label,
+            'phase': phase,
+            'baseline_median': baseline_median,
+            'fresh_median': fresh_median,
+            'tolerance': tolerance,
+            'status': status,
+        })
+    return rows
+
+def merge_reports(baseline, fresh):
+    """ Return baseline report with results replaced or added by those of
+    fresh report for the same (day, input), skipping failed fresh results """
+    fresh_results = {
+        (result['day'], result['input']): result
+        for result in fresh['results'] if 'error' not in result
+    }
+    results = [
+        fresh_results.pop((result['day'], result['input']), result)
+        for result in baseline['results']
+    ]
+    results.extend(fresh_results.values())
+    return {
+        'metadata': fresh['metadata'],
+        'results': sorted(
+            results, key=lambda result: (result['day'], result['input'])
+        ),
+    }
+
+def format_comparison(rows):
+    """ Return human-readable diff table for comparison rows """
+    lines = [
+        f'{"day":>3}  {"input":<40} {"phase":<6} {"baseline (s)":>12} '
+        f'{"fresh (s)":>10} {"ratio":>7} {"tol":>5}  status'
+    ]
+    for row in rows:
+        baseline_median = row['baseline_median']
+        fresh_median = row['fresh_median']
+        ratio = (
+            f'{fresh_median / baseline_median:>7.2f}'
+            if baseline_median and fresh_median is not None else f'{"-":>7}'
+        )
+        lines.append(
+            f'{row["day"]:>3}  {row["input"][-40:]:<40} {row["phase"]:<6} '
+            + (
+                f'{baseline_median:>12.4f} ' if baseline_median is not None
+                else f'{"-":>12} '
+            )
+            + (
+                f'{fresh_median:>10.4f} ' if fresh_median is not None
+                else f'{"-":>10} '
+            )
+            + f'{ratio} {row["tolerance"]:>5.2f}  {row["status"]}'
+        )
+    return '\n'.join(lines)
+
+def build_argument_parser():
+    """ Return command-line argument parser for regression gate """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'fresh', nargs='?', default=None,
+        help='fresh benchmark JSON report to compare against the baseline'
+    )
+    parser.add_argument(
+        '--baseline', default=str(BASELINE_PATH),
+        help='baseline benchmark JSON report (default: checked-in baseline)'
+    )
+    parser.add_argument(
+        '--run', action='store_true',
+        help='run a fresh benchmark instead of reading one from a file'
+    )
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to benchmark with --run (default: days in baseline)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=None,
+        help='number of timed repetitions per phase with --run '
+        '(default: as recorded in the baseline, or 5)'
+    )
+    parser.add_argument(
+        '--warmup', type=int, default=None,
+        help='number of untimed warm-up calls per phase with --run '
+        '(default: as recorded in the baseline, or 1)'
+    )
+    parser.add_argument(
+        '--tolerance', nargs='*', default=None,
+        help='allowed relative slowdown of medians, either for all days '
+        '(e.g. 0.25, the default) or for one day (e.g. 17=0.5)'
+    )
+    parser.add_argument(
+        '--noise-floor', type=float, default=0.002,
+        help='absolute slowdown in seconds always treated as noise '
+        '(default: 0.002)'
+    )
+    parser.add_argument(
+        '--update-baseline', action='store_true',
+        help='merge the fresh results into the baseline after comparing, '
+        'unless any phase regressed'
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help='update the baseline with --update-baseline despite regressions'
+    )
+    return parser
+
+def main(argv=None):
+    """ Compare benchmark reports from the command line, exiting non-zero
+    when any phase regresses """
+    parser = build_argument_parser()
+    args = parser.parse_args(argv)
+    if args.fresh is None and not args.run:
+        parser.error('either a fresh report or --run is required')
+    try:
+        baseline = load_report(args.baseline)
+    except FileNotFoundError:
+        baseline = {'metadata': {}, 'results': []}
+    baseline_metadata = baseline.get('metadata', {})
+    if args.run:
+        days = args.days or sorted(
+            {result['day'] for result in baseline['results']}
+        )
+        fresh = run_benchmarks(
+            parse_days(days),
+            repeat=(
+                args.repeat if args.repeat is not None
+                else baseline_metadata.get('repeat', 5)
+            ),
+            warmup=(
+                args.warmup if args.warmup is not None
+                else baseline_metadata.get('warmup', 1)
+            ),
+            memory=False,
+        )
+    else:
+        fresh = load_report(args.fresh)
+    for setting in ('repeat', 'warmup'):
+        if (
+            setting in baseline_metadata and
+            fresh['metadata'].get(setting) != baseline_metadata[setting]
+        ):
+            print(
+                f'Warning: fresh {setting} of '
+                f'{fresh["metadata"].get(setting)} differs from baseline '
+                f'{setting} of {baseline_metadata[setting]}',
+                file=sys.stderr,
+            )
+    rows = compare_reports(
+        baseline,
+        fresh,
+        *parse_tolerances(args.tolerance),
+        noise_floor=args.noise_floor,
+    )
+    if args.run and args.days:
+        rows = [row for row in rows if row['status'] != 'missing']
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row['status'] == 'REGRESSED']
+    if args.update_baseline:
+        if regressions and not args.force:
+            print(
+                '\nNot updating the baseline because phases regressed; '
+                'pass --force to update it anyway.',
+                file=sys.stderr,
+            )
+        else:
+            with open(args.baseline, 'w') as fp:
+                json.dump(
+                    merge_reports(baseline, fresh), fp, indent=2, default=str
+                )
+    if regressions:
+        print(
+            f'\n{len(regressions)} phase(s) regressed beyond tolerance:\n'
+            f'{format_comparison(regressions)}',
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
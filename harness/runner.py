@@ -0,0 +1,457 @@
+""" Run selected days in parallel, scheduling the slowest days first
+
+Per-day wall times are used to submit the historically slowest days to the
+process pool first, so total wall time approaches that of the slowest single
+day. The checked-in harness/day_timings.json is a read-only seed for this,
+overlaid by any timings recorded locally with --record in the untracked
+harness/day_timings.local.json. Meanwhile, an asyncio event loop in the
+main process reads and parses each day's input in a thread pool, in schedule
+order, and submits each day to the process pool as soon as its input is
+ready, so reading and parsing later inputs overlaps with computing earlier
+days; the run summary reports how much of the prefetching was overlapped.
+Example usage, from the repo root:
+
+    python -m harness.runner --days 1-25 --workers 4 --output run.json
+    python -m harness.runner --record
+"""
+
+# import modules used below.
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import sys
+import time
+
+# import local modules used below.
+from common.answer_cache import (
+    AnswerCache,
+    CACHE_DIR_ENV as ANSWER_CACHE_DIR_ENV,
+    input_hash,
+    MAX_BYTES_ENV as ANSWER_CACHE_MAX_BYTES_ENV,
+    solver_version,
+)
+from common.parse_cache import CACHE_DIR_ENV
+from harness.profiling import profile_phase
+from harness.solvers import data_file, load_day, parse_days, REPO_ROOT
+
+
+# Days without recorded timings are scheduled first, so they get recorded.
+SEED_TIMINGS_PATH = REPO_ROOT / 'harness' / 'day_timings.json'
+TIMINGS_PATH = REPO_ROOT / 'harness' / 'day_timings.local.json'
+
+
+def load_recorded_timings(
+    timings_path=TIMINGS_PATH, seed_timings_path=SEED_TIMINGS_PATH
+):
+    """ Return mapping of day number to recorded wall time in seconds, with
+    timings recorded locally overriding the checked-in seed timings """
+    recorded_timings = {}
+    for path in (seed_timings_path, timings_path):
+        if path is None:
+            continue
+        try:
+            with open(path) as fp:
+                recorded_timings.update(json.load(fp))
+        except FileNotFoundError:
+            pass
+    return {int(day): seconds for day, seconds in recorded_timings.items()}
+
+def save_recorded_timings(timings, timings_path=TIMINGS_PATH):
+    """ Write mapping of day number to wall time in seconds """
+    with open(timings_path, 'w') as fp:
+        json.dump(
+            {str(day): round(timings[day], 4) for day in sorted(timings)},
+            fp,
+            indent=2,
+        )
+        fp.write('\n')
+
+def schedule_days(days, recorded_timings):
+    """ Return days ordered longest-job-first by recorded wall time """
+    return sorted(
+        days,
+        key=lambda day: recorded_timings.get(day, float('inf')),
+        reverse=True,
+    )
+
+def prefetch_input(day, text_or_path=None):
+    """ Return parsed input for one day, read and parsed in this thread,
+    along with its read/parse timings and its (wall clock) time interval """
+    started = time.time()
+    module = load_day(day)
+    path = data_file(day) if text_or_path is None else text_or_path
+    read_start_time = time.perf_counter()
+    text = path.read_text() if isinstance(path, os.PathLike) else path
+    parse_start_time = time.perf_counter()
+    parsed = module.parse(text)
+    parse_end_time = time.perf_counter()
+    prefetched = {
+        'parsed': parsed,
+        'timings': {
+            'read': parse_start_time - read_start_time,
+            'parse': parse_end_time - parse_start_time,
+        },
+        'interval': (started, time.time()),
+    }
+    if os.environ.get(ANSWER_CACHE_DIR_ENV):
+        prefetched['input_hash'] = input_hash(text)
+    return prefetched
+
+def solve_day(
+    day, text_or_path=None, profile_dir=None, prefetched=None,
+    parts=(1, 2), verify=False,
+):
+    """ Return answers and per-phase timings for specified parts of one
+    day, optionally dumping cProfile stats for each phase to profile_dir,
+    and skipping the parse phase given a result of prefetch_input. When the
+    answer cache is enabled, stored answers are returned without computing
+    them (and without parsing, if all parts are stored), unless verify is
+    set, in which case they are recomputed and compared """
+    started = time.time()
+    start_time = time.perf_counter()
+    module = load_day(day)
+    hot_loop_stats = getattr(module, 'hot_loop_stats', None)
+    if hot_loop_stats is not None:
+        hot_loop_stats.clear()
+    argument = data_file(day) if text_or_path is None else text_or_path
+    answers = {}
+    timings = {}
+    phases = [f'part{part}' for part in parts]
+    answer_cache = AnswerCache.from_environment()
+    expected_answers = {}
+    if answer_cache is not None:
+        cache_key = (
+            prefetched['input_hash'] if prefetched else input_hash(argument),
+            solver_version(module.__name__),
+        )
+        for phase in phases:
+            found, answer = answer_cache.get(day, phase, *cache_key)
+            if found and verify:
+                expected_answers[phase] = answer
+            elif found:
+                answers[phase] = answer
+        phases = [phase for phase in phases if phase not in answers]
+    if prefetched is not None:
+        argument = prefetched['parsed']
+        timings.update(prefetched['timings'])
+    elif phases:
+        phases.insert(0, 'parse')
+    mismatches = []
+    for phase in phases:
+        phase_start_time = time.perf_counter()
+        if profile_dir is None:
+            result = getattr(module, phase)(argument)
+        else:
+            result, _, _ = profile_phase(
+                getattr(module, phase),
+                argument,
+                Path(profile_dir) / f'day{day:02d}-{phase}.prof',
+            )
+        timings[phase] = time.perf_counter() - phase_start_time
+        if phase == 'parse':
+            argument = result
+            continue
+        answers[phase] = result
+        if answer_cache is None:
+            continue
+        if phase not in expected_answers:
+            answer_cache.put(day, phase, *cache_key, result)
+        elif not answer_cache.verify(
+            day, phase, *cache_key, result, expected_answers[phase]
+        ):
+            mismatches.append({
+                'part': phase,
+                'cached': expected_answers[phase],
+                'computed': result,
+            })
+    wall = time.perf_counter() - start_time
+    day_result = {
+        'day': day,
+        'module': module.__name__,
+        'pid': os.getpid(),
+        'answers': dict(sorted(answers.items())),
+        'timings': timings,
+        'wall': wall + sum(
+            prefetched['timings'].values() if prefetched else ()
+        ),
+        'interval': (started, time.time()),
+    }
+    if prefetched is not None:
+        day_result['prefetch_interval'] = prefetched['interval']
+    if answer_cache is not None:
+        day_result['answer_cache'] = answer_cache.stats
+    if mismatches:
+        day_result['answer_mismatches'] = mismatches
+    if hot_loop_stats is not None:
+        day_result['hot_loop_stats'] = dict(hot_loop_stats)
+    return day_result
+
+def merge_intervals(intervals):
+    """ Return sorted, disjoint intervals covering the given intervals """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+def overlap_seconds(intervals, other_intervals):
+    """ Return total time covered by both sets of intervals """
+    overlap = 0.0
+    for start, end in merge_intervals(intervals):
+        for other_start, other_end in merge_intervals(other_intervals):
+            overlap += max(min(end, other_end) - max(start, other_start), 0)
+    return overlap
+
+def summarize_overlap(results):
+    """ Return time spent prefetching inputs, and the part of it during
+    which worker processes were computing """
+    prefetch_intervals = [
+        result['prefetch_interval']
+        for result in results if 'prefetch_interval' in result
+    ]
+    compute_intervals = [
+        result['interval'] for result in results if 'interval' in result
+    ]
+    prefetch_seconds = sum(
+        end - start for start, end in merge_intervals(prefetch_intervals)
+    )
+    overlapped_seconds = overlap_seconds(
+        prefetch_intervals, compute_intervals
+    )
+    return {
+        'prefetch_seconds': prefetch_seconds,
+        'overlapped_seconds': overlapped_seconds,
+        'overlap_fraction': (
+            overlapped_seconds / prefetch_seconds if prefetch_seconds else 0.0
+        ),
+    }
+
+def summarize_answer_cache(results):
+    """ Return answer cache statistics summed over days, or None if the
+    answer cache was disabled """
+    day_stats = [
+        result['answer_cache']
+        for result in results if 'answer_cache' in result
+    ]
+    if not day_stats:
+        return None
+    return {
+        key: sum(stats[key] for stats in day_stats) for key in day_stats[0]
+    }
+
+async def run_schedule(schedule, workers=None, prefetch_threads=4, **kwargs):
+    """ Return results (or exceptions) of solving days in a process pool,
+    each submitted once its input has been prefetched in a thread pool
+    (or immediately, without prefetching, if prefetch_threads is 0) """
+    loop = asyncio.get_running_loop()
+    # Start workers from a fork server rather than forking this process,
+    # whose prefetching threads may hold locks (e.g., import locks).
+    context = None
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+    with ProcessPoolExecutor(workers, context) as executor, \
+            ThreadPoolExecutor(max_workers=prefetch_threads or 1) as threads:
+
+        async def run_day(day):
+            prefetched = None
+            if prefetch_threads:
+                prefetched = await loop.run_in_executor(
+                    threads, prefetch_input, day
+                )
+            return await asyncio.wrap_future(executor.submit(
+                solve_day, day, prefetched=prefetched, **kwargs
+            ))
+
+        return await asyncio.gather(
+            *(run_day(day) for day in schedule), return_exceptions=True
+        )
+
+def run_days(
+    days, workers=None, recorded_timings=None, profile_dir=None,
+    prefetch_threads=4, verify=False,
+):
+    """ Run days across a process pool and return aggregated report """
+    if recorded_timings is None:
+        recorded_timings = load_recorded_timings()
+    schedule = schedule_days(days, recorded_timings)
+    start_time = time.perf_counter()
+    outcomes = asyncio.run(run_schedule(
+        schedule, workers, prefetch_threads,
+        profile_dir=profile_dir, verify=verify,
+    ))
+    wall = time.perf_counter() - start_time
+    results = []
+    for day, outcome in zip(schedule, outcomes):
+        if isinstance(outcome, Exception):
+            outcome = {
+                'day': day,
+                'error': f'{type(outcome).__name__}: {outcome}',
+            }
+        results.append(outcome)
+    results.sort(key=lambda result: result['day'])
+    return {
+        'metadata': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'workers': workers or os.cpu_count(),
+            'prefetch_threads': prefetch_threads,
+            'schedule': schedule,
+            'wall': wall,
+            'serial_wall': sum(result.get('wall', 0) for result in results),
+            'prefetch': summarize_overlap(results),
+            'answer_cache': summarize_answer_cache(results),
+        },
+        'results': results,
+    }
+
+def format_report(report):
+    """ Return human-readable table of answers and wall times for report """
+    lines = [f'{"day":>3}  {"wall (s)":>9}  {"part1":<24} {"part2"}']
+    for result in report['results']:
+        if 'error' in result:
+            lines.append(f'{result["day"]:>3}  {"-":>9}  {result["error"]}')
+            continue
+        answers = result['answers']
+        lines.append(
+            f'{result["day"]:>3}  {result["wall"]:>9.3f}  '
+            f'{str(answers["part1"]):<24} {answers["part2"]}'
+        )
+    metadata = report['metadata']
+    lines.append(
+        f'\nTotal wall time with {metadata["workers"]} workers: '
+        f'{metadata["wall"]:.3f}s (sum of per-day wall times: '
+        f'{metadata["serial_wall"]:.3f}s)'
+    )
+    prefetch = metadata['prefetch']
+    if metadata['prefetch_threads']:
+        lines.append(
+            f'Input prefetching with {metadata["prefetch_threads"]} threads: '
+            f'{prefetch["prefetch_seconds"]:.3f}s, of which '
+            f'{prefetch["overlapped_seconds"]:.3f}s '
+            f'({prefetch["overlap_fraction"]:.0%}) overlapped computation'
+        )
+    if (answer_cache := metadata['answer_cache']) is not None:
+        lines.append(
+            f'Answer cache: {answer_cache["hits"]} hits, '
+            f'{answer_cache["misses"]} misses, {answer_cache["stores"]} '
+            f'stores, {answer_cache["evictions"]} evictions, '
+            f'{answer_cache["verified"]} verified, '
+            f'{answer_cache["mismatches"]} mismatches'
+        )
+    for result in report['results']:
+        for mismatch in result.get('answer_mismatches', []):
+            lines.append(
+                f'Answer mismatch for Day {result["day"]} {mismatch["part"]}: '
+                f'cached {mismatch["cached"]!r}, '
+                f'computed {mismatch["computed"]!r}'
+            )
+    return '\n'.join(lines)
+
+def build_argument_parser():
+    """ Return command-line argument parser for parallel runner """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--days', nargs='*', default=None,
+        help='days to run, e.g. 1 2 5-9 (default: all days)'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=None,
+        help='number of worker processes (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--timings', default=str(TIMINGS_PATH),
+        help='JSON file of locally recorded per-day wall times, overriding '
+        'the checked-in seed timings used for scheduling '
+        '(default: harness/day_timings.local.json)'
+    )
+    parser.add_argument(
+        '--record', action='store_true',
+        help='write per-day wall times from this run to the --timings file'
+    )
+    parser.add_argument(
+        '--prefetch-threads', type=int, default=4,
+        help='number of threads reading and parsing inputs ahead of the '
+        'worker processes, or 0 to parse in the workers (default: 4)'
+    )
+    parser.add_argument(
+        '--parse-cache', default=None,
+        help='directory for caching parsed inputs across runs (default: off)'
+    )
+    parser.add_argument(
+        '--answer-cache', default=None, metavar='DIR',
+        help='directory for storing answers across runs, keyed by input and '
+        'solver source, and reused instead of recomputing them '
+        '(default: off)'
+    )
+    parser.add_argument(
+        '--answer-cache-max-mib', type=float, default=None,
+        help='size cap of the answer cache in MiB, beyond which the least '
+        'recently used answers are evicted (default: 16)'
+    )
+    parser.add_argument(
+        '--verify', action='store_true',
+        help='recompute answers found in the answer cache and exit non-zero '
+        'if any differ'
+    )
+    parser.add_argument(
+        '--profile', default=None, metavar='DIR',
+        help='dump cProfile stats per day and phase to DIR (inputs are then '
+        'parsed in the workers, and timings include profiling overhead and '
+        'are not recorded even with --record)'
+    )
+    parser.add_argument(
+        '--output', default=None,
+        help='path of JSON report to write (default: print table only)'
+    )
+    return parser
+
+def main(argv=None):
+    """ Run selected days in parallel from the command line """
+    args = build_argument_parser().parse_args(argv)
+    if args.parse_cache:
+        os.environ[CACHE_DIR_ENV] = args.parse_cache
+    if args.answer_cache:
+        os.environ[ANSWER_CACHE_DIR_ENV] = args.answer_cache
+    if args.answer_cache_max_mib is not None:
+        os.environ[ANSWER_CACHE_MAX_BYTES_ENV] = str(
+            int(args.answer_cache_max_mib * 2**20)
+        )
+    recorded_timings = load_recorded_timings(args.timings)
+    if args.profile:
+        Path(args.profile).mkdir(parents=True, exist_ok=True)
+    report = run_days(
+        parse_days(args.days),
+        args.workers,
+        recorded_timings,
+        args.profile,
+        0 if args.profile else args.prefetch_threads,
+        args.verify,
+    )
+    print(format_report(report))
+    if args.record and not args.profile:
+        local_timings = load_recorded_timings(
+            args.timings, seed_timings_path=None
+        )
+        # Skip days with answers from the answer cache, which took no time.
+        local_timings.update(
+            (result['day'], result['wall'])
+            for result in report['results']
+            if 'wall' in result and 'part2' in result['timings']
+        )
+        save_recorded_timings(local_timings, args.timings)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2, default=str)
+    if any('answer_mismatches' in result for result in report['results']):
+        sys.exit(1)
+    return report
+
+
+if __name__ == '__main__':
+    main()
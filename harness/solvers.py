@@ -0,0 +1,56 @@
+""" Discovery and loading of the dayNN solution modules """
+
+# import modules used below.
+from importlib import import_module
+from pathlib import Path
+import re
+import sys
+
+
+# Locate solution modules and their data files relative to the repo root.
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_ROOT / 'data'
+PHASES = ('parse', 'part1', 'part2')
+day_module_regex = re.compile(r'^day([0-9]{2})_\w+$')
+
+
+def available_days():
+    """ Return mapping of day number to solution module name """
+    days = {}
+    for path in sorted(REPO_ROOT.glob('day[0-9][0-9]_*.py')):
+        if day_module_match := day_module_regex.fullmatch(path.stem):
+            days[int(day_module_match.group(1))] = path.stem
+    return days
+
+def module_name(day):
+    """ Return name of solution module for specified day """
+    try:
+        return available_days()[int(day)]
+    except KeyError:
+        raise ValueError(f'No solution module found for day {day}') from None
+
+def load_day(day):
+    """ Import and return solution module for specified day """
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    return import_module(module_name(day))
+
+def data_file(day):
+    """ Return path of provided data file for specified day """
+    return DATA_DIR / f'{module_name(day)}-data.txt'
+
+def parse_days(day_specs):
+    """ Expand day numbers and ranges such as '1-5' into sorted day list """
+    if not day_specs:
+        return sorted(available_days())
+    days = set()
+    for day_spec in day_specs:
+        for component in str(day_spec).split(','):
+            if '-' in component:
+                first_day, last_day = component.split('-')
+                days.update(range(int(first_day), int(last_day) + 1))
+            elif component:
+                days.add(int(component))
+    for day in days:
+        module_name(day)
+    return sorted(days)